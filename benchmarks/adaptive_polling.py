@@ -0,0 +1,201 @@
+"""적응형 크롤링 시뮬레이션.
+
+새 상품 도착 기록(POLL_HISTORY=true로 쌓은 data/deal_history.jsonl)을 재생하여
+고정 주기 크롤링과 적응형 크롤링의 요청 수와 발견 지연 시간을 비교합니다.
+기록 파일이 없으면 도착률이 다른 합성 키워드로 시뮬레이션합니다.
+
+    python benchmarks/adaptive_polling.py --tick 120 --baseline 1800
+    python benchmarks/adaptive_polling.py --history data/deal_history.jsonl
+"""
+
+import argparse
+import bisect
+import json
+import os
+import random
+import statistics
+import sys
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+# 프로젝트 루트를 import 경로에 추가 (python benchmarks/adaptive_polling.py 로 실행)
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+
+from models.keyword_data import KeywordData  # noqa: E402
+from modules.adaptive_polling import AdaptivePolling  # noqa: E402
+
+# 합성 키워드: 이름 -> 시간당 평균 새 상품 수
+SYNTHETIC_RATES = {
+    "hot": 6.0,
+    "busy": 1.0,
+    "warm": 0.2,
+    "quiet": 1 / 24,
+    "rare": 1 / (24 * 14),
+    "dormant": 0.0,
+}
+
+History = Dict[Tuple[str, str], List[float]]
+
+
+def load_history(
+    path: str,
+) -> Tuple[History, float, float]:
+    history: History = defaultdict(list)
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                record = json.loads(line)
+                history[(record["keyword"], record["site"])].append(record["time"])
+    times = [time for arrivals in history.values() for time in arrivals]
+    return (
+        {key: sorted(arrivals) for key, arrivals in history.items()},
+        min(times),
+        max(times),
+    )
+
+
+def synthetic_history(
+    days: float,
+    seed: int,
+) -> Tuple[History, float, float]:
+    rng = random.Random(seed)
+    duration = days * 86400
+    history: History = {}
+    for name, rate in SYNTHETIC_RATES.items():
+        arrivals, time = [], 0.0
+        while rate > 0:
+            time += rng.expovariate(rate / 3600)
+            if time >= duration:
+                break
+            arrivals.append(time)
+        history[(name, "Algumon")] = arrivals
+    return history, 0.0, duration
+
+
+def simulate(
+    history: History,
+    start: float,
+    end: float,
+    tick: float,
+    polling: AdaptivePolling,
+) -> Dict[Tuple[str, str], dict]:
+    """tick마다 스케줄러가 깨어나 크롤링 시각이 된 키워드만 크롤링한다고 가정합니다."""
+    results = {}
+    for key, arrivals in history.items():
+        state = KeywordData(current_id="1")
+        requests, latencies = 0, []
+        last = start
+        now = start
+        while now <= end:
+            if polling.is_due(state, now):
+                requests += 1
+                found = arrivals[
+                    bisect.bisect_right(arrivals, last) : bisect.bisect_right(
+                        arrivals, now
+                    )
+                ]
+                latencies += [now - arrival for arrival in found]
+                if polling.enabled:
+                    polling.observe(state, state, len(found), now)
+                last = now
+            now += tick
+        results[key] = {"requests": requests, "latencies": latencies}
+    return results
+
+
+def summarize(
+    results: Dict[Tuple[str, str], dict],
+) -> Tuple[int, float, float, float]:
+    requests = sum(result["requests"] for result in results.values())
+    latencies = sorted(
+        latency for result in results.values() for latency in result["latencies"]
+    )
+    if not latencies:
+        return requests, 0.0, 0.0, 0.0
+    p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+    return requests, statistics.mean(latencies), p95, latencies[-1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="적응형 크롤링 시뮬레이션")
+    parser.add_argument("--history", help="상품 도착 기록 파일 (JSON Lines)")
+    parser.add_argument("--days", type=float, default=14, help="합성 기록 기간(일)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument(
+        "--tick", type=float, default=120, help="스케줄러 실행 간격(초)"
+    )
+    parser.add_argument(
+        "--baseline", type=float, default=1800, help="비교할 고정 크롤링 주기(초)"
+    )
+    parser.add_argument("--min-interval", type=float, default=900)
+    parser.add_argument("--max-interval", type=float, default=1500)
+    parser.add_argument(
+        "--idle-max-interval",
+        type=float,
+        default=7200,
+        help="새 상품이 드문 키워드의 최대 간격(초)",
+    )
+    parser.add_argument(
+        "--idle-days",
+        type=float,
+        default=7,
+        help="새 상품이 이 일수에 1건보다 드물면 드문 키워드로 봄",
+    )
+    parser.add_argument("--speedup", type=float, default=2)
+    parser.add_argument("--backoff", type=float, default=1.5)
+    parser.add_argument(
+        "--rate-window", type=float, default=172800, help="도착률 추정 시간 창(초)"
+    )
+    args = parser.parse_args()
+
+    if args.history:
+        history, start, end = load_history(args.history)
+    else:
+        history, start, end = synthetic_history(args.days, args.seed)
+
+    fixed = AdaptivePolling(enabled=False)
+    adaptive = AdaptivePolling(
+        enabled=True,
+        min_interval=args.min_interval,
+        max_interval=args.max_interval,
+        idle_max_interval=args.idle_max_interval,
+        idle_days=args.idle_days,
+        speedup=args.speedup,
+        backoff=args.backoff,
+        rate_window=args.rate_window,
+    )
+    runs = {
+        f"고정 {args.baseline:g}초": simulate(
+            history, start, end, args.baseline, fixed
+        ),
+        f"고정 {args.tick:g}초": simulate(history, start, end, args.tick, fixed),
+        "적응형": simulate(history, start, end, args.tick, adaptive),
+    }
+
+    arrivals = sum(len(times) for times in history.values())
+    print(
+        f"키워드 {len(history)}개, 새 상품 {arrivals}건, 기간 {(end - start) / 86400:.1f}일"
+    )
+    print(
+        f"{'방식':<12}{'요청 수':>10}{'평균 지연(분)':>16}{'p95 지연(분)':>16}{'최대 지연(분)':>16}"
+    )
+    for name, results in runs.items():
+        requests, mean, p95, worst = summarize(results)
+        print(
+            f"{name:<12}{requests:>10}{mean / 60:>16.1f}{p95 / 60:>16.1f}{worst / 60:>16.1f}"
+        )
+
+    print("\n키워드별 (고정 기준 대비 적응형)")
+    baseline = runs[f"고정 {args.baseline:g}초"]
+    for key in history:
+        base_requests, base_mean, _, _ = summarize({key: baseline[key]})
+        requests, mean, _, _ = summarize({key: runs["적응형"][key]})
+        print(
+            f"{key[0]:<10} 요청 {base_requests:>5} -> {requests:>5}, "
+            f"평균 지연 {base_mean / 60:>6.1f}분 -> {mean / 60:>6.1f}분"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,334 @@
+"""크롤링 처리량 벤치마크.
+
+로컬 모의 사이트(benchmarks/mock_site.py)를 띄우고, 합성 키워드 10/100/1000개로
+App.run을 별도 프로세스에서 끝까지 실행하여 사이클 시간, 요청 수, CPU 시간, 최대 메모리를 측정합니다.
+크기마다 최초(initial), 변경 없음(steady), 새 글 추가(new) 사이클을 차례로 실행하며,
+지연/차단은 시드로 고정되어 커밋 간 비교에 사용할 수 있습니다.
+
+    python benchmarks/crawl_benchmark.py
+    python benchmarks/crawl_benchmark.py --sizes 10 100 --latency 0.02 --block-rate 0.05
+    python benchmarks/crawl_benchmark.py --output before.json
+    python benchmarks/crawl_benchmark.py --compare before.json
+    python benchmarks/crawl_benchmark.py --stream --padding 64
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from typing import Dict, List
+
+# 프로젝트 루트를 import 경로에 추가 (python benchmarks/crawl_benchmark.py 로 실행)
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+
+from benchmarks.mock_site import MockSite  # noqa: E402
+
+# 비교할 측정값 (이름: 표시 형식)
+COLUMNS = {
+    "wall": "{:8.2f}s",
+    "cpu": "{:8.2f}s",
+    "rss_mb": "{:7.1f}MB",
+    "requests": "{:7.0f}",
+    "proxied": "{:7.0f}",
+    "blocked": "{:7.0f}",
+    "parse": "{:7.2f}s",
+    "kb": "{:7.0f}",
+    "first": "{:6.3f}s",
+}
+
+
+def scenario(
+    index: int,
+) -> str:
+    if index == 0:
+        return "initial"
+    return "steady" if index % 2 else "new"
+
+
+def mock_request(
+    mock_url: str,
+    path: str,
+) -> dict:
+    with urllib.request.urlopen(f"{mock_url}{path}", timeout=10) as response:
+        return json.load(response)
+
+
+def metric_sum(
+    summary: dict,
+    name: str,
+) -> float:
+    """사이클 요약에서 같은 이름 지표(라벨 무관)의 시간 합계."""
+    return sum(
+        timing["sum"]
+        for series, timing in summary.get("timings", {}).items()
+        if series.split("{")[0] == name
+    )
+
+
+def metric_total(
+    summary: dict,
+    name: str,
+) -> float:
+    """사이클 요약에서 같은 이름 카운터(라벨 무관)의 합계."""
+    return sum(
+        value
+        for series, value in summary.get("counters", {}).items()
+        if series.split("{")[0] == name
+    )
+
+
+def metric_avg(
+    summary: dict,
+    name: str,
+) -> float:
+    """사이클 요약에서 같은 이름 지표(라벨 무관)의 평균."""
+    timings = [
+        timing
+        for series, timing in summary.get("timings", {}).items()
+        if series.split("{")[0] == name
+    ]
+    count = sum(timing["count"] for timing in timings)
+    return sum(timing["sum"] for timing in timings) / count if count else 0.0
+
+
+def run_child(
+    cycles: int,
+):
+    """작업 폴더(cwd)의 data/data.json으로 사이클을 실행하고 측정값을 JSON으로 출력합니다."""
+    import resource
+
+    from modules.app import App
+    from modules.metrics import Metrics
+    from modules.notification_queue import NotificationQueue
+
+    mock_url = os.environ["BENCH_MOCK_URL"]
+    app = App()
+    results = []
+    for index in range(cycles):
+        name = scenario(index)
+        if name == "new":
+            mock_request(mock_url, "/_advance")
+        before = mock_request(mock_url, "/_stats")
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        start = time.perf_counter()
+        app.run()
+        wall = time.perf_counter() - start
+        after_usage = resource.getrusage(resource.RUSAGE_SELF)
+        after = mock_request(mock_url, "/_stats")
+        summary = Metrics().last_summary or {}
+        results.append(
+            {
+                "scenario": name,
+                "wall": wall,
+                "cpu": (after_usage.ru_utime + after_usage.ru_stime)
+                - (usage.ru_utime + usage.ru_stime),
+                # 리눅스의 ru_maxrss는 KB 단위
+                "rss_mb": after_usage.ru_maxrss / 1024,
+                "requests": after.get("requests", 0) - before.get("requests", 0),
+                "proxied": after.get("proxied", 0) - before.get("proxied", 0),
+                "blocked": sum(
+                    after.get(key, 0) - before.get(key, 0)
+                    for key in after
+                    if key.startswith("blocked_")
+                ),
+                "parse": metric_sum(summary, "hotdeal_parse_seconds"),
+                # 받은 본문 크기 (KB)
+                "kb": metric_total(summary, "hotdeal_response_bytes_total") / 1024,
+                # 요청 시작부터 첫 상품까지 걸린 평균 시간
+                "first": metric_avg(summary, "hotdeal_first_item_seconds"),
+            }
+        )
+    NotificationQueue().shutdown()
+    print(json.dumps(results))
+
+
+def child_env(
+    args: argparse.Namespace,
+    site: MockSite,
+) -> Dict[str, str]:
+    env = {
+        key: value
+        for key, value in os.environ.items()
+        if not key.startswith(("SHARD_", "METRICS_PORT"))
+    }
+    env.update(
+        {
+            "BENCH_MOCK_URL": site.base_url,
+            "ALGUMON_BASE_URL": site.base_url,
+            "FMKOREA_BASE_URL": site.base_url,
+            "FMKOREA_ENABLED": "true",
+            "CRAWL_MODE": args.mode,
+            "NOTIFY_EMAIL": "false",
+            "NOTIFY_WEBHOOK_URL": f"{site.base_url}/hook",
+            "PROXY_SOURCE": "static",
+            "PROXY_LIST": ",".join(site.proxy_urls),
+            "PROXY_PROBE_URL": f"{site.base_url}/robots.txt",
+            "RATE_LIMIT": "true" if args.rate_limit else "false",
+            "ADAPTIVE_POLLING": "false",
+            "STREAM_FETCH": "true" if args.stream else "false",
+            "PYTHONPATH": ROOT,
+        }
+    )
+    return env
+
+
+def run_size(
+    args: argparse.Namespace,
+    site: MockSite,
+    size: int,
+) -> List[dict]:
+    """키워드 size개로 한 번 실행합니다 (상태 파일은 매번 새 임시 폴더에서 시작)."""
+    site.reset()
+    with tempfile.TemporaryDirectory(prefix="hotdeal-bench-") as workdir:
+        os.makedirs(os.path.join(workdir, "data"))
+        with open(os.path.join(workdir, "data", "data.json"), "w") as f:
+            json.dump({"keyword": [f"bench{i:04d}" for i in range(size)]}, f)
+        process = subprocess.run(
+            [
+                sys.executable,
+                os.path.abspath(__file__),
+                "--child",
+                "--cycles",
+                str(args.cycles),
+            ],
+            cwd=workdir,
+            env=child_env(args, site),
+            stdout=subprocess.PIPE,
+            stderr=None if args.verbose else subprocess.DEVNULL,
+            text=True,
+        )
+    if process.returncode != 0:
+        raise RuntimeError(f"키워드 {size}개 실행 실패 (exit {process.returncode})")
+    results = json.loads(process.stdout.strip().splitlines()[-1])
+    return [{"size": size, **result} for result in results]
+
+
+def median_results(
+    runs: List[List[dict]],
+) -> List[dict]:
+    """반복 실행 결과를 (크기, 사이클)별 중앙값으로 합칩니다."""
+    merged = []
+    for rows in zip(*runs):
+        row = dict(rows[0])
+        for column in COLUMNS:
+            row[column] = statistics.median(r[column] for r in rows)
+        merged.append(row)
+    return merged
+
+
+def print_results(
+    results: List[dict],
+    baseline: List[dict] = None,
+):
+    previous = {(r["size"], r["scenario"], i): r for i, r in enumerate(baseline or [])}
+    print(
+        f"{'size':>6} {'cycle':>8} " + " ".join(f"{column:>10}" for column in COLUMNS)
+    )
+    for i, row in enumerate(results):
+        cells = []
+        for column, fmt in COLUMNS.items():
+            cell = fmt.format(row[column])
+            old = previous.get((row["size"], row["scenario"], i))
+            # 이전 결과 파일에 없는 측정값은 비교하지 않음
+            if old and column in ("wall", "cpu", "rss_mb", "kb") and old.get(column):
+                cell += f" ({(row[column] / old[column] - 1) * 100:+.0f}%)"
+            cells.append(f"{cell:>10}")
+        print(f"{row['size']:>6} {row['scenario']:>8} " + " ".join(cells))
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+        ).stdout.strip()
+    except OSError:
+        return ""
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="크롤링 처리량 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument(
+        "--cycles", type=int, default=3, help="크기마다 실행할 사이클 수"
+    )
+    parser.add_argument("--repeat", type=int, default=1, help="반복 횟수 (중앙값 사용)")
+    parser.add_argument("--mode", default="async", choices=["async", "sync"])
+    parser.add_argument("--latency", type=float, default=0.02, help="응답 지연(초)")
+    parser.add_argument(
+        "--jitter", type=float, default=0.01, help="추가 무작위 지연(초)"
+    )
+    parser.add_argument("--block-rate", type=float, default=0.0, help="403/430 비율")
+    parser.add_argument("--proxies", type=int, default=3, help="프록시 서버 수")
+    parser.add_argument("--proxy-latency", type=float, default=0.05)
+    parser.add_argument(
+        "--new-items", type=int, default=3, help="new 사이클의 새 글 수"
+    )
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument(
+        "--rate-limit", action="store_true", help="호스트별 요청 속도 제한 사용"
+    )
+    parser.add_argument(
+        "--stream", action="store_true", help="스트리밍 수신/파싱 사용 (STREAM_FETCH)"
+    )
+    parser.add_argument(
+        "--padding", type=int, default=0, help="모의 페이지 헤더/푸터에 덧붙일 크기(KB)"
+    )
+    parser.add_argument("--output", help="결과를 저장할 JSON 파일")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON 파일")
+    parser.add_argument("--verbose", action="store_true", help="크롤러 로그 출력")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.cycles)
+        sys.exit(0)
+
+    site = MockSite(
+        latency=args.latency,
+        jitter=args.jitter,
+        block_rate=args.block_rate,
+        proxy_latency=args.proxy_latency,
+        new_items=args.new_items,
+        seed=args.seed,
+        padding=args.padding,
+    )
+    site.start(proxies=args.proxies)
+    try:
+        runs = [
+            [row for size in args.sizes for row in run_size(args, site, size)]
+            for _ in range(args.repeat)
+        ]
+    finally:
+        site.stop()
+    results = median_results(runs)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+    print_results(results, baseline)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "revision": git_revision(),
+                    "settings": {
+                        key: value
+                        for key, value in vars(args).items()
+                        if key not in ("output", "compare", "verbose", "child")
+                    },
+                    "results": results,
+                },
+                f,
+                indent=4,
+            )
@@ -0,0 +1,352 @@
+"""벤치마크용 로컬 모의 사이트.
+
+fixtures/의 저장된 HTML로 알구몬 검색 결과와 FMKorea 핫딜 목록을 흉내 내는 HTTP 서버와,
+요청을 그대로 전달하는 프록시 서버를 띄웁니다. 응답 지연과 403/430 차단 비율을 설정할 수 있고,
+/_advance를 호출할 때마다 모든 목록의 맨 앞에 새 게시글이 추가됩니다.
+저장된 HTML은 상품 목록 위주로 줄여 둔 것이므로, --padding으로 실제 페이지처럼
+헤더/푸터에 스크립트를 덧붙여 응답 크기를 늘릴 수 있습니다.
+
+    python benchmarks/mock_site.py --port 8800 --latency 0.05 --block-rate 0.05
+
+크롤러는 ALGUMON_BASE_URL/FMKOREA_BASE_URL을 이 서버 주소로 설정하면 됩니다.
+"""
+
+import argparse
+import http.client
+import json
+import os
+import random
+import re
+import sys
+import threading
+import time
+import zlib
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+from urllib.parse import parse_qs, unquote, urlparse
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURES = os.path.join(ROOT, "fixtures")
+
+
+class FixturePage:
+    """저장된 HTML 페이지. 게시글 ID를 바꿔 끼워 다른 페이지/새 글처럼 보이게 합니다."""
+
+    def __init__(
+        self,
+        path: str,
+        id_pattern: str,
+        padding: int = 0,
+    ):
+        with open(path, "r", encoding="utf-8") as f:
+            self.html = f.read()
+        if padding:
+            # 상품 목록 앞(</head>)과 뒤(</body>)에 각각 padding KB의 스크립트
+            filler = "<script>var padding = '%s';</script>\n" % ("x" * padding * 1024)
+            self.html = self.html.replace("</head>", filler + "</head>", 1)
+            self.html = self.html.replace("</body>", filler + "</body>", 1)
+        # 처음 등장한 순서대로 (위에 있는 글이 최신 글)
+        self.ids: List[str] = list(dict.fromkeys(re.findall(id_pattern, self.html)))
+        self.index = {post_id: i for i, post_id in enumerate(self.ids)}
+        self.pattern = re.compile(r"(?<!\d)(%s)(?!\d)" % "|".join(self.ids))
+
+    def render(
+        self,
+        top_id: int,
+    ) -> str:
+        """맨 위 글의 ID가 top_id이고, 아래로 갈수록 1씩 작아지는 페이지."""
+        return self.pattern.sub(
+            lambda match: str(top_id - self.index[match.group(1)]), self.html
+        )
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 256
+
+    def handle_error(self, request, client_address):
+        # 스트리밍 모드의 크롤러는 필요한 만큼 받으면 연결을 끊으므로 이 경우는 무시
+        if isinstance(sys.exc_info()[1], ConnectionError):
+            return
+        super().handle_error(request, client_address)
+
+
+class MockSite:
+    """모의 사이트와 프록시 서버 묶음.
+
+    - GET /search/{keyword}?page=N: 알구몬 검색 결과
+    - GET /index.php?mid=hotdeal&page=N: FMKorea 핫딜 목록
+    - GET /robots.txt: 프록시 검증용
+    - POST /hook: 웹훅 알림 수신
+    - GET /_stats, /_advance, /_reset: 요청 수 확인, 새 글 추가, 초기화
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        block_rate: float = 0.0,
+        block_statuses: tuple = (403, 430),
+        proxy_latency: float = 0.0,
+        new_items: int = 3,
+        seed: int = 1,
+        padding: int = 0,
+    ):
+        self.latency = latency
+        self.jitter = jitter
+        self.block_rate = block_rate
+        self.block_statuses = block_statuses
+        self.proxy_latency = proxy_latency
+        self.new_items = new_items
+        self.seed = seed
+        self.algumon = FixturePage(
+            os.path.join(FIXTURES, "algumon_search.html"),
+            r'data-post-id="(\d+)"',
+            padding,
+        )
+        self.fmkorea = FixturePage(
+            os.path.join(FIXTURES, "fmkorea_hotdeal.html"),
+            r'href="/(\d{6,})"',
+            padding,
+        )
+        self.servers: List[ThreadingHTTPServer] = []
+        self.base_url: Optional[str] = None
+        self.proxy_urls: List[str] = []
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.generation = 0
+            self.stats = Counter()
+            self._path_counts: Dict[str, int] = Counter()
+
+    def advance(self):
+        """모든 목록의 맨 앞에 new_items개의 새 글을 추가합니다."""
+        with self._lock:
+            self.generation += 1
+
+    def _count(
+        self,
+        path: str,
+        proxied: bool,
+    ) -> int:
+        with self._lock:
+            self.stats["requests"] += 1
+            if proxied:
+                self.stats["proxied"] += 1
+            self._path_counts[path] += 1
+            return self._path_counts[path]
+
+    def _delay(
+        self,
+        path: str,
+        attempt: int,
+    ) -> float:
+        # 같은 설정이면 같은 요청에 항상 같은 지연 (실행마다 결과가 흔들리지 않도록)
+        rng = random.Random(zlib.crc32(f"{self.seed}:{path}:{attempt}".encode()))
+        return self.latency + rng.uniform(0, self.jitter)
+
+    def _blocked(
+        self,
+        path: str,
+        attempt: int,
+    ) -> Optional[int]:
+        if not self.block_rate:
+            return None
+        rng = random.Random(zlib.crc32(f"block:{self.seed}:{path}:{attempt}".encode()))
+        if rng.random() >= self.block_rate:
+            return None
+        return self.block_statuses[attempt % len(self.block_statuses)]
+
+    def page(
+        self,
+        path: str,
+    ) -> Optional[str]:
+        """요청 경로에 해당하는 HTML (없는 경로면 None)."""
+        url = urlparse(path)
+        query = parse_qs(url.query)
+        page = int(query.get("page", ["1"])[0] or 1)
+        with self._lock:
+            generation = self.generation
+        if url.path.startswith("/search/"):
+            keyword = unquote(url.path[len("/search/") :])
+            base = 1_000_000 + zlib.crc32(keyword.encode("utf-8")) % 9000 * 1000
+            fixture = self.algumon
+        elif url.path == "/index.php" and query.get("mid") == ["hotdeal"]:
+            base = 7_600_000_000
+            fixture = self.fmkorea
+        else:
+            return None
+        top_id = base + generation * self.new_items - (page - 1) * len(fixture.ids)
+        return fixture.render(top_id)
+
+    def _origin_handler(self):
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _send(
+                self,
+                status: int,
+                body: bytes,
+                content_type: str = "text/html; charset=utf-8",
+            ):
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                if self.path.startswith("/_"):
+                    return self._control()
+                proxied = self.headers.get("X-Mock-Proxy") == "1"
+                attempt = site._count(self.path, proxied)
+                time.sleep(site._delay(self.path, attempt))
+                if self.path == "/robots.txt":
+                    return self._send(200, b"User-agent: *\n", "text/plain")
+                status = None if proxied else site._blocked(self.path, attempt)
+                if status:
+                    with site._lock:
+                        site.stats[f"blocked_{status}"] += 1
+                    return self._send(status, b"blocked")
+                html = site.page(self.path)
+                if html is None:
+                    return self._send(404, b"not found")
+                self._send(200, html.encode("utf-8"))
+
+            def do_POST(self):
+                self.rfile.read(int(self.headers.get("Content-Length") or 0))
+                with site._lock:
+                    site.stats["hooks"] += 1
+                self._send(200, b"{}", "application/json")
+
+            def _control(self):
+                path = urlparse(self.path).path
+                if path == "/_advance":
+                    site.advance()
+                elif path == "/_reset":
+                    site.reset()
+                elif path != "/_stats":
+                    return self._send(404, b"not found")
+                with site._lock:
+                    body = json.dumps(
+                        {"generation": site.generation, **site.stats}
+                    ).encode("utf-8")
+                self._send(200, body, "application/json")
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def _proxy_handler(self):
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                if not url.hostname:
+                    self.send_error(400)
+                    return
+                time.sleep(site.proxy_latency)
+                headers = {
+                    key: value
+                    for key, value in self.headers.items()
+                    if key.lower() not in ("proxy-connection", "connection", "host")
+                }
+                headers["X-Mock-Proxy"] = "1"
+                connection = http.client.HTTPConnection(
+                    url.hostname, url.port or 80, timeout=30
+                )
+                try:
+                    path = url.path + (f"?{url.query}" if url.query else "")
+                    connection.request("GET", path, headers=headers)
+                    response = connection.getresponse()
+                    body = response.read()
+                finally:
+                    connection.close()
+                self.send_response(response.status)
+                self.send_header(
+                    "Content-Type", response.getheader("Content-Type", "text/html")
+                )
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def _serve(
+        self,
+        handler,
+        host: str,
+        port: int,
+    ) -> str:
+        server = _Server((host, port), handler)
+        threading.Thread(
+            target=server.serve_forever,
+            name=f"mock-{server.server_address[1]}",
+            daemon=True,
+        ).start()
+        self.servers.append(server)
+        return f"http://{host}:{server.server_address[1]}"
+
+    def start(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        proxies: int = 3,
+    ) -> str:
+        """서버를 띄우고 모의 사이트 주소를 반환합니다 (port=0이면 빈 포트 사용)."""
+        self.base_url = self._serve(self._origin_handler(), host, port)
+        self.proxy_urls = [
+            self._serve(self._proxy_handler(), host, 0) for _ in range(proxies)
+        ]
+        return self.base_url
+
+    def stop(self):
+        for server in self.servers:
+            server.shutdown()
+            server.server_close()
+        self.servers = []
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="벤치마크용 로컬 모의 사이트")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8800)
+    parser.add_argument("--latency", type=float, default=0.0, help="응답 지연(초)")
+    parser.add_argument(
+        "--jitter", type=float, default=0.0, help="추가 무작위 지연(초)"
+    )
+    parser.add_argument("--block-rate", type=float, default=0.0, help="403/430 비율")
+    parser.add_argument("--proxies", type=int, default=3, help="프록시 서버 수")
+    parser.add_argument("--proxy-latency", type=float, default=0.0)
+    parser.add_argument("--new-items", type=int, default=3)
+    parser.add_argument(
+        "--padding", type=int, default=0, help="헤더/푸터에 덧붙일 크기(KB)"
+    )
+    args = parser.parse_args()
+
+    site = MockSite(
+        latency=args.latency,
+        jitter=args.jitter,
+        block_rate=args.block_rate,
+        proxy_latency=args.proxy_latency,
+        new_items=args.new_items,
+        padding=args.padding,
+    )
+    print(f"모의 사이트: {site.start(args.host, args.port, args.proxies)}")
+    print(f"프록시: {','.join(site.proxy_urls)}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        site.stop()
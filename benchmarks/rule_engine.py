@@ -0,0 +1,221 @@
+"""알림 규칙 엔진 벤치마크.
+
+합성 키워드 규칙 수천 개와 상품 수천 개로 한 사이클의 매칭을 재현하여,
+컴파일된 RuleEngine과 규칙을 매번 그대로 해석하는 단순 구현의 시간을 비교하고
+두 구현의 결과가 같은지 확인합니다.
+
+    python benchmarks/rule_engine.py
+    python benchmarks/rule_engine.py --rules 5000 --items 5000 --repeat 5
+"""
+
+import argparse
+import ast
+import os
+import random
+import re
+import statistics
+import sys
+import time
+from typing import Dict, List, Tuple
+
+# 프로젝트 루트를 import 경로에 추가 (python benchmarks/rule_engine.py 로 실행)
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+
+from models.keyword_data import KeywordData  # noqa: E402
+from modules.keyword_matcher import KeywordMatcher  # noqa: E402
+from modules.rule_engine import RuleEngine  # noqa: E402
+
+SHOPS = ["네이버", "쿠팡", "11번가", "G마켓", "옥션", "SSG", "위메프", "티몬"]
+CATEGORIES = ["디지털", "PC제품", "가전제품", "의류", "식품", "생활용품", "게임"]
+SYLLABLES = "가나다라마바사아자차카타파하고노도로모보소오조초코토포호"
+
+
+def synthetic_words(
+    count: int,
+    rng: random.Random,
+) -> List[str]:
+    words = set()
+    while len(words) < count:
+        words.add(
+            "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 3)))
+            + rng.choice(["", "X", "Pro", "Max", str(rng.randint(1, 99))])
+        )
+    return sorted(words)
+
+
+def synthetic_items(
+    count: int,
+    words: List[str],
+    rng: random.Random,
+) -> List[KeywordData]:
+    items = []
+    for i in range(count):
+        title = " ".join(rng.choice(words) for _ in range(rng.randint(4, 8)))
+        price = f"{rng.randint(1, 2000) * 1000:,}원"
+        shop = rng.choice(SHOPS)
+        if i % 2:
+            meta = str(
+                {
+                    "shop": shop,
+                    "delivery": "무료",
+                    "time": "10:39",
+                    "category": rng.choice(CATEGORIES),
+                }
+            )
+        else:
+            meta = f"배송비3,000원|{shop}"
+        items.append(
+            KeywordData(
+                current_id=str(i),
+                current_title=title,
+                current_price=price,
+                current_meta_data=meta,
+            )
+        )
+    return items
+
+
+def synthetic_rules(
+    count: int,
+    words: List[str],
+    rng: random.Random,
+) -> Dict[str, dict]:
+    rules = {}
+    for keyword in rng.sample(words, count):
+        rule = {"exclude": rng.sample(words, rng.randint(1, 4))}
+        if rng.random() < 0.3:
+            rule["include"] = rng.sample(words, 1)
+        if rng.random() < 0.2:
+            rule["regex"] = f"{re.escape(keyword)}\\s*{rng.choice(words)[0]}"
+        if rng.random() < 0.5:
+            low = rng.randint(0, 500) * 1000
+            rule["min_price"] = low
+            rule["max_price"] = low + rng.randint(100, 1500) * 1000
+        if rng.random() < 0.3:
+            rule["shops"] = rng.sample(SHOPS, 3)
+        if rng.random() < 0.3:
+            rule["exclude_categories"] = rng.sample(CATEGORIES, 2)
+        rules[keyword] = rule
+    return rules
+
+
+def naive_accepts(
+    rule: dict,
+    item: KeywordData,
+) -> bool:
+    """규칙을 컴파일하지 않고 상품마다 그대로 해석하는 구현 (비교 기준)."""
+
+    def norm(text):
+        return re.sub(r"\s+", "", text or "").lower()
+
+    title = norm(item.current_title)
+    if any(norm(term) not in title for term in rule.get("include", [])):
+        return False
+    if any(norm(term) in title for term in rule.get("exclude", [])):
+        return False
+    if rule.get("regex") and not re.search(
+        rule["regex"], item.current_title, re.IGNORECASE
+    ):
+        return False
+    price = re.search(r"\d[\d,]*", item.current_price or "")
+    if price:
+        price = int(price.group().replace(",", ""))
+        if rule.get("min_price") is not None and price < rule["min_price"]:
+            return False
+        if rule.get("max_price") is not None and price > rule["max_price"]:
+            return False
+    meta = item.current_meta_data or ""
+    if meta.startswith("{"):
+        data = ast.literal_eval(meta)
+        shop, category = data.get("shop"), data.get("category")
+    else:
+        shop, category = meta.rsplit("|", 1)[1] if "|" in meta else None, None
+    if shop:
+        shops = [norm(value) for value in rule.get("shops", [])]
+        if shops and norm(shop) not in shops:
+            return False
+    if category:
+        excluded = [norm(value) for value in rule.get("exclude_categories", [])]
+        if norm(category) in excluded:
+            return False
+    return True
+
+
+def run_once(
+    rules: Dict[str, dict],
+    items: List[KeywordData],
+) -> Tuple[
+    Dict[str, float],
+    Dict[str, List[KeywordData]],
+    Dict[str, List[KeywordData]],
+    Dict[str, List[str]],
+]:
+    timings = {}
+    start = time.perf_counter()
+    engine = RuleEngine(rules)
+    matcher = KeywordMatcher(list(rules))
+    timings["compile"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    matched = matcher.match_items(items)
+    timings["match"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    compiled = engine.filter_matched(matched)
+    timings["compiled"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    naive = {
+        keyword: [
+            item.current_id for item in products if naive_accepts(rules[keyword], item)
+        ]
+        for keyword, products in matched.items()
+    }
+    timings["naive"] = time.perf_counter() - start
+    return timings, matched, compiled, naive
+
+
+def main():
+    parser = argparse.ArgumentParser(description="알림 규칙 엔진 벤치마크")
+    parser.add_argument("--rules", type=int, default=3000, help="규칙(키워드) 수")
+    parser.add_argument("--items", type=int, default=3000, help="사이클당 상품 수")
+    parser.add_argument("--words", type=int, default=5000, help="합성 단어 수")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수 (중앙값 사용)")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    words = synthetic_words(max(args.words, args.rules), rng)
+    items = synthetic_items(args.items, words, rng)
+    rules = synthetic_rules(args.rules, words, rng)
+
+    runs = []
+    for _ in range(args.repeat):
+        timings, matched, compiled, naive = run_once(rules, items)
+        runs.append(timings)
+    timings = {name: statistics.median(run[name] for run in runs) for name in runs[0]}
+
+    pairs = sum(len(products) for products in matched.values())
+    accepted = sum(len(products) for products in compiled.values())
+    same = all(
+        [item.current_id for item in compiled[keyword]] == ids
+        for keyword, ids in naive.items()
+    )
+    print(
+        f"규칙 {len(rules)}개, 상품 {len(items)}개, 키워드 매칭 {pairs}건 -> 통과 {accepted}건"
+    )
+    print(f"{'단계':<20}{'시간(ms)':>12}")
+    print(f"{'컴파일':<20}{timings['compile'] * 1000:>12.1f}")
+    print(f"{'키워드 매칭':<20}{timings['match'] * 1000:>12.1f}")
+    print(f"{'규칙 적용 (컴파일)':<20}{timings['compiled'] * 1000:>12.1f}")
+    print(f"{'규칙 적용 (단순)':<20}{timings['naive'] * 1000:>12.1f}")
+    if timings["compiled"]:
+        print(f"속도 향상: {timings['naive'] / timings['compiled']:.1f}배")
+    print(f"결과 일치: {'예' if same else '아니오'}")
+    if not same:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
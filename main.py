@@ -1,39 +1,155 @@
+import multiprocessing
+import os
+import signal
+import sys
 import time
-from datetime import datetime
+from functools import partial
+from multiprocessing.connection import wait
+from typing import List, Optional
 
 from dotenv import load_dotenv
 
 from modules import logger
+from modules.admin_server import AdminServer
 from modules.app import App
+from modules.data_manager import DataManager
+from modules.metrics import Metrics
+from modules.notification_queue import NotificationQueue
+from modules.scheduler import Scheduler, create_trigger, trigger_period
+from modules.shard_coordinator import ShardCoordinator
 
 load_dotenv()
 
 
-def job():
-    app = App()
-    app.run()
+def job(
+    keywords: Optional[List[str]] = None,
+    sites: Optional[List[str]] = None,
+    exclude: Optional[List[str]] = None,
+):
+    # App은 사이클이 끝나도 설정/상태/크롤러를 유지하는 싱글톤
+    App().run(keywords=keywords, sites=sites, exclude=exclude)
 
 
-def run_scheduled_tasks(first_run):
-    now = datetime.now()
+def refresh_keywords():
+    """data.json을 다시 읽고, 새로 추가된 키워드는 다음 주기를 기다리지 않고 바로 크롤링합니다."""
+    added = App().reload_config()
+    if added:
+        job(keywords=added)
 
-    # 최초 실행 시 작업
-    if first_run:
-        logger.info(f"최초 실행 작업 실행: {now}")
-        job()
-        return False  # 최초 실행 이후 플래그 변경
 
-    # 매시 정시와 30분에 작업 실행
-    elif now.minute % 30 <= 5:
-        logger.info(f"정기 작업 실행: {now}")
-        job()
+def build_scheduler() -> Scheduler:
+    """data.json의 schedules 항목과 기본 주기(CRAWL_SCHEDULE)로 스케줄러를 구성합니다."""
+    scheduler = Scheduler()
+    run_now = os.getenv("SCHEDULE_RUN_ON_START", "true").lower() == "true"
 
-    return first_run
+    # 별도 주기로 모든 사이트를 크롤링하는 키워드는 기본 작업에서 제외
+    scheduled_keywords = []
+    for index, entry in enumerate(DataManager().file_load().schedules):
+        name = entry.get("name", f"schedule-{index}")
+        try:
+            trigger = create_trigger(
+                entry["every"] if "every" in entry else entry["cron"]
+            )
+        except (KeyError, ValueError) as e:
+            logger.error(f"[{name}] 스케줄 설정 오류: {e}")
+            continue
+        scheduler.add_job(
+            name=name,
+            trigger=trigger,
+            func=partial(job, keywords=entry.get("keywords"), sites=entry.get("sites")),
+            jitter=entry.get("jitter"),
+            run_now=run_now,
+        )
+        if entry.get("keywords") and not entry.get("sites"):
+            scheduled_keywords += entry["keywords"]
+
+    # 기본: 매시 정각과 30분 (적응형 크롤링 사용 시 2분마다 깨어나 크롤링 시각이 된 키워드만 실행)
+    polling = App().polling
+    trigger = create_trigger(
+        os.getenv("CRAWL_SCHEDULE", "120" if polling.enabled else "*/30 * * * *")
+    )
+    polling.align_to_tick(trigger_period(trigger))
+    scheduler.add_job(
+        name="default",
+        trigger=trigger,
+        func=partial(job, exclude=scheduled_keywords),
+        run_now=run_now,
+    )
+    return scheduler
+
+
+def run_worker(
+    shard_index: Optional[int] = None,
+):
+    """스케줄러를 실행합니다. shard_index를 주면 해당 파티션을 맡는 작업자로 실행합니다."""
+    if shard_index is not None:
+        os.environ["SHARD_INDEX"] = str(shard_index)
+    # docker stop(SIGTERM) 시에도 남은 알림을 보내고 종료하도록 처리
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    Metrics().start_server()
+    try:
+        scheduler = build_scheduler()
+        # data.json 변경은 스케줄러 스레드에서 처리 (사이클 실행과 겹치지 않도록)
+        App().config_watcher.start(
+            on_change=lambda: scheduler.run_soon("data.json", refresh_keywords)
+        )
+        # 관리 API로 바꾼 키워드는 파일 감시를 기다리지 않고 바로 반영
+        AdminServer(
+            DataManager().file_path,
+            on_change=lambda: scheduler.run_soon("admin", refresh_keywords),
+        ).start()
+        scheduler.run_forever()
+    finally:
+        ShardCoordinator().shutdown()
+        NotificationQueue().shutdown()
+
+
+def run_workers(
+    count: int,
+):
+    """파티션마다 작업자 프로세스를 하나씩 띄우고, 종료된 작업자는 다시 시작합니다.
+
+    작업자가 죽어 있는 동안에는 리스가 만료된 파티션을 다른 작업자가 넘겨받습니다.
+    """
+    os.environ.setdefault("SHARD_COUNT", str(count))
+    context = multiprocessing.get_context("spawn")
+    workers = {}
+
+    def start(index: int):
+        worker = context.Process(
+            target=run_worker,
+            args=(index,),
+            name=f"shard-{index}",
+        )
+        worker.start()
+        workers[index] = worker
+        logger.info(f"작업자 {worker.name} 시작 (pid {worker.pid})")
+
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    try:
+        for index in range(count):
+            start(index)
+        while True:
+            wait([worker.sentinel for worker in workers.values()])
+            for index, worker in list(workers.items()):
+                if not worker.is_alive():
+                    logger.error(
+                        f"작업자 {worker.name} 종료 (exit code {worker.exitcode}). 다시 시작합니다."
+                    )
+                    time.sleep(1)
+                    start(index)
+    finally:
+        for worker in workers.values():
+            if worker.is_alive():
+                worker.terminate()  # SIGTERM: 작업자가 알림을 보내고 리스를 반납한 뒤 종료
+        for worker in workers.values():
+            worker.join()
 
 
 if __name__ == "__main__":
-    first_run = True  # 최초 실행 플래그
     logger.info("프로그램 시작")
-    while True:
-        first_run = run_scheduled_tasks(first_run)
-        time.sleep(300)  # 5분마다 확인
+    worker_count = int(os.getenv("SHARD_WORKERS", "1"))
+    if worker_count > 1:
+        run_workers(worker_count)
+    else:
+        run_worker()
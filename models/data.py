@@ -1,5 +1,5 @@
 from dataclasses import asdict, dataclass, field
-from typing import Dict
+from typing import Dict, List
 
 from models import logger
 
@@ -10,9 +10,21 @@ class SmtpSettings:
     port: str = "465"
     email: str = ""
     password: str = ""
+    # ssl(SMTP_SSL), starttls, plain(로컬 디버깅 서버용)
+    security: str = "ssl"
 
 
 @dataclass
 class DataModel:
     keyword: Dict[str, dict] = field(default_factory=dict)
     smtp_settings: SmtpSettings = field(default_factory=SmtpSettings)
+    # 추가 알림 채널 설정 목록 ({"name": ..., "type": "webhook/telegram/slack", ...})
+    notifiers: List[dict] = field(default_factory=list)
+    # 키워드별로 알림을 보낼 채널 이름 목록 (없는 키워드는 모든 채널로 전송)
+    routes: Dict[str, List[str]] = field(default_factory=dict)
+    # 기본 주기와 다르게 크롤링할 키워드/사이트 묶음
+    # ({"name": ..., "keywords": [...], "sites": [...], "every": 초 또는 "cron": "..."})
+    schedules: List[dict] = field(default_factory=list)
+    # 키워드별 알림 규칙 (키워드: {"include": [...], "exclude": [...], "regex": ...,
+    # "min_price": ..., "max_price": ..., "shops": [...], "categories": [...], ...})
+    rules: Dict[str, dict] = field(default_factory=dict)
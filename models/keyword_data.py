@@ -11,3 +11,11 @@ class KeywordData:
     current_price: Optional[str] = None
     current_meta_data: Optional[str] = None
     wdate: str = datetime.now().isoformat()
+    # 최근에 본 상품 ID 목록 (JSON 배열 문자열, 상태 저장소에만 사용)
+    seen_ids: Optional[str] = None
+    # 적응형 크롤링 상태 (상태 저장소에만 사용, 시각은 epoch 초)
+    poll_interval: Optional[float] = None
+    next_crawl: Optional[float] = None
+    last_crawl: Optional[float] = None
+    # 시간당 새 상품 수의 지수 가중 이동 평균
+    deal_rate: Optional[float] = None
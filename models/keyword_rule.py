@@ -0,0 +1,27 @@
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+
+@dataclass
+class KeywordRule:
+    """키워드별 알림 조건 (data.json의 rules 항목).
+
+    비교는 공백과 대소문자를 무시하며, 가격/쇼핑몰/카테고리를 알 수 없는 상품은
+    해당 조건으로 걸러내지 않습니다.
+    """
+
+    # 제목에 모두 포함되어야 하는 단어
+    include: List[str] = field(default_factory=list)
+    # 제목에 하나라도 포함되면 제외할 단어
+    exclude: List[str] = field(default_factory=list)
+    # 제목이 만족해야 하는 정규식
+    regex: Optional[str] = None
+    # 가격 범위 (원, current_price의 첫 숫자)
+    min_price: Optional[int] = None
+    max_price: Optional[int] = None
+    # 허용/제외할 쇼핑몰 (FMKorea 메타 데이터의 shop, 알구몬은 메타 정보의 | 뒤)
+    shops: List[str] = field(default_factory=list)
+    exclude_shops: List[str] = field(default_factory=list)
+    # 허용/제외할 카테고리 (FMKorea 메타 데이터의 category)
+    categories: List[str] = field(default_factory=list)
+    exclude_categories: List[str] = field(default_factory=list)
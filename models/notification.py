@@ -0,0 +1,33 @@
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+from models.keyword_data import KeywordData
+
+
+@dataclass
+class Notification:
+    keyword: str
+    # initial: 최초 등록 알림, updates: 새로운 상품 알림
+    mode: str
+    subject: str
+    updates: List[KeywordData] = field(default_factory=list)
+    # 알림 생성 시각 (전송 지연 측정용, unix time)
+    created_at: float = field(default_factory=time.time)
+    # 역대 최저가인 상품 (상품 ID: 이전 최저가)
+    lowest: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def products(self) -> List[KeywordData]:
+        """알림에 표시할 상품 (최초 등록 알림은 가장 최근 상품 하나만)."""
+        return self.updates[:1] if self.mode == "initial" else self.updates
+
+    def price_text(
+        self,
+        product: KeywordData,
+    ) -> str:
+        """표시할 가격 (역대 최저가이면 표시를 덧붙임)."""
+        price = product.current_price or ""
+        if product.current_id in self.lowest:
+            return f"{price} [역대 최저가]".strip()
+        return price
@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class ProxyStats:
+    proxy: str
+    # 지수 가중 이동 평균(EWMA)으로 관리하는 성공률(0~1)과 응답 시간(초)
+    success_rate: float = 0.5
+    latency: Optional[float] = None
+    attempts: int = 0
+    last_checked: float = 0.0
+
+    @property
+    def score(self) -> float:
+        """높을수록 좋은 프록시 (성공률이 높고 응답이 빠를수록 높음)."""
+        latency = self.latency if self.latency is not None else 10.0
+        return self.success_rate / (1.0 + latency)
@@ -0,0 +1,172 @@
+import json
+import math
+import os
+import threading
+import time
+from typing import Optional
+
+from models.keyword_data import KeywordData
+from modules import logger
+
+
+class AdaptivePolling:
+    """키워드-사이트별 크롤링 간격 조절기.
+
+    새 상품(current_id)의 시간당 도착률을 시간 가중 EWMA로 추정하고, 새 상품이 나왔거나
+    지금 간격 동안 1건 이상 나올 것으로 보이면 간격을 speedup으로 나누고(speedup),
+    0.5건도 안 될 것으로 보이면 backoff를 곱합니다(backoff).
+    간격은 [min_interval, max_interval] 범위로 제한하며, max_interval은 고정 주기보다 짧게 두어
+    새 상품이 있는 키워드는 고정 주기보다 늦게 찾지 않습니다. 도착률이 idle_rate보다 낮은
+    (idle_days일에 1건보다 드문) 키워드만 idle_max_interval까지 늘려 요청을 줄입니다.
+    간격과 도착률은 KeywordData의 poll_* 필드로 상태 저장소에 함께 저장됩니다.
+    """
+
+    def __init__(
+        self,
+        enabled: Optional[bool] = None,
+        min_interval: Optional[float] = None,
+        max_interval: Optional[float] = None,
+        idle_max_interval: Optional[float] = None,
+        idle_days: Optional[float] = None,
+        speedup: Optional[float] = None,
+        backoff: Optional[float] = None,
+        rate_window: Optional[float] = None,
+        history_path: Optional[str] = None,
+    ):
+        self.enabled = (
+            os.getenv("ADAPTIVE_POLLING", "false").lower() == "true"
+            if enabled is None
+            else enabled
+        )
+        self.min_interval = min_interval or float(os.getenv("POLL_MIN_INTERVAL", "900"))
+        self.max_interval = max_interval or float(
+            os.getenv("POLL_MAX_INTERVAL", "1500")
+        )
+        # 새 상품이 idle_days일에 1건보다 드문 키워드는 idle_max_interval까지 늘림
+        self.idle_max_interval = idle_max_interval or float(
+            os.getenv("POLL_IDLE_MAX_INTERVAL", "7200")
+        )
+        self.idle_rate = 1 / (
+            (idle_days or float(os.getenv("POLL_IDLE_DAYS", "7"))) * 24
+        )
+        # 새 상품이 있으면 간격을 speedup으로 나누고, 없으면 backoff를 곱한다.
+        self.speedup = speedup or float(os.getenv("POLL_SPEEDUP", "2"))
+        self.backoff = backoff or float(os.getenv("POLL_BACKOFF", "1.5"))
+        # 도착률 EWMA의 시간 창(초). 크롤링 간격이 달라도 같은 시간만큼 과거를 반영
+        self.rate_window = rate_window or float(os.getenv("POLL_RATE_WINDOW", "172800"))
+        # 처음 보는 키워드의 도착률(시간당). 하루 1건으로 보고 시작하여, 기록이 쌓이기 전에
+        # 첫 빈 크롤링만으로 조용한 키워드로 판단하지 않게 함
+        self.initial_rate = 1 / 24
+        # 스케줄러 지터 때문에 조금 이르게 돌아온 사이클도 실행하도록 허용하는 비율
+        self.tolerance = 0.1
+        # 새 상품 도착 기록 (시뮬레이션 재생용, POLL_HISTORY=true일 때만)
+        self.history_path = history_path or (
+            os.path.join(os.getcwd(), "data/deal_history.jsonl")
+            if os.getenv("POLL_HISTORY", "false").lower() == "true"
+            else None
+        )
+        self._lock = threading.Lock()
+
+    def is_due(
+        self,
+        state: Optional[KeywordData],
+        now: Optional[float] = None,
+    ) -> bool:
+        """이번 사이클에 크롤링해야 하는지 여부."""
+        if not self.enabled or state is None or state.next_crawl is None:
+            return True
+        now = time.time() if now is None else now
+        interval = state.poll_interval or self.min_interval
+        return now + interval * self.tolerance >= state.next_crawl
+
+    def observe(
+        self,
+        previous: KeywordData,
+        current: KeywordData,
+        new_items: int,
+        now: Optional[float] = None,
+    ) -> KeywordData:
+        """크롤링 결과를 반영하여 current에 다음 크롤링 시각을 기록합니다.
+
+        previous는 저장되어 있던 상태, current는 새로 저장할 상태입니다 (같은 객체여도 됨).
+        """
+        now = time.time() if now is None else now
+        interval = previous.poll_interval or self.min_interval
+        rate = previous.deal_rate
+        if previous.last_crawl is not None and now > previous.last_crawl:
+            elapsed = now - previous.last_crawl
+            # 짧은 간격의 우연한 도착으로 도착률이 튀지 않도록 최소 간격으로 보정
+            observed = new_items / (max(elapsed, self.min_interval) / 3600)
+            weight = 1 - math.exp(-elapsed / self.rate_window)
+            rate = self.initial_rate if rate is None else rate
+            rate += weight * (observed - rate)
+        interval = self.next_interval(
+            interval,
+            self.initial_rate if rate is None else rate,
+            new_items,
+        )
+
+        current.poll_interval = interval
+        current.deal_rate = rate
+        current.last_crawl = now
+        current.next_crawl = now + interval
+        return current
+
+    def align_to_tick(
+        self,
+        tick: float,
+    ):
+        """스케줄러가 tick초마다 깨어나면 그보다 짧은 간격은 지킬 수 없으므로 최소 간격을 tick으로 맞춥니다."""
+        if not self.enabled or tick <= self.min_interval:
+            return
+        logger.warning(
+            f"스케줄러 실행 간격({tick:g}초)이 POLL_MIN_INTERVAL({self.min_interval:g}초)보다 길어 "
+            "최소 간격을 실행 간격으로 맞춥니다. 적응형 크롤링에는 CRAWL_SCHEDULE을 짧게 설정하세요."
+        )
+        self.min_interval = tick
+        self.max_interval = max(self.max_interval, tick)
+        self.idle_max_interval = max(self.idle_max_interval, tick)
+
+    def next_interval(
+        self,
+        interval: float,
+        rate: float,
+        new_items: int,
+    ) -> float:
+        """지금 간격과 시간당 도착률로 다음 크롤링 간격(초)을 정합니다."""
+        expected = rate * interval / 3600
+        if new_items or expected >= 1:
+            interval /= self.speedup
+        elif expected < 0.5:
+            interval *= self.backoff
+        upper = self.idle_max_interval if rate < self.idle_rate else self.max_interval
+        return min(upper, max(self.min_interval, interval))
+
+    def record_history(
+        self,
+        keyword: str,
+        sitename: str,
+        products: list,
+        now: Optional[float] = None,
+    ):
+        """새로 발견한 상품을 도착 기록 파일에 남깁니다."""
+        if not self.history_path or not products:
+            return
+        now = time.time() if now is None else now
+        try:
+            with self._lock, open(self.history_path, "a", encoding="utf-8") as f:
+                for product in products:
+                    f.write(
+                        json.dumps(
+                            {
+                                "keyword": keyword,
+                                "site": sitename,
+                                "id": product.current_id,
+                                "time": now,
+                            },
+                            ensure_ascii=False,
+                        )
+                        + "\n"
+                    )
+        except OSError as e:
+            logger.error(f"상품 도착 기록 저장 실패: {e}")
@@ -0,0 +1,165 @@
+import hmac
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Optional
+from urllib.parse import unquote, urlparse
+
+from modules import logger
+from modules.keyword_file import (
+    add_keywords,
+    read_data_file,
+    remove_keywords,
+    replace_keywords,
+)
+
+
+class AdminServer:
+    """키워드 관리용 로컬 HTTP API.
+
+    - GET /keywords: 키워드 목록
+    - POST /keywords: {"keyword": "..."} 또는 {"keywords": [...]}로 추가 (일괄 등록)
+    - PUT /keywords: {"keywords": [...]}로 목록 전체를 교체
+    - DELETE /keywords/{키워드}: 삭제 (또는 DELETE /keywords에 {"keywords": [...]})
+
+    변경은 data.json에 잠금과 원자적 쓰기로 저장한 뒤 on_change를 호출하여
+    실행 중인 프로그램에 바로 반영합니다 (추가된 키워드는 바로 크롤링).
+    """
+
+    def __init__(
+        self,
+        data_path: str,
+        on_change: Optional[Callable[[], None]] = None,
+    ):
+        self.data_path = data_path
+        self.on_change = on_change
+        self.token = os.getenv("ADMIN_TOKEN", "")
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    def list_keywords(self) -> dict:
+        return {"keywords": read_data_file(self.data_path).get("keyword", [])}
+
+    def apply(
+        self,
+        method: str,
+        path: str,
+        body: dict,
+    ) -> dict:
+        """요청 하나를 처리하고 응답 본문을 반환합니다 (잘못된 요청은 ValueError)."""
+        keywords = body.get("keywords")
+        if keywords is None and body.get("keyword") is not None:
+            keywords = [body["keyword"]]
+        if path.startswith("/keywords/"):
+            keywords = [unquote(path[len("/keywords/") :])]
+        if keywords is not None and (
+            not isinstance(keywords, list)
+            or not all(isinstance(keyword, str) for keyword in keywords)
+        ):
+            raise ValueError("keywords는 문자열 리스트여야 합니다.")
+
+        if method == "PUT":
+            if keywords is None:
+                raise ValueError("keywords가 필요합니다.")
+            added, removed = replace_keywords(self.data_path, keywords)
+        elif method == "POST":
+            if not keywords:
+                raise ValueError("추가할 keyword 또는 keywords가 필요합니다.")
+            added, removed = add_keywords(self.data_path, keywords), []
+        elif method == "DELETE":
+            if not keywords:
+                raise ValueError("삭제할 키워드가 필요합니다.")
+            added, removed = [], remove_keywords(self.data_path, keywords)
+        else:
+            raise ValueError(f"지원하지 않는 요청: {method}")
+
+        if added or removed:
+            logger.info(f"관리 API - 추가: {added}, 삭제: {removed}")
+            if self.on_change:
+                self.on_change()
+        return {"added": added, "removed": removed, **self.list_keywords()}
+
+    def _handler(self):
+        admin = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def _send(
+                self,
+                status: int,
+                data: dict,
+            ):
+                body = json.dumps(data, ensure_ascii=False).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _authorized(self) -> bool:
+                if not admin.token:
+                    return True
+                expected = f"Bearer {admin.token}"
+                return hmac.compare_digest(
+                    self.headers.get("Authorization", ""), expected
+                )
+
+            def _handle(
+                self,
+                method: str,
+            ):
+                path = urlparse(self.path).path.rstrip("/")
+                if not self._authorized():
+                    return self._send(401, {"error": "인증 실패"})
+                if path != "/keywords" and not path.startswith("/keywords/"):
+                    return self._send(404, {"error": "없는 경로"})
+                try:
+                    if method == "GET":
+                        return self._send(200, admin.list_keywords())
+                    length = int(self.headers.get("Content-Length") or 0)
+                    raw = self.rfile.read(length) if length else b""
+                    body = json.loads(raw) if raw.strip() else {}
+                    if not isinstance(body, dict):
+                        raise ValueError("요청 본문은 JSON 객체여야 합니다.")
+                    self._send(200, admin.apply(method, path, body))
+                except ValueError as e:
+                    self._send(400, {"error": str(e)})
+                except Exception as e:
+                    logger.error(f"관리 API 처리 중 오류: {e}")
+                    self._send(500, {"error": str(e)})
+
+            def do_GET(self):
+                self._handle("GET")
+
+            def do_POST(self):
+                self._handle("POST")
+
+            def do_PUT(self):
+                self._handle("PUT")
+
+            def do_DELETE(self):
+                self._handle("DELETE")
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+        """ADMIN_PORT가 설정되어 있으면 서버를 띄웁니다 (여러 작업자면 포트에 SHARD_INDEX를 더함)."""
+        port = os.getenv("ADMIN_PORT")
+        if not port or self._server is not None:
+            return
+        port = int(port) + int(os.getenv("SHARD_INDEX") or 0)
+        host = os.getenv("ADMIN_HOST", "127.0.0.1")
+        try:
+            self._server = ThreadingHTTPServer((host, port), self._handler())
+        except OSError as e:
+            logger.error(f"관리 API 서버를 시작하지 못했습니다 ({host}:{port}): {e}")
+            return
+        self._server.daemon_threads = True
+        threading.Thread(
+            target=self._server.serve_forever,
+            name="admin-server",
+            daemon=True,
+        ).start()
+        logger.info(f"관리 API 시작: http://{host}:{port}/keywords")
@@ -1,51 +1,479 @@
-from typing import List
+import asyncio
+import json
+import os
+from dataclasses import replace
+from typing import Dict, List, Optional, Set, Tuple, Type
 
 from models.keyword_data import KeywordData
 from modules import logger
-from modules.base_crawler import BaseCrawler
+from modules.adaptive_polling import AdaptivePolling
+from modules.base_crawler import BaseCrawler, FeedCrawler
+from modules.config_watcher import ConfigWatcher
+from modules.crawl_engine import CrawlEngine, CrawlJob
 from modules.crawlers.algumon import AlgumonCrawler
 from modules.crawlers.fmkorea import FMKoreaCrawler
 from modules.data_manager import DataManager
+from modules.deal_deduplicator import DealDeduplicator
+from modules.http_cache import HttpCache
+from modules.http_client import HttpClient
+from modules.keyword_matcher import KeywordMatcher
+from modules.metrics import Metrics
 from modules.notification_manager import NotificationManager
+from modules.price_history import PriceHistory
 from modules.proxy_manager import ProxyManager
+from modules.rate_limiter import RateLimiter
+from modules.rule_engine import RuleEngine
+from modules.seen_index import SeenIndex
+from modules.shard_coordinator import ShardCoordinator
+
+# 피드 사이트 전체에서 본 글 ID를 저장하는 상태 키 (키워드 대신 사용)
+# 일부 키워드만 다루는 실행은 "__feed__:[키워드 JSON 배열]" 키를 따로 씀
+FEED_STATE_KEYWORD = "__feed__"
 
 
 class App:
+    """크롤링 사이클 실행기 (싱글톤).
+
+    사이클이 끝나도 설정, 키워드 상태, 크롤러를 메모리에 유지하며,
+    data.json은 파일이 바뀌었을 때만 다시 읽어 추가/삭제된 키워드만 반영합니다.
+    """
+
+    _instance = None
+    _initialized = False
+
+    def __new__(cls, *args, **kwargs):
+        if not cls._instance:
+            cls._instance = super(App, cls).__new__(cls)
+        return cls._instance
+
     def __init__(self):
+        if self._initialized:  # 이미 초기화된 경우 무시
+            return
         self.data_manager: DataManager = DataManager()
         self.notification_manager: NotificationManager = NotificationManager()
+        self.polling = AdaptivePolling()
+        self.deduplicator: DealDeduplicator = DealDeduplicator()
+        self.coordinator: ShardCoordinator = ShardCoordinator()
+        self.metrics: Metrics = Metrics()
+        self.price_history: PriceHistory = PriceHistory()
+        # 크롤링 대상 사이트 (사이트명: 크롤러 클래스)
+        self.sites: Dict[str, Type[BaseCrawler]] = {
+            "Algumon": AlgumonCrawler,
+        }
+        # 사이클당 한 번만 목록을 가져와 모든 키워드에 매칭하는 피드 사이트
+        self.feed_sites: Dict[str, Type[FeedCrawler]] = {}
+        if os.getenv("FMKOREA_ENABLED", "false").lower() == "true":
+            self.feed_sites["FMKorea"] = FMKoreaCrawler
+        # 마지막으로 읽어 들인 키워드 목록과 사이클 간에 재사용하는 크롤러
+        self.keywords: Optional[List[str]] = None
+        self.crawlers: Dict[Tuple[str, Optional[str], str], BaseCrawler] = {}
+        # 키워드별 알림 규칙 (data.json의 rules가 바뀔 때만 다시 컴파일)
+        self.rule_engine: RuleEngine = RuleEngine()
+        self.config_watcher = ConfigWatcher(self.data_manager.file_path)
+        self._initialized = True
+
+    def reload_config(self) -> List[str]:
+        """data.json이 바뀌었으면 다시 읽고, 새로 추가된 키워드를 반환합니다.
+
+        읽지 못하면(저장 도중 등) 이전 설정을 유지하고 다음 확인 때 다시 시도합니다.
+        """
+        signature = self.config_watcher.signature()
+        if self.keywords is not None and not self.config_watcher.changed(signature):
+            return []
+        try:
+            data = self.data_manager.file_load()
+        except (OSError, ValueError, TypeError) as e:
+            if self.keywords is None:
+                raise
+            logger.error(f"data.json을 읽지 못해 이전 설정을 유지합니다: {e}")
+            return []
+        self.config_watcher.mark_loaded(signature)
+
+        previous = self.keywords
+        if previous is not None and data.schedules != self.data_manager.data.schedules:
+            logger.warning("schedules 변경은 재시작 후 적용됩니다.")
+        self.data_manager.data = data
+        self.keywords = list(data.keyword)
+        if data.rules != self.rule_engine.config:
+            self.rule_engine = RuleEngine(data.rules)
+        if previous is None:
+            return []
+        added = [keyword for keyword in self.keywords if keyword not in previous]
+        removed = [keyword for keyword in previous if keyword not in self.keywords]
+        if removed:
+            # 상태는 사이클 마무리(data_cleaner)에서 정리
+            self.crawlers = {
+                key: crawler
+                for key, crawler in self.crawlers.items()
+                if key[1] not in removed
+            }
+            logger.info(f"삭제된 키워드: {removed}")
+        if added:
+            logger.info(f"추가된 키워드: {added}")
+        return added
+
+    def run(
+        self,
+        keywords: Optional[List[str]] = None,
+        sites: Optional[List[str]] = None,
+        exclude: Optional[List[str]] = None,
+    ):
+        """한 사이클을 실행합니다.
+
+        keywords/sites를 주면 해당 키워드/사이트만 크롤링하고,
+        exclude에 있는 키워드는 제외합니다 (스케줄별 실행용).
+        """
+        # 여러 작업자로 나누어 실행 중이면 이번 사이클에 맡을 파티션을 먼저 확보
+        self.coordinator.begin_cycle()
+        self.metrics.begin_cycle()
+        self.price_history.begin_cycle()
+        mode = os.getenv("CRAWL_MODE", "async").lower()
+        try:
+            # CRAWL_MODE=sync 이면 기존처럼 키워드를 하나씩 순차 처리
+            if mode == "sync":
+                self.run_sync(keywords, sites, exclude)
+            else:
+                asyncio.run(self.run_async(keywords, sites, exclude))
+        finally:
+            self.coordinator.end_cycle()
+            self.metrics.end_cycle(
+                mode=mode,
+                keywords=keywords,
+                sites=sites,
+                shards=sorted(self.coordinator.owned),
+            )
+
+    def prepare(
+        self,
+        keywords: Optional[List[str]] = None,
+        sites: Optional[List[str]] = None,
+        exclude: Optional[List[str]] = None,
+    ) -> Tuple[
+        List[str],
+        List[str],
+        Dict[str, Type[BaseCrawler]],
+        Dict[str, Type[FeedCrawler]],
+    ]:
+        """키워드를 갱신하고 상태를 로드한 뒤, 이번 사이클의 대상 키워드와 사이트를 고릅니다.
+
+        피드 사이트는 담당 작업자 한 곳에서만 가져와 모든 대상 키워드에 매칭합니다.
+        키워드별 사이트는 owned_keywords로 이 작업자의 파티션만 골라 크롤링합니다.
+        """
+        self.reload_config()
+        # 상태는 처음 한 번만 읽고 메모리에서 유지한다. 여러 작업자로 실행 중이면
+        # 다른 작업자가 맡았던 파티션을 넘겨받을 수 있으므로 사이클마다 다시 읽는다.
+        if self.coordinator.enabled or self.data_manager.keyword_state is None:
+            self.data_manager.load_state()
+
+        all_keywords = self.data_manager.data.keyword
+        targets = [
+            keyword
+            for keyword in all_keywords
+            if (keywords is None or keyword in keywords)
+            and keyword not in (exclude or [])
+        ]
+        site_classes = {
+            sitename: crawler_class
+            for sitename, crawler_class in self.sites.items()
+            if sites is None or sitename in sites
+        }
+        feed_classes = {
+            sitename: crawler_class
+            for sitename, crawler_class in self.feed_sites.items()
+            if (sites is None or sitename in sites)
+            and self.coordinator.owns(f"feed:{sitename}")
+        }
+        return all_keywords, targets, site_classes, feed_classes
+
+    def owned_keywords(
+        self,
+        keywords: List[str],
+    ) -> List[str]:
+        """이번 사이클에 이 작업자가 처리할 키워드."""
+        return [keyword for keyword in keywords if self.coordinator.owns(keyword)]
 
-    def run(self):
-        # 프록시 초기화
+    def run_sync(
+        self,
+        keywords: Optional[List[str]] = None,
+        sites: Optional[List[str]] = None,
+        exclude: Optional[List[str]] = None,
+    ):
+        # 프록시는 차단 응답을 받았을 때 필요한 만큼만 가져온다.
         proxy_manager = ProxyManager()
-        proxy_manager.fetch_proxies()
 
-        # 검색할 키워드 갱신
-        self.data_manager.data = self.data_manager.file_load()
+        # 검색할 키워드 갱신 및 상태 로드
+        all_keywords, keywords, site_classes, feed_classes = self.prepare(
+            keywords, sites, exclude
+        )
 
         # 크롤링 작업
-        keywords = self.data_manager.data.keyword
         if not keywords:
             logger.warning("키워드가 없습니다.")
             return
-        for keyword in keywords:
-            algumon_crawler: BaseCrawler = AlgumonCrawler(keyword=keyword)
-            self.excute(
-                crwaler=algumon_crawler,
+        for keyword in self.owned_keywords(keywords):
+            for sitename, crawler_class in site_classes.items():
+                if not self.is_due(keyword, sitename):
+                    continue
+                crawler: BaseCrawler = self.create_crawler(
+                    crawler_class, keyword, sitename
+                )
+                self.excute(
+                    crwaler=crawler,
+                    keyword=keyword,
+                    sitename=sitename,
+                )
+        matcher = KeywordMatcher(keywords)
+        for sitename, crawler_class in feed_classes.items():
+            self.route_feed(
+                products=self.create_crawler(
+                    crawler_class, None, sitename, feed_keywords=keywords
+                ).fetchparse(),
+                matcher=matcher,
+                sitename=sitename,
+            )
+
+        # 마무리 작업
+        self.finish(all_keywords, proxy_manager)
+
+    async def run_async(
+        self,
+        keywords: Optional[List[str]] = None,
+        sites: Optional[List[str]] = None,
+        exclude: Optional[List[str]] = None,
+    ):
+        # 프록시는 차단 응답을 받았을 때 필요한 만큼만 가져온다.
+        proxy_manager = ProxyManager()
+
+        # 검색할 키워드 갱신 및 상태 로드
+        all_keywords, keywords, site_classes, feed_classes = self.prepare(
+            keywords, sites, exclude
+        )
+
+        # 크롤링 작업: 모든 키워드×사이트 작업을 동시에 실행
+        if not keywords:
+            logger.warning("키워드가 없습니다.")
+            return
+        jobs = [
+            CrawlJob(
                 keyword=keyword,
-                sitename="Algumon",
+                sitename=sitename,
+                crawler=self.create_crawler(crawler_class, keyword, sitename),
             )
+            for keyword in self.owned_keywords(keywords)
+            for sitename, crawler_class in site_classes.items()
+            if self.is_due(keyword, sitename)
+        ]
+        jobs += [
+            CrawlJob(
+                keyword=None,
+                sitename=sitename,
+                crawler=self.create_crawler(
+                    crawler_class, None, sitename, feed_keywords=keywords
+                ),
+            )
+            for sitename, crawler_class in feed_classes.items()
+        ]
+        matcher = KeywordMatcher(keywords)
 
-            # fmkorea_crawler: BaseCrawler = FMKoreaCrawler(keyword=keyword)
-            # self.excute(
-            #     crwaler=fmkorea_crawler,
-            #     keyword=keyword,
-            #     sitename="FMKorea",
-            # )
+        def on_result(job: CrawlJob, products: List[KeywordData]):
+            if job.keyword is None:
+                self.route_feed(
+                    products=products,
+                    matcher=matcher,
+                    sitename=job.sitename,
+                )
+            else:
+                self.process_products(
+                    products=products,
+                    keyword=job.keyword,
+                    sitename=job.sitename,
+                )
+
+        # 결과 처리(상태 갱신, 알림)는 이벤트 루프 스레드에서 순서대로 실행된다.
+        await CrawlEngine().run(jobs, on_result=on_result)
 
         # 마무리 작업
-        self.data_manager.data_cleaner(keywords)
-        proxy_manager.reset_proxies()
+        self.finish(all_keywords, proxy_manager)
+
+    def create_crawler(
+        self,
+        crawler_class: Type[BaseCrawler],
+        keyword: Optional[str],
+        sitename: str,
+        feed_keywords: Optional[List[str]] = None,
+    ) -> BaseCrawler:
+        """크롤러를 준비하고, 새 상품이 이어지는 페이지까지만 가져오도록 본 상품 기록을 넘깁니다.
+
+        크롤러는 (사이트, 키워드)별로 만들어 두고 다음 사이클에 재사용합니다.
+        """
+        key = (crawler_class.__name__, keyword, sitename)
+        crawler = self.crawlers.get(key)
+        if crawler is None:
+            crawler = (
+                crawler_class() if keyword is None else crawler_class(keyword=keyword)
+            )
+            self.crawlers[key] = crawler
+        else:
+            crawler.reset()
+        if keyword is None:
+            crawler.seen_ids = self.feed_seen(feed_keywords or [], sitename)
+            return crawler
+        state = self.data_manager.keyword_state.get((keyword, sitename))
+        crawler.seen_ids = SeenIndex.from_state(state.seen_ids if state else None)
+        return crawler
+
+    def is_due(
+        self,
+        keyword: str,
+        sitename: str,
+    ) -> bool:
+        """적응형 크롤링 사용 시 다음 크롤링 시각이 된 키워드-사이트인지 확인합니다."""
+        due = self.polling.is_due(
+            self.data_manager.keyword_state.get((keyword, sitename))
+        )
+        if not due:
+            logger.info(f"[{keyword}] {sitename} 다음 크롤링 시각 전이라 건너뜀")
+        return due
+
+    def finish(
+        self,
+        keywords: list,
+        proxy_manager: ProxyManager,
+    ):
+        """사이클 마무리 작업."""
+        self.data_manager.data_cleaner(keywords + self.feed_state_keywords(keywords))
+        self.data_manager.flush()
+        self.deduplicator.flush()
+        self.notification_manager.flush()
+        self.rule_engine.clear_cache()
+        self.price_history.compact()
+        proxy_manager.save_stats()
+        HttpCache().flush()
+        HttpCache().log_stats()
+        HttpClient().log_stats()
+        RateLimiter().log_stats()
+
+    def route_feed(
+        self,
+        products: List[KeywordData],
+        matcher: KeywordMatcher,
+        sitename: str,
+    ):
+        """피드 상품을 키워드별로 나누어 각각 갱신 여부를 판단합니다."""
+        self.remember_feed(products, matcher.keywords, sitename)
+        matched = matcher.match_items(products)
+        logger.info(f"{sitename} 피드 상품 {len(products)}개 매칭 완료")
+        for keyword, keyword_products in matched.items():
+            self.process_products(
+                products=keyword_products,
+                keyword=keyword,
+                sitename=sitename,
+            )
+
+    def feed_state_keyword(
+        self,
+        keywords: List[str],
+    ) -> str:
+        """keywords를 대상으로 한 피드 실행의 본 글 기록 상태 키.
+
+        모든 키워드를 다루는 실행은 __feed__를 쓰고, 스케줄별 실행이나 추가된 키워드 실행처럼
+        일부 키워드만 다루는 실행은 키워드 묶음별 키를 씁니다.
+        """
+        if set(self.data_manager.data.keyword) <= set(keywords):
+            return FEED_STATE_KEYWORD
+        scope = json.dumps(sorted(set(keywords)), ensure_ascii=False)
+        return f"{FEED_STATE_KEYWORD}:{scope}"
+
+    def feed_scope(
+        self,
+        state_keyword: str,
+    ) -> Optional[Set[str]]:
+        """피드 상태 키가 다루는 키워드 묶음 (__feed__는 None으로 전체를 뜻함)."""
+        if state_keyword == FEED_STATE_KEYWORD:
+            return None
+        try:
+            return set(json.loads(state_keyword[len(FEED_STATE_KEYWORD) + 1 :]))
+        except (json.JSONDecodeError, TypeError):
+            return set()
+
+    def feed_states(
+        self,
+        sitename: Optional[str] = None,
+    ) -> Dict[Tuple[str, str], Optional[Set[str]]]:
+        """저장된 피드 상태 키와 각 키가 다루는 키워드 묶음."""
+        return {
+            key: self.feed_scope(key[0])
+            for key in self.data_manager.keyword_state
+            if (
+                key[0] == FEED_STATE_KEYWORD
+                or key[0].startswith(FEED_STATE_KEYWORD + ":")
+            )
+            and (sitename is None or key[1] == sitename)
+        }
+
+    def feed_state_keywords(
+        self,
+        keywords: List[str],
+    ) -> List[str]:
+        """정리 단계에서 남길 피드 상태 키 (삭제된 키워드가 섞인 묶음의 키는 버림)."""
+        keep = {FEED_STATE_KEYWORD}
+        for key, scope in self.feed_states().items():
+            if scope is not None and scope <= set(keywords):
+                keep.add(key[0])
+        return sorted(keep)
+
+    def feed_seen(
+        self,
+        keywords: List[str],
+        sitename: str,
+    ) -> SeenIndex:
+        """keywords 모두에 대해 이미 매칭을 마친 피드 글 ID.
+
+        keywords를 모두 포함하는 실행(__feed__ 또는 더 큰 키워드 묶음)이 본 글만 본 것으로 보므로,
+        대상 키워드 각각이 마지막으로 피드를 본 지점까지 페이지를 이어서 가져옵니다.
+        """
+        targets = set(keywords)
+        ids = []
+        for key, scope in self.feed_states(sitename).items():
+            if scope is None or targets <= scope:
+                ids.extend(
+                    SeenIndex.from_state(self.data_manager.keyword_state[key].seen_ids)
+                )
+        return SeenIndex(ids, limit=max(len(ids), 1))
+
+    def remember_feed(
+        self,
+        products: List[KeywordData],
+        keywords: List[str],
+        sitename: str,
+    ):
+        """피드에서 본 글 ID를 이번 실행의 키워드 묶음 상태에 기록합니다.
+
+        일부 키워드만 다룬 실행이 __feed__를 앞당기면 다음 전체 실행이 나머지 키워드에 맞는 글을
+        건너뛰므로, 실행마다 자신이 다룬 키워드 묶음의 기록만 갱신합니다.
+        이번 실행에 포함되는 더 작은 묶음의 기록은 이 기록으로 대신할 수 있어 지웁니다.
+        """
+        if not products:
+            return
+        state_keyword = self.feed_state_keyword(keywords)
+        targets = self.feed_scope(state_keyword)
+        for key, scope in self.feed_states(sitename).items():
+            if key[0] != state_keyword and scope is not None:
+                if targets is None or scope <= targets:
+                    self.data_manager.remove_keyword_data(*key)
+        state = self.data_manager.keyword_state.get((state_keyword, sitename))
+        seen = SeenIndex.from_state(state.seen_ids if state else None)
+        ids = [product.current_id for product in products]
+        if all(post_id in seen for post_id in ids):
+            return
+        self.data_manager.update_keyword_data(
+            keyword=state_keyword,
+            sitename=sitename,
+            keyword_data=KeywordData(
+                current_id=ids[0],
+                seen_ids=seen.add_newest_first(ids).to_state(),
+            ),
+        )
 
     def excute(
         self,
@@ -55,7 +483,21 @@ class App:
     ):
         # 크롤링 실행
         products: List[KeywordData] = crwaler.fetchparse()
+        self.process_products(
+            products=products,
+            keyword=keyword,
+            sitename=sitename,
+        )
+
+        # 메모리 초기화
+        del crwaler
 
+    def process_products(
+        self,
+        products: List[KeywordData],
+        keyword: str,
+        sitename: str,
+    ):
         # 기존 사이트 - 키워드 데이터 로드
         keyword_data: KeywordData = self.data_manager.load_keyword_data(
             keyword=keyword, sitename=sitename
@@ -67,15 +509,23 @@ class App:
             # 기존의 keyword data를 확인하기 위해 로그를 남긴다.
             logger.info(f"[{keyword}] 기존 데이터: {keyword_data}")
             if not keyword_data.current_id:
-                self.data_manager.update_keyword_data(
+                self.save_state(
                     keyword=keyword,
-                    keyword_data=KeywordData(current_id="1"),
                     sitename=sitename,
+                    previous=keyword_data,
+                    current=KeywordData(current_id="1"),
                 )
-                del crwaler
+            elif self.polling.enabled:
+                self.save_state(keyword, sitename, keyword_data, keyword_data)
             return
 
-        new_keyword_data: KeywordData = products[0]
+        # 크롤링한 모든 상품의 가격을 기록하고(이미 본 상품은 가격이 바뀐 경우만),
+        # 기록 전 최저가 이하인 상품을 표시
+        lowest = self.price_history.record(keyword, sitename, products)
+
+        # 크롤러 결과(캐시에 보관될 수 있음)는 그대로 두고 복사본을 상태로 저장
+        new_keyword_data: KeywordData = replace(products[0])
+        seen = SeenIndex.from_state(keyword_data.seen_ids)
 
         # 사이트 데이터 저장
         mode = "initial"
@@ -85,35 +535,90 @@ class App:
             logger.info(f"[{keyword}] 검색된 상품이 있고, 최초 알림임")
             mode = "initial"
             updates = products
-        # 최초 실행이 아니고 갱신된 내용이 없는 경우
-        elif keyword_data.current_id == new_keyword_data.current_id:
-            logger.info(f"[{keyword}] 갱신된 내용 없음")
-            # 갱신된 내용 없음
-            return
-        # 최초 실행이 아니고 갱신된 내용이 있는 경우
         else:
             mode = "updates"
+            # 본 상품 기록이 있으면 기록에 없는 상품만 새 상품으로 판단
+            if len(seen):
+                updates = [
+                    product for product in products if product.current_id not in seen
+                ]
+            # 본 상품 기록이 없는 기존 상태는 저장된 current_id까지를 새 상품으로 판단
+            else:
+                for product in products:
+                    if product.current_id == keyword_data.current_id:
+                        break
+                    updates.append(product)
+
+            # 최초 실행이 아니고 갱신된 내용이 없는 경우
+            if not updates:
+                logger.info(f"[{keyword}] 갱신된 내용 없음")
+                # 갱신된 내용 없음 (본 상품 기록을 처음 만들거나, 적응형 크롤링 사용 시 다음 크롤링 시각만 갱신)
+                if self.polling.enabled or not len(seen):
+                    keyword_data.seen_ids = seen.add_newest_first(
+                        [product.current_id for product in products]
+                    ).to_state()
+                    self.save_state(keyword, sitename, keyword_data, keyword_data)
+                return
+
+            # 최초 실행이 아니고 갱신된 내용이 있는 경우
             logger.info(f"[{keyword}] 갱신된 내용 있음")
-            # 갱신된 내용 처리
-            for product in products:
-                if product.current_id == keyword_data.current_id:
-                    break
+            for product in updates:
                 logger.info(f"[{keyword}] 새로운 상품: {product.current_title}")
-                updates.append(product)
+            self.polling.record_history(keyword, sitename, updates)
+
+        new_keyword_data.seen_ids = seen.add_newest_first(
+            [product.current_id for product in products]
+        ).to_state()
 
         # 첫 번째 데이터로 JSON 갱신
-        self.data_manager.update_keyword_data(
+        self.save_state(
             keyword=keyword,
-            keyword_data=new_keyword_data,
             sitename=sitename,
+            previous=keyword_data,
+            current=new_keyword_data,
+            new_items=len(updates) if mode == "updates" else 0,
         )
 
+        # 키워드 알림 규칙(제외 단어, 가격 범위 등)에 맞지 않는 상품은 알리지 않음
+        # (본 상품 기록에는 남겨 다음 사이클에 다시 새 상품으로 보지 않음)
+        updates = self.rule_engine.filter(keyword, updates)
+        if mode == "initial":
+            # 등록 알림은 첫 상품 하나만 보여주므로 그 상품만 지문을 남기고,
+            # 이미 알린 딜이어도 등록 완료 알림은 항상 보냄
+            updates = updates[:1]
+            self.deduplicator.filter(keyword, updates)
+        else:
+            if not updates:
+                logger.info(f"[{keyword}] 알림 규칙에 맞는 새 상품이 없습니다.")
+                return
+
+            # 다른 키워드/사이트에서 이미 알린 딜은 제외
+            updates = self.deduplicator.filter(keyword, updates)
+            if not updates:
+                logger.info(f"[{keyword}] 새 상품이 모두 이미 알린 딜입니다.")
+                return
+
         # 알림 출력
         self.notification_manager.notify(
             updates=updates,
             keyword=keyword,
             mode=mode,
+            lowest=lowest,
         )
 
-        # 메모리 초기화
-        del crwaler
+    def save_state(
+        self,
+        keyword: str,
+        sitename: str,
+        previous: KeywordData,
+        current: KeywordData,
+        new_items: int = 0,
+    ):
+        """새 상태를 저장합니다. 적응형 크롤링 사용 시 다음 크롤링 시각도 함께 기록합니다."""
+        if self.polling.enabled:
+            self.polling.observe(previous, current, new_items)
+        self.data_manager.update_keyword_data(
+            keyword=keyword,
+            keyword_data=current,
+            sitename=sitename,
+        )
@@ -1,22 +1,67 @@
+import asyncio
+import codecs
+import os
+import time
 from abc import ABC, abstractmethod
-from typing import List
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlparse
 
 import requests
 
 from models.keyword_data import KeywordData
 from modules import logger
+from modules.http_cache import HttpCache
+from modules.http_client import HttpClient
+from modules.keyword_matcher import KeywordMatcher
+from modules.metrics import Metrics
+from modules.parser_backend import resolve_backend
 from modules.proxy_manager import ProxyManager
+from modules.rate_limiter import RateLimiter
+from modules.seen_index import SeenIndex
+from modules.stream_parser import ItemStreamParser, OpenElement
+
+# 스트리밍 파싱 시 파서에 한 번에 넣는 최대 글자 수 (이 단위로 멈출 수 있음)
+STREAM_FEED_SIZE = 2048
 
 
 class BaseCrawler(ABC):
     """크롤러의 기본 추상 클래스."""
 
+    # 상품 목록 영역만 점진적으로 파싱하는 스트리밍 모드 지원 여부 (is_stream_item 구현 필요)
+    streamable = False
+
     def __init__(
         self,
-        keyword: str,
+        keyword: Optional[str] = None,
     ):
         self.keyword = keyword
         self.proxy_manager: ProxyManager = ProxyManager()
+        self.http_client: HttpClient = HttpClient()
+        self.parser_backend: str = resolve_backend()
+        self.http_cache: HttpCache = HttpCache()
+        self.rate_limiter: RateLimiter = RateLimiter()
+        self.metrics: Metrics = Metrics()
+        # 304 응답을 받은 URL, 200 응답의 ETag/Last-Modified
+        self.not_modified_urls = set()
+        self.validators: Dict[str, Dict[str, str]] = {}
+        self.results = []
+        # 이전 사이클까지 본 상품 ID (App이 상태에서 채워 넣음)
+        self.seen_ids: SeenIndex = SeenIndex()
+        # 새 상품이 이어지는 동안 가져올 최대 페이지 수
+        self.max_pages = int(os.getenv("CRAWL_MAX_PAGES", "3"))
+        # 이미 본 상품이 이만큼 연속되면 그 뒤는 모두 본 상품으로 보고 멈춤
+        self.stop_after_seen = max(int(os.getenv("CRAWL_STOP_SEEN", "2")), 1)
+        # 본문을 조각으로 받으며 파싱하고, 필요한 상품까지만 받으면 연결을 끊음
+        self.streaming = os.getenv("STREAM_FETCH", "false").lower() == "true"
+        self.stream_chunk_size = int(os.getenv("STREAM_CHUNK_SIZE", "16384"))
+
+    def reset(
+        self,
+    ):
+        """사이클마다 새로 채우는 값을 비웁니다 (크롤러를 다음 사이클에 재사용할 때)."""
+        self.not_modified_urls = set()
+        self.validators = {}
         self.results = []
 
     @property
@@ -27,27 +72,128 @@ class BaseCrawler(ABC):
         """크롤링 대상 URL (하위 클래스에서 구현 필수)."""
         pass
 
-    @abstractmethod
+    def page_url(
+        self,
+        page: int,
+    ) -> Optional[str]:
+        """page번째(1부터) 페이지 URL. 페이지를 지원하지 않으면 None (필요 시 오버라이드)."""
+        return self.url if page == 1 else None
+
+    @property
+    def host(
+        self,
+    ) -> str:
+        """호스트별 동시 실행 제한에 사용하는 호스트명."""
+        return urlparse(self.url).netloc
+
     def parse(
         self,
         html: str,
     ) -> List[KeywordData]:
-        """파싱 로직 (사이트별 구현 필요)."""
+        """파싱 로직 (parser_backend에 따라 lxml 또는 BeautifulSoup 구현을 사용)."""
+        if self.parser_backend == "lxml":
+            return self.parse_lxml(html)
+        return self.parse_bs4(html)
+
+    @abstractmethod
+    def parse_bs4(
+        self,
+        html: str,
+    ) -> List[KeywordData]:
+        """BeautifulSoup 파싱 로직 (사이트별 구현 필요)."""
         pass
 
+    def parse_lxml(
+        self,
+        html: str,
+    ) -> List[KeywordData]:
+        """lxml 파싱 로직 (구현하지 않은 사이트는 BeautifulSoup 구현을 사용)."""
+        return self.parse_bs4(html)
+
+    def relevant_content(
+        self,
+        html: str,
+    ) -> str:
+        """변경 여부 판단에 사용할 본문 영역 (기본은 전체, 필요 시 오버라이드)."""
+        return html
+
+    def is_stream_item(
+        self,
+        tag: str,
+        attrs: Dict[str, Optional[str]],
+        parents: List[OpenElement],
+    ) -> bool:
+        """스트리밍 파싱에서 상품 하나를 이루는 요소인지 여부 (streamable인 사이트에서 구현)."""
+        return False
+
+    def stream_start_marker(
+        self,
+    ) -> Optional[str]:
+        """상품 목록이 시작되는 곳의 문자열. 이 앞부분은 파싱하지 않고 건너뜁니다 (없으면 None)."""
+        return None
+
+    def stream_document(
+        self,
+        items_html: str,
+    ) -> str:
+        """모아 둔 상품 요소들을 parse가 읽을 수 있는 문서로 감쌉니다 (필요 시 오버라이드)."""
+        return f"<ul>{items_html}</ul>"
+
+    def _direct_get(
+        self,
+        url: str,
+        timeout: float,
+        headers: Optional[Dict[str, str]],
+        stream: bool = False,
+    ) -> requests.Response:
+        """속도 제한을 지키며 직접 요청합니다 (요청 과다 응답은 한 번 더 요청)."""
+        host = urlparse(url).netloc
+        for attempt in range(2):
+            # 호스트별 요청 속도 제한 (동시 크롤링 시에도 호스트 단위로 공유)
+            self.rate_limiter.acquire(host)
+            with self.metrics.timer("hotdeal_fetch_seconds", host=host):
+                response = self.http_client.get(
+                    url,
+                    timeout=timeout,
+                    headers=headers,
+                    stream=stream,
+                )
+            self.metrics.inc(
+                "hotdeal_http_responses_total",
+                host=host,
+                status=response.status_code,
+            )
+            self.rate_limiter.record(
+                host,
+                response.status_code,
+                retry_after=response.headers.get("Retry-After"),
+            )
+            # 요청 과다(429/430)는 Retry-After만큼 기다렸다가 한 번 더 직접 요청
+            if attempt or not self.rate_limiter.should_retry(
+                host, response.status_code
+            ):
+                break
+            logger.warning(
+                f"{response.status_code}: 요청 과다, 잠시 후 다시 요청합니다."
+            )
+            response.close()
+        return response
+
     def fetch(
         self,
         url: str = None,
         timeout: int = 10,
+        headers: Optional[Dict[str, str]] = None,
     ) -> str:
         """HTML 가져오기 (프록시 포함)."""
         target_url = url or self.url  # url이 명시되지 않으면 기본적으로 self.url 사용
+        host = urlparse(target_url).netloc
+        if not self.rate_limiter.direct_allowed(host):
+            logger.info(f"{host} 연속 차단 상태, 프록시로 바로 요청합니다.")
+            return self._fetch_with_proxy(target_url, headers=headers)
         logger.info(f"요청: {target_url}")
         try:
-            response = requests.get(
-                target_url,
-                timeout=timeout,
-            )
+            response = self._direct_get(target_url, timeout, headers)
             # 알구몬의 경우 오라클 클라우드 ip에 대해 403이 뜨고, FMKorea의 경우 잦은 요청에 대해 430이 발생하는 경우가 있어 예외처리
             if response.status_code == 403 or response.status_code == 430:
                 # 430인 경우 에러 전체 내용을 출력한다.
@@ -57,48 +203,449 @@ class BaseCrawler(ABC):
                     f"{response.status_code}: 접근이 차단되었습니다. 프록시로 재시도합니다."
                 )
                 # 403이 발생하면 프록시를 사용하여 재시도
-                return self._fetch_with_proxy(target_url, timeout)
+                return self._fetch_with_proxy(target_url, headers=headers)
 
             response.raise_for_status()
             logger.info(f"요청 성공: {target_url}")
-            return response.text
+            return self._handle_response(target_url, response)
 
         except requests.exceptions.RequestException as e:
             logger.error(f"요청 실패: {e}")
+            self.metrics.inc("hotdeal_fetch_errors_total", host=host)
+            return None
+
+    def _handle_response(
+        self,
+        url: str,
+        response: requests.Response,
+    ) -> Optional[str]:
+        """304이면 not_modified_urls에 기록하고, 200이면 검증값을 보관합니다."""
+        if response.status_code == 304:
+            logger.info(f"변경 없음(304): {url}")
+            self.not_modified_urls.add(url)
+            return None
+        self.validators[url] = {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+        }
+        self.metrics.inc(
+            "hotdeal_response_bytes_total",
+            len(response.content),
+            host=urlparse(url).netloc,
+        )
+        return response.text
+
+    def _request_via_proxy(
+        self,
+        url: str,
+        proxy: str,
+        timeout: float,
+        headers: Optional[Dict[str, str]],
+    ) -> Optional[requests.Response]:
+        """프록시 하나로 요청하고 결과를 프록시 점수에 반영합니다."""
+        start = time.monotonic()
+        try:
+            response = self.http_client.get(
+                url,
+                proxy=proxy,
+                timeout=timeout,
+                headers=headers,
+            )
+        except requests.exceptions.RequestException:
+            logger.warning(f"프록시 {proxy}로 요청 실패")
+            self.proxy_manager.record(proxy, success=False)
             return None
+        if response.status_code in (200, 304):
+            self.proxy_manager.record(
+                proxy, success=True, latency=time.monotonic() - start
+            )
+            return response
+        logger.warning(f"프록시 {proxy}에서 {response.status_code} 발생")
+        self.proxy_manager.record(proxy, success=False)
+        response.close()
+        return None
+
+    @staticmethod
+    def _close_response(
+        future: Future,
+    ):
+        """경쟁 요청이 끝나면 응답을 닫아 커넥션을 풀에 돌려줍니다."""
+        if future.cancelled() or future.exception() is not None:
+            return
+        response = future.result()
+        if response is not None:
+            response.close()
 
     def _fetch_with_proxy(
         self,
         url: str,
-        timeout: int = 100,
+        timeout: float = None,
+        headers: Optional[Dict[str, str]] = None,
     ):
-        """프록시를 사용하여 HTML 가져오기."""
-        for proxy in self.proxy_manager.proxies:
+        """프록시를 사용하여 HTML 가져오기.
+
+        점수가 높은 프록시부터 PROXY_RACE_SIZE개씩 동시에 요청하여 가장 먼저 성공한 응답을 사용합니다.
+        """
+        host = urlparse(url).netloc
+        self.metrics.inc("hotdeal_proxy_fallback_total", host=host)
+        with self.metrics.timer("hotdeal_proxy_fetch_seconds", host=host):
+            return self._race_proxies(url, timeout, headers)
+
+    def _race_proxies(
+        self,
+        url: str,
+        timeout: float = None,
+        headers: Optional[Dict[str, str]] = None,
+    ):
+        timeout = timeout or float(os.getenv("PROXY_TIMEOUT", "15"))
+        race_size = max(int(os.getenv("PROXY_RACE_SIZE", "3")), 1)
+        ranked = self.proxy_manager.get_proxies()
+        for offset in range(0, len(ranked), race_size):
+            batch = ranked[offset : offset + race_size]
+            executor = ThreadPoolExecutor(
+                max_workers=len(batch), thread_name_prefix="proxy-race"
+            )
+            futures = [
+                executor.submit(self._request_via_proxy, url, proxy, timeout, headers)
+                for proxy in batch
+            ]
             try:
-                response = requests.get(
-                    url,
-                    proxies={"http": proxy, "https": proxy},
-                    timeout=timeout,
-                )
-                if response.status_code == 403 or response.status_code == 430:
-                    logger.warning(f"프록시 {proxy}에서 {response.status_code} 발생")
-                    continue  # 다음 프록시로 재시도
-                elif response.status_code == 200:
-                    logger.info(f"프록시 {proxy}로 요청 성공")
-                    return response.text
-            except requests.exceptions.RequestException:
-                # 에러 전체 내용 기록
-                logger.warning(f"프록시 {proxy}로 요청 실패")
+                for future in as_completed(futures):
+                    response = future.result()
+                    if response is not None:
+                        logger.info(f"프록시 요청 성공 ({offset + 1}번째 그룹)")
+                        return self._handle_response(url, response)
+            finally:
+                # 먼저 성공한 응답이 있으면 나머지 요청은 기다리지 않고,
+                # 진행 중인 요청은 끝나는 대로 응답을 닫는다 (이미 끝났으면 바로 닫음).
+                for future in futures:
+                    future.add_done_callback(self._close_response)
+                executor.shutdown(wait=False, cancel_futures=True)
         logger.error("모든 프록시를 사용했지만 요청에 실패했습니다.")
         return None
 
+    def _parse_stream(
+        self,
+        parser: ItemStreamParser,
+        text: str,
+    ) -> Iterator[Tuple[List[KeywordData], float]]:
+        """text를 STREAM_FEED_SIZE(또는 더 작은 STREAM_CHUNK_SIZE) 글자씩 파서에 넣으며, 그 사이 완성된 상품 요소들을
+        한 번에 파싱해 (상품 목록, 걸린 시간)을 돌려줍니다.
+
+        받은 조각 전체를 한 번에 넣지 않으므로 호출자가 멈추거나 상품 목록이 끝나면
+        나머지는 토큰으로 나누지 않습니다.
+        """
+        size = min(self.stream_chunk_size, STREAM_FEED_SIZE)
+        for offset in range(0, max(len(text), 1), size):
+            start = time.perf_counter()
+            parser.feed(text[offset : offset + size])
+            fragments = parser.take()
+            items = (
+                self.parse(self.stream_document("".join(fragments)))
+                if fragments
+                else []
+            )
+            yield items, time.perf_counter() - start
+            if parser.done:
+                return
+
+    def _iter_stream(
+        self,
+        url: str,
+        response: requests.Response,
+        started: float,
+    ) -> Iterator[KeywordData]:
+        host = urlparse(url).netloc
+        parser = ItemStreamParser(self.is_stream_item, self.stream_start_marker())
+        # requests의 response.text와 같은 인코딩으로 조각 경계에 걸친 글자도 이어서 해석
+        decoder = codecs.getincrementaldecoder(response.encoding or "utf-8")(
+            errors="replace"
+        )
+        received = 0
+        parse_time = 0.0
+        first = True
+        try:
+            for chunk in response.iter_content(chunk_size=self.stream_chunk_size):
+                received += len(chunk)
+                for items, elapsed in self._parse_stream(parser, decoder.decode(chunk)):
+                    parse_time += elapsed
+                    if items and first:
+                        first = False
+                        self.metrics.observe(
+                            "hotdeal_first_item_seconds",
+                            time.perf_counter() - started,
+                            host=host,
+                        )
+                    yield from items
+                if parser.done:
+                    break
+            else:
+                for items, elapsed in self._parse_stream(
+                    parser, decoder.decode(b"", final=True)
+                ):
+                    parse_time += elapsed
+                    yield from items
+                parser.close()
+                for items, elapsed in self._parse_stream(parser, ""):
+                    parse_time += elapsed
+                    yield from items
+        finally:
+            # 상품 목록이 끝났거나 호출자가 멈추면 나머지 본문은 받지 않는다
+            response.close()
+            self.metrics.inc("hotdeal_response_bytes_total", received, host=host)
+            self.metrics.observe("hotdeal_parse_seconds", parse_time, host=host)
+
+    def _iter_html(
+        self,
+        html: str,
+    ) -> Iterator[KeywordData]:
+        """이미 받은 본문(프록시 응답)도 같은 방식으로 필요한 곳까지만 파싱합니다."""
+        parser = ItemStreamParser(self.is_stream_item, self.stream_start_marker())
+        for items, _ in self._parse_stream(parser, html):
+            yield from items
+        if not parser.done:
+            parser.close()
+            for items, _ in self._parse_stream(parser, ""):
+                yield from items
+
+    def stream(
+        self,
+        url: str,
+        timeout: int = 10,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Optional[Iterator[KeywordData]]:
+        """요청을 보내고, 본문을 조각으로 받으며 완성되는 상품을 차례로 돌려주는 이터레이터를 반환합니다.
+
+        응답 코드 처리는 fetch와 같고(차단 시 프록시), 실패하거나 304이면 None을 반환합니다.
+        """
+        host = urlparse(url).netloc
+        started = time.perf_counter()
+        if not self.rate_limiter.direct_allowed(host):
+            logger.info(f"{host} 연속 차단 상태, 프록시로 바로 요청합니다.")
+            html = self._fetch_with_proxy(url, headers=headers)
+            return self._iter_html(html) if html else None
+        logger.info(f"요청(스트리밍): {url}")
+        try:
+            response = self._direct_get(url, timeout, headers, stream=True)
+        except requests.exceptions.RequestException as e:
+            logger.error(f"요청 실패: {e}")
+            self.metrics.inc("hotdeal_fetch_errors_total", host=host)
+            return None
+        if response.status_code == 403 or response.status_code == 430:
+            response.close()
+            logger.warning(
+                f"{response.status_code}: 접근이 차단되었습니다. 프록시로 재시도합니다."
+            )
+            html = self._fetch_with_proxy(url, headers=headers)
+            return self._iter_html(html) if html else None
+        if response.status_code == 304 or response.status_code >= 400:
+            response.close()
+            if response.status_code == 304:
+                return self._handle_response(url, response)
+            logger.error(f"요청 실패: HTTP {response.status_code} ({url})")
+            self.metrics.inc("hotdeal_fetch_errors_total", host=host)
+            return None
+        self.validators[url] = {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+        }
+        return self._iter_stream(url, response, started)
+
+    def stream_items(
+        self,
+        url: str,
+    ) -> Optional[List[KeywordData]]:
+        """스트리밍 모드의 fetch_items.
+
+        이미 본 상품이 stop_after_seen개 이어지면 그 뒤는 받지 않고 연결을 끊습니다.
+        304이면 캐시된 결과를 사용하며, 본문 해시 비교는 하지 않습니다 (본문을 끝까지 받지 않으므로).
+        """
+        host = urlparse(url).netloc
+        items = self.stream(url, headers=self.http_cache.conditional_headers(url))
+        if url in self.not_modified_urls:
+            cached = self.http_cache.not_modified(url)
+            if cached is not None:
+                self.metrics.inc("hotdeal_parse_skipped_total", host=host)
+                return cached
+            items = self.stream(url)
+        if items is None:
+            return None
+
+        results = []
+        seen_run = 0
+        try:
+            for item in items:
+                results.append(item)
+                seen_run = seen_run + 1 if item.current_id in self.seen_ids else 0
+                if seen_run >= self.stop_after_seen:
+                    logger.info(f"이미 본 상품에 도달하여 수신 중단: {url}")
+                    self.metrics.inc("hotdeal_stream_early_stop_total", host=host)
+                    break
+        except requests.exceptions.RequestException as e:
+            logger.error(f"본문 수신 실패: {e}")
+            self.metrics.inc("hotdeal_fetch_errors_total", host=host)
+            return None
+        finally:
+            items.close()
+        self.metrics.observe("hotdeal_items_per_page", len(results), host=host)
+        validators = self.validators.pop(url, None)
+        # 검증값이 있을 때만 다음 304 응답에 쓸 결과를 저장
+        if validators and (validators["etag"] or validators["last_modified"]):
+            self.http_cache.store(url, None, results, validators=validators)
+        return results
+
+    def fetch_items(
+        self,
+        url: str = None,
+    ) -> Optional[List[KeywordData]]:
+        """URL을 가져와 파싱합니다. 내용이 바뀌지 않았으면 파싱 없이 캐시된 결과를 반환합니다."""
+        target_url = url or self.url
+        if self.streaming and self.streamable:
+            return self.stream_items(target_url)
+        started = time.perf_counter()
+        html = self.fetch(
+            url=target_url,
+            headers=self.http_cache.conditional_headers(target_url),
+        )
+        if target_url in self.not_modified_urls:
+            cached = self.http_cache.not_modified(target_url)
+            if cached is not None:
+                self.metrics.inc(
+                    "hotdeal_parse_skipped_total",
+                    host=urlparse(target_url).netloc,
+                )
+                return cached
+            # 캐시가 비어 있으면 조건 없이 다시 요청
+            html = self.fetch(url=target_url)
+        if not html:
+            return None
+
+        validators = self.validators.pop(target_url, None)
+        digest = self.http_cache.digest(self.relevant_content(html))
+        cached = self.http_cache.unchanged(target_url, digest, validators)
+        if cached is not None:
+            logger.info(f"내용 변경 없음, 파싱 생략: {target_url}")
+            self.metrics.inc(
+                "hotdeal_parse_skipped_total", host=urlparse(target_url).netloc
+            )
+            return cached
+
+        host = urlparse(target_url).netloc
+        with self.metrics.timer("hotdeal_parse_seconds", host=host):
+            results = self.parse(html)
+        if results:
+            self.metrics.observe(
+                "hotdeal_first_item_seconds", time.perf_counter() - started, host=host
+            )
+        self.metrics.observe("hotdeal_items_per_page", len(results), host=host)
+        self.http_cache.store(
+            target_url,
+            digest,
+            results,
+            validators=validators,
+            size=len(html),
+        )
+        return results
+
+    def iter_pages(
+        self,
+    ) -> Iterator[List[KeywordData]]:
+        """페이지를 필요할 때 하나씩 가져와 파싱합니다."""
+        for page in range(1, self.max_pages + 1):
+            url = self.page_url(page)
+            if url is None:
+                return
+            items = self.fetch_items(url=url)
+            if items is None:
+                logger.error(f"크롤링 실패: {url}")
+                return
+            yield items
+
+    def fetch_pages(
+        self,
+    ) -> Optional[List[KeywordData]]:
+        """새 상품이 이어지는 동안만 다음 페이지를 가져옵니다.
+
+        한 페이지가 모두 이미 본 상품이거나 본 상품이 stop_after_seen개 이어지는 곳(이전 수집 지점)에
+        도달하면 멈추고, 본 상품 기록이 없으면 첫 페이지만 가져옵니다.
+        첫 페이지부터 실패하면 None을 반환합니다.
+        """
+        items = None
+        collected_ids = set()
+        for page, page_items in enumerate(self.iter_pages(), start=1):
+            items = items or []
+            fresh = False
+            seen_run = 0
+            reached_seen = False
+            for item in page_items:
+                # 수집 도중 글이 밀려 페이지 사이에 중복된 항목은 제외
+                if item.current_id in collected_ids:
+                    continue
+                collected_ids.add(item.current_id)
+                items.append(item)
+                if item.current_id in self.seen_ids:
+                    seen_run += 1
+                    reached_seen = reached_seen or seen_run >= self.stop_after_seen
+                else:
+                    seen_run = 0
+                    fresh = True
+            if not fresh or reached_seen or not len(self.seen_ids):
+                break
+            if page < self.max_pages:
+                logger.info(f"새 상품이 이어져 다음 페이지를 가져옵니다: {self.url}")
+        return items
+
     def fetchparse(
         self,
     ) -> List[KeywordData]:
         """크롤링 실행 (필요 시 오버라이드)."""
-        html = self.fetch()
-        if html:
-            self.results = self.parse(html)
+        results = self.fetch_pages()
+        if results is not None:
+            self.results = results
         else:
             logger.error(f"크롤링 실패: {self.url}")
         return self.results
+
+    async def afetch(
+        self,
+        url: str = None,
+        timeout: int = 10,
+    ) -> str:
+        """비동기 HTML 가져오기 (fetch를 작업 스레드에서 실행)."""
+        return await asyncio.to_thread(self.fetch, url, timeout)
+
+    async def afetchparse(
+        self,
+    ) -> List[KeywordData]:
+        """비동기 크롤링 실행 (fetchparse를 작업 스레드에서 실행)."""
+        return await asyncio.to_thread(self.fetchparse)
+
+
+class FeedCrawler(BaseCrawler):
+    """사이트 목록(피드)을 사이클당 한 번만 가져와 모든 키워드에 매칭하는 크롤러.
+
+    키워드 수와 관계없이 요청 수가 일정하게 유지됩니다.
+    """
+
+    def fetch_feed(
+        self,
+    ) -> List[KeywordData]:
+        """새 글이 이어지는 페이지까지만 가져와 한 번씩만 파싱합니다."""
+        self.results = self.fetch_pages() or []
+        return self.results
+
+    def match(
+        self,
+        matcher: KeywordMatcher,
+    ) -> Dict[str, List[KeywordData]]:
+        """이미 가져온 피드를 키워드별로 나눕니다."""
+        return matcher.match_items(self.results)
+
+    def fetchparse(
+        self,
+    ) -> List[KeywordData]:
+        """키워드가 없으면 피드 전체를, 있으면 해당 키워드에 매칭되는 상품만 반환합니다."""
+        self.fetch_feed()
+        if self.keyword is None:
+            return self.results
+        return self.match(KeywordMatcher([self.keyword])).get(self.keyword, [])
@@ -0,0 +1,89 @@
+import os
+import threading
+from typing import Callable, Optional, Tuple
+
+from modules import logger
+
+# 파일 상태 (수정 시각 ns, 크기, inode). 파일이 없으면 None
+Signature = Optional[Tuple[int, int, int]]
+
+
+class ConfigWatcher:
+    """설정 파일(data.json) 변경 감지.
+
+    os.stat의 수정 시각/크기/inode를 마지막으로 읽어 들인 시점과 비교합니다.
+    start로 CONFIG_WATCH_INTERVAL초마다 확인하는 스레드를 띄우면 변경 시 콜백을 호출하고,
+    스레드 없이 changed를 직접 호출해도 됩니다 (사이클 시작 시 확인).
+    """
+
+    def __init__(
+        self,
+        path: str,
+        interval: Optional[float] = None,
+    ):
+        self.path = path
+        self.interval = (
+            float(os.getenv("CONFIG_WATCH_INTERVAL", "5"))
+            if interval is None
+            else interval
+        )
+        self.loaded: Signature = None
+        self._notified: Signature = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def signature(self) -> Signature:
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+    def changed(
+        self,
+        signature: Signature = None,
+    ) -> bool:
+        """마지막으로 읽어 들인 뒤 파일이 바뀌었는지 여부."""
+        return (signature or self.signature()) != self.loaded
+
+    def mark_loaded(
+        self,
+        signature: Signature,
+    ):
+        """signature 시점의 파일을 읽어 들였음을 기록합니다 (읽기 전에 구한 값을 넘김)."""
+        self.loaded = signature
+
+    def _watch(
+        self,
+        on_change: Callable[[], None],
+    ):
+        while not self._stop.wait(self.interval):
+            signature = self.signature()
+            # 같은 변경으로 콜백을 반복 호출하지 않도록 마지막 알림 시점과도 비교
+            if signature is None or signature in (self.loaded, self._notified):
+                continue
+            self._notified = signature
+            logger.info(f"설정 파일 변경 감지: {self.path}")
+            try:
+                on_change()
+            except Exception as e:
+                logger.error(f"설정 파일 변경 처리 중 오류: {e}")
+
+    def start(
+        self,
+        on_change: Callable[[], None],
+    ):
+        """백그라운드에서 파일 변경을 확인합니다 (CONFIG_WATCH_INTERVAL=0이면 사용 안 함)."""
+        if self.interval <= 0 or (self._thread and self._thread.is_alive()):
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._watch,
+            args=(on_change,),
+            name="config-watcher",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
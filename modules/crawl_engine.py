@@ -0,0 +1,93 @@
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from models.keyword_data import KeywordData
+from modules import logger
+from modules.base_crawler import BaseCrawler
+
+
+@dataclass
+class CrawlJob:
+    # 피드 작업(사이트 전체 목록)은 keyword가 None
+    keyword: Optional[str]
+    sitename: str
+    crawler: BaseCrawler
+
+
+class CrawlEngine:
+    """키워드×사이트 크롤링 작업을 동시에 실행하는 비동기 엔진.
+
+    전체 동시 실행 수와 호스트별 동시 실행 수를 세마포어로 제한합니다.
+    """
+
+    def __init__(
+        self,
+        concurrency: Optional[int] = None,
+        per_host_concurrency: Optional[int] = None,
+    ):
+        self.concurrency = concurrency or int(os.getenv("CRAWL_CONCURRENCY", "16"))
+        self.per_host_concurrency = per_host_concurrency or int(
+            os.getenv("CRAWL_PER_HOST_CONCURRENCY", "4")
+        )
+        self._global_semaphore: Optional[asyncio.Semaphore] = None
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    def _host_semaphore(
+        self,
+        host: str,
+    ) -> asyncio.Semaphore:
+        if host not in self._host_semaphores:
+            self._host_semaphores[host] = asyncio.Semaphore(self.per_host_concurrency)
+        return self._host_semaphores[host]
+
+    async def _run_job(
+        self,
+        job: CrawlJob,
+    ) -> List[KeywordData]:
+        async with self._global_semaphore:
+            async with self._host_semaphore(job.crawler.host):
+                try:
+                    return await job.crawler.afetchparse()
+                except Exception as e:
+                    logger.error(f"[{job.keyword}] {job.sitename} 크롤링 중 오류: {e}")
+                    return []
+
+    async def run(
+        self,
+        jobs: List[CrawlJob],
+        on_result: Callable[[CrawlJob, List[KeywordData]], Optional[Awaitable]],
+    ):
+        """모든 작업을 동시에 실행하고, 완료되는 순서대로 on_result를 호출합니다.
+
+        on_result는 이벤트 루프 스레드에서 호출되므로 상태 갱신이 직렬화됩니다.
+        """
+        if not jobs:
+            return
+
+        loop = asyncio.get_running_loop()
+        # asyncio.to_thread가 사용하는 기본 실행기의 크기를 동시 실행 수에 맞춘다.
+        executor = ThreadPoolExecutor(
+            max_workers=self.concurrency, thread_name_prefix="crawler"
+        )
+        loop.set_default_executor(executor)
+        self._global_semaphore = asyncio.Semaphore(self.concurrency)
+        self._host_semaphores = {}
+
+        async def run_and_tag(job: CrawlJob):
+            return job, await self._run_job(job)
+
+        logger.info(
+            f"크롤링 작업 {len(jobs)}개 실행 (동시 {self.concurrency}, 호스트별 {self.per_host_concurrency})"
+        )
+        tasks = [asyncio.create_task(run_and_tag(job)) for job in jobs]
+        for finished in asyncio.as_completed(tasks):
+            job, products = await finished
+            try:
+                result = on_result(job, products)
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception as e:
+                logger.error(f"[{job.keyword}] {job.sitename} 결과 처리 중 오류: {e}")
@@ -1,3 +1,4 @@
 from .algumon import AlgumonCrawler
+from .fmkorea import FMKoreaCrawler
 
 __all__ = ["AlgumonCrawler", "FMKoreaCrawler"]
@@ -1,21 +1,77 @@
+import os
 from datetime import datetime
-from typing import List
+from typing import Dict, List, Optional
 
 from bs4 import BeautifulSoup
 
 from models.keyword_data import KeywordData
 from modules import logger
 from modules.base_crawler import BaseCrawler
+from modules.parser_backend import (
+    compile_xpath,
+    element_classes,
+    parse_document,
+)
+
+# <ul class="product post-list"> 하위의 모든 <li>
+PRODUCT_ITEMS = compile_xpath(
+    "(//ul[normalize-space(@class)='product post-list'])[1]//li"
+)
 
 
 class AlgumonCrawler(BaseCrawler):
+    streamable = True
+
     @property
     def url(
         self,
     ) -> str:
-        return f"https://www.algumon.com/search/{self.keyword}"
+        # ALGUMON_BASE_URL: 벤치마크용 로컬 서버 등으로 요청 주소를 바꿀 때 사용
+        base_url = os.getenv("ALGUMON_BASE_URL", "https://www.algumon.com")
+        return f"{base_url.rstrip('/')}/search/{self.keyword}"
 
-    def parse(
+    def page_url(
+        self,
+        page: int,
+    ) -> Optional[str]:
+        return self.url if page == 1 else f"{self.url}?page={page}"
+
+    def relevant_content(
+        self,
+        html: str,
+    ) -> str:
+        # 헤더의 스크립트/토큰 등은 매번 달라질 수 있으므로 상품 리스트부터 비교
+        start = html.find('class="product post-list"')
+        return html[start:] if start >= 0 else html
+
+    def is_stream_item(
+        self,
+        tag: str,
+        attrs: Dict[str, Optional[str]],
+        parents: list,
+    ) -> bool:
+        # <ul class="product post-list"> 안의 상품 <li data-post-id>
+        return (
+            tag == "li"
+            and bool(attrs.get("data-post-id"))
+            and any(
+                parent_tag == "ul" and " ".join(classes.split()) == "product post-list"
+                for parent_tag, classes in parents
+            )
+        )
+
+    def stream_start_marker(
+        self,
+    ) -> Optional[str]:
+        return 'class="product post-list"'
+
+    def stream_document(
+        self,
+        items_html: str,
+    ) -> str:
+        return f'<ul class="product post-list">{items_html}</ul>'
+
+    def parse_bs4(
         self,
         html: str,
     ) -> List[KeywordData]:
@@ -35,18 +91,78 @@ class AlgumonCrawler(BaseCrawler):
 
             if post_id and action_uri and product_link:
                 products.append(
-                    KeywordData(
-                        current_id=post_id,
-                        current_title=product_link.text.strip(),
-                        current_link=f"https://www.algumon.com{action_uri.strip()}",
-                        current_price=(
-                            product_price.text.strip() if product_price else None
+                    self._build_item(
+                        post_id=post_id,
+                        action_uri=action_uri,
+                        title=product_link.text,
+                        price=product_price.text if product_price else None,
+                        meta=meta_info.text if meta_info else None,
+                    )
+                )
+        return products
+
+    def parse_lxml(
+        self,
+        html: str,
+    ) -> List[KeywordData]:
+        items = PRODUCT_ITEMS(parse_document(html))
+        if not items:
+            logger.warning("알구몬 상품 리스트를 찾을 수 없습니다.")
+            return []
+
+        products = []
+        for li in items:
+            post_id = li.get("data-post-id")
+            action_uri = li.get("data-action-uri")
+            if not (post_id and action_uri):
+                continue
+
+            # 하위 요소를 한 번만 순회하며 필요한 요소를 찾는다.
+            product_link = product_price = meta_info = None
+            for element in li.iter("a", "small"):
+                classes = element_classes(element)
+                if element.tag == "a":
+                    if product_link is None and "product-link" in classes:
+                        product_link = element
+                elif product_price is None and "product-price" in classes:
+                    product_price = element
+                elif meta_info is None and "deal-price-meta-info" in classes:
+                    meta_info = element
+
+            if product_link is not None:
+                products.append(
+                    self._build_item(
+                        post_id=post_id,
+                        action_uri=action_uri,
+                        title=product_link.text_content(),
+                        price=(
+                            product_price.text_content()
+                            if product_price is not None
+                            else None
+                        ),
+                        meta=(
+                            meta_info.text_content() if meta_info is not None else None
                         ),
-                        current_meta_data=(meta_info.text.strip() if meta_info else "")
-                        .replace("\n", "")
-                        .replace("\r", "")
-                        .replace(" ", ""),
-                        wdate=datetime.now().isoformat(),
                     )
                 )
         return products
+
+    def _build_item(
+        self,
+        post_id: str,
+        action_uri: str,
+        title: str,
+        price: str,
+        meta: str,
+    ) -> KeywordData:
+        return KeywordData(
+            current_id=post_id,
+            current_title=title.strip(),
+            current_link=f"https://www.algumon.com{action_uri.strip()}",
+            current_price=price.strip() if price is not None else None,
+            current_meta_data=(meta.strip() if meta is not None else "")
+            .replace("\n", "")
+            .replace("\r", "")
+            .replace(" ", ""),
+            wdate=datetime.now().isoformat(),
+        )
@@ -1,24 +1,64 @@
-import random
+import os
 import re
-import time
 from datetime import datetime
-from typing import List
+from typing import Dict, List, Optional
 
 from bs4 import BeautifulSoup
 
 from models.keyword_data import KeywordData
-from modules import logger
-from modules.base_crawler import BaseCrawler
+from modules.base_crawler import FeedCrawler
+from modules.parser_backend import (
+    compile_xpath,
+    element_classes,
+    has_class,
+    parse_document,
+)
 
+# 핫딜 게시글 <li class="li">
+PRODUCT_ITEMS = compile_xpath(f"//li[{has_class('li')}]")
+
+
+class FMKoreaCrawler(FeedCrawler):
+    streamable = True
 
-class FMKoreaCrawler(BaseCrawler):
     @property
     def url(
         self,
     ) -> str:
-        return f"https://www.fmkorea.com/index.php?mid=hotdeal&page="
+        # FMKOREA_BASE_URL: 벤치마크용 로컬 서버 등으로 요청 주소를 바꿀 때 사용
+        base_url = os.getenv("FMKOREA_BASE_URL", "https://www.fmkorea.com")
+        return f"{base_url.rstrip('/')}/index.php?mid=hotdeal&page="
+
+    def page_url(
+        self,
+        page: int,
+    ) -> Optional[str]:
+        # 최대 CRAWL_MAX_PAGES(기본 3)페이지까지, 새 글이 이어지는 동안만 크롤링
+        return f"{self.url}{page}"
+
+    def relevant_content(
+        self,
+        html: str,
+    ) -> str:
+        # 게시글 목록 시작 지점부터 비교
+        start = html.find('<li class="li')
+        return html[start:] if start >= 0 else html
 
-    def parse(
+    def is_stream_item(
+        self,
+        tag: str,
+        attrs: Dict[str, Optional[str]],
+        parents: list,
+    ) -> bool:
+        # 핫딜 게시글 <li class="li ...">
+        return tag == "li" and "li" in (attrs.get("class") or "").split()
+
+    def stream_start_marker(
+        self,
+    ) -> Optional[str]:
+        return '<li class="li'
+
+    def parse_bs4(
         self,
         html: str,
     ) -> List[KeywordData]:
@@ -34,82 +74,129 @@ class FMKoreaCrawler(BaseCrawler):
 
             # Extract link
             product_link = li.find("h3", class_="title").find("a")
-            link = (
-                "https://www.fmkorea.com" + product_link["href"]
-                if product_link
-                else None
-            )
+            href = product_link["href"] if product_link else None
 
             # Extract title
-            title = product_link.text.strip() if product_link else None
-            if title:
-                title = re.sub(
-                    r"[\xa0\t]+", " ", title
-                ).strip()  # Remove unwanted characters like \xa0, tabs, etc.
+            title = product_link.text if product_link else None
 
-            # Extract shop
+            # Extract shop, price, delivery (a.strong 순서대로)
             shop_info = li.find("div", class_="hotdeal_info")
-            shop_name = shop_info.find("a", class_="strong") if shop_info else None
-            shop = shop_name.text if shop_name else None
-
-            # Extract price
-            price_tag = (
-                shop_info.find_all("a", class_="strong")[1] if shop_info else None
-            )
-            price = price_tag.text if price_tag else None
-
-            # Extract metadata
-            delivery_tag = (
-                shop_info.find_all("a", class_="strong")[2] if shop_info else None
+            strongs = (
+                [tag.text for tag in shop_info.find_all("a", class_="strong")]
+                if shop_info
+                else []
             )
-            delivery = delivery_tag.text if delivery_tag else None
 
             reg_date = li.find("span", class_="regdate")
-            time = reg_date.text.strip() if reg_date else None
+            reg_time = reg_date.text if reg_date else None
 
             category_tag = li.find("span", class_="category").find("a")
             category = category_tag.text if category_tag else None
 
-            meta_data = {
-                "shop": shop,
-                "delivery": delivery,
-                "time": time,
-                "category": category,
-            }
-
-            # search_keyword는 self.keyword의 공백을 모두 제거한 것
-            search_keyword = self.keyword.replace(" ", "")
-            # search_title은 title의 공백을 모두 제거한 것
-            search_title = title.replace(" ", "")
-            # title에 search_keyword가 포함되어 있는지 확인
-            if search_keyword in search_title:
-                products.append(
-                    KeywordData(
-                        current_id=post_id,
-                        current_title=title,
-                        current_link=link,
-                        current_price=price,
-                        current_meta_data=str(meta_data),
-                        wdate=datetime.now().isoformat(),
-                    )
-                )
+            item = self._build_item(
+                post_id=post_id,
+                href=href,
+                title=title,
+                strongs=strongs,
+                reg_time=reg_time,
+                category=category,
+            )
+            if item:
+                products.append(item)
+
+        return products
+
+    def parse_lxml(
+        self,
+        html: str,
+    ) -> List[KeywordData]:
+        products = []
+
+        for li in PRODUCT_ITEMS(parse_document(html)):
+            # 하위 요소를 한 번만 순회하며 필요한 요소를 찾는다.
+            voted = title_h3 = shop_info = reg_date = category_span = None
+            for element in li.iter("a", "h3", "div", "span"):
+                classes = element_classes(element)
+                tag = element.tag
+                if tag == "a":
+                    if voted is None and "pc_voted_count" in classes:
+                        voted = element
+                elif tag == "h3":
+                    if title_h3 is None and "title" in classes:
+                        title_h3 = element
+                elif tag == "div":
+                    if shop_info is None and "hotdeal_info" in classes:
+                        shop_info = element
+                elif reg_date is None and "regdate" in classes:
+                    reg_date = element
+                elif category_span is None and "category" in classes:
+                    category_span = element
+
+            post_id = voted.get("href").split("/")[-1] if voted is not None else None
+            product_link = (
+                next(title_h3.iter("a"), None) if title_h3 is not None else None
+            )
+            category_tag = (
+                next(category_span.iter("a"), None)
+                if category_span is not None
+                else None
+            )
+            strongs = (
+                [
+                    tag.text_content()
+                    for tag in shop_info.iter("a")
+                    if "strong" in element_classes(tag)
+                ]
+                if shop_info is not None
+                else []
+            )
+
+            item = self._build_item(
+                post_id=post_id,
+                href=product_link.get("href") if product_link is not None else None,
+                title=product_link.text_content() if product_link is not None else None,
+                strongs=strongs,
+                reg_time=reg_date.text_content() if reg_date is not None else None,
+                category=(
+                    category_tag.text_content() if category_tag is not None else None
+                ),
+            )
+            if item:
+                products.append(item)
 
         return products
 
-    def fetchparse(
+    def _build_item(
         self,
-    ):
-        # 3페이지까지 크롤링
-        for page in range(1, 4):
-            url = f"{self.url}{page}"
-            """크롤링 실행 (필요 시 오버라이드)."""
-            html = self.fetch(url=url)
-            if html:
-                # result에 파싱 결과 추가
-                self.results.extend(self.parse(html))
-            else:
-                logger.error(f"크롤링 실패: {url}")
-
-            # 요청 간 랜덤 대기 시간 설정 (1초에서 3초 사이)
-            time.sleep(random.uniform(1, 3))
-        return self.results
+        post_id: Optional[str],
+        href: Optional[str],
+        title: Optional[str],
+        strongs: List[str],
+        reg_time: Optional[str],
+        category: Optional[str],
+    ) -> Optional[KeywordData]:
+        link = "https://www.fmkorea.com" + href if href else None
+
+        if title:
+            title = re.sub(
+                r"[\xa0\t]+", " ", title.strip()
+            ).strip()  # Remove unwanted characters like \xa0, tabs, etc.
+
+        meta_data = {
+            "shop": strongs[0] if len(strongs) > 0 else None,
+            "delivery": strongs[2] if len(strongs) > 2 else None,
+            "time": reg_time.strip() if reg_time is not None else None,
+            "category": category,
+        }
+
+        # 키워드 매칭은 KeywordMatcher가 모든 키워드에 대해 한 번에 처리한다.
+        if not title:
+            return None
+        return KeywordData(
+            current_id=post_id,
+            current_title=title,
+            current_link=link,
+            current_price=strongs[1] if len(strongs) > 1 else None,
+            current_meta_data=str(meta_data),
+            wdate=datetime.now().isoformat(),
+        )
@@ -2,11 +2,14 @@ import json
 import os
 from dataclasses import asdict
 from datetime import datetime
-from typing import Dict
+from typing import Dict, List, Optional, Set
 
 from models.data import DataModel, SmtpSettings
 from models.keyword_data import KeywordData
 from modules import logger
+from modules.file_utils import atomic_write_json
+from modules.metrics import Metrics
+from modules.state_store import BaseStateStore, StateKey, create_state_store
 
 
 class DataManager:
@@ -22,11 +25,15 @@ class DataManager:
         self,
         file_path=os.path.join(os.getcwd(), "data/data.json"),
     ):
-        self.keyword_data_by_site: Dict[str, KeywordData] = {}
         if not hasattr(self, "initialized"):  # 초기화 방지
+            self.keyword_data_by_site: Dict[str, KeywordData] = {}
             self.file_path = file_path
             self.ensure_data_folder()  # 폴더 확인 및 생성
             self.data = self.load_data()
+            self.state_store: BaseStateStore = create_state_store(
+                os.path.abspath(os.path.dirname(self.file_path))
+            )
+            self.keyword_state: Optional[Dict[StateKey, KeywordData]] = None
             self.initialized = True  # 초기화 상태 표시
 
     # data.json 파일 저장 경로의 폴더가 없으면 생성
@@ -39,11 +46,16 @@ class DataManager:
     # data.json을 다시 읽어서 keyword 데이터를 업데이트합니다.
     def file_load(self):
         # 파일이 존재하면 JSON 로드
-        with open(self.file_path, "r") as f:
+        # 키워드 관리 도구가 한글을 그대로(UTF-8) 저장하므로 인코딩을 명시
+        with open(self.file_path, "r", encoding="utf-8") as f:
             loaded_data = json.load(f)
             return DataModel(
                 keyword=loaded_data.get("keyword", {}),
                 smtp_settings=SmtpSettings(**loaded_data.get("smtp_settings", {})),
+                notifiers=loaded_data.get("notifiers", []),
+                routes=loaded_data.get("routes", {}),
+                schedules=loaded_data.get("schedules", []),
+                rules=loaded_data.get("rules", {}),
             )
 
     def load_data(self) -> DataModel:
@@ -53,6 +65,7 @@ class DataManager:
             port=os.getenv("SMTP_PORT", "465"),
             email=os.getenv("SMTP_EMAIL", ""),
             password=os.getenv("SMTP_PASSWORD", ""),
+            security=os.getenv("SMTP_SECURITY", "ssl"),
         )
         logger.info(f"SMTP 설정 완료")
         # 기존 파일이 없으면 초기 데이터 생성
@@ -62,53 +75,63 @@ class DataManager:
                 "keyword": [],
                 "smtp_settings": asdict(smtp_settings),
             }
-            with open(self.file_path, "w") as f:
-                json.dump(initial_data, f, indent=4)
+            atomic_write_json(self.file_path, initial_data)
             return DataModel(smtp_settings=smtp_settings)
 
         # 파일이 존재하면 JSON 로드
         return self.file_load()
 
+    def load_state(self):
+        """사이클 시작 시 모든 키워드 상태를 한 번에 메모리로 읽어옵니다."""
+        with Metrics().timer("hotdeal_state_io_seconds", op="load"):
+            self.keyword_state = self.state_store.load_all()
+        self._dirty_keys: Set[StateKey] = set()
+        self._cleanup_keywords: Optional[List[str]] = None
+        logger.info(f"키워드 상태 {len(self.keyword_state)}건 로드")
+
+    def _ensure_state(self):
+        if getattr(self, "keyword_state", None) is None:
+            self.load_state()
+
     def update_keyword_data(
         self,
         keyword: str,
         sitename: str,
         keyword_data: KeywordData = None,
     ) -> KeywordData:
-        keyword_data_path = f"data/{keyword}_data.json"
-        data = {}
-
-        # 기존 데이터 로드
-        if os.path.exists(keyword_data_path):
-            with open(keyword_data_path, "r") as f:
-                try:
-                    data = json.load(f)
-                except json.JSONDecodeError:
-                    logger.error(
-                        f"[{keyword}] 데이터 파일이 손상되었습니다. 새로 생성합니다."
-                    )
-                    data = {}
-
-        # sitename 기반 데이터 업데이트
-        data[sitename] = asdict(keyword_data)
-        logger.info(f"[{keyword}] 데이터 업데이트 - {sitename}: {data[sitename]}")
-
-        # JSON 파일 저장
-        with open(keyword_data_path, "w") as f:
-            json.dump(data, f, indent=4)
-
+        # 메모리의 상태만 갱신하고, 디스크 반영은 flush에서 한 번에 처리
+        self._ensure_state()
+        key = (keyword, sitename)
+        self.keyword_state[key] = keyword_data
+        self._dirty_keys.add(key)
+        # 본 상품 ID 목록은 길어서 로그에서 제외
+        logged = {k: v for k, v in asdict(keyword_data).items() if k != "seen_ids"}
+        logger.info(f"[{keyword}] 데이터 업데이트 - {sitename}: {logged}")
         return keyword_data
 
+    def remove_keyword_data(
+        self,
+        keyword: str,
+        sitename: str,
+    ):
+        # 메모리의 상태만 지우고, 디스크 반영은 flush의 정리 단계(data_cleaner)에서 처리
+        self._ensure_state()
+        key = (keyword, sitename)
+        self.keyword_state.pop(key, None)
+        self._dirty_keys.discard(key)
+
     def load_keyword_data(
         self,
         keyword: str,
         sitename: str,
     ) -> KeywordData:
-        keyword_data_path = f"data/{keyword}_data.json"
+        self._ensure_state()
+        loaded_data = self.keyword_state.get((keyword, sitename))
 
-        if not os.path.exists(keyword_data_path):
+        # 저장된 sitename 데이터가 없는 경우
+        if loaded_data is None:
             logger.info(
-                f"[{keyword}] 데이터 파일이 존재하지 않습니다: {keyword_data_path}"
+                f"[{keyword}] {sitename} 데이터가 존재하지 않습니다. 새로 생성합니다."
             )
             # 빈 데이터 생성
             empty_data = self._create_empty_keyword_data()
@@ -117,44 +140,32 @@ class DataManager:
                 keyword=keyword, keyword_data=empty_data, sitename=sitename
             )
 
-        with open(keyword_data_path, "r") as f:
-            data = json.load(f)
-            # 파일은 있는데 sitename에 해당하는 데이터가 없는 경우
-            if sitename not in data:
-                logger.info(
-                    f"[{keyword}] {sitename} 데이터가 존재하지 않습니다. 새로 생성합니다."
-                )
-                empty_data = self._create_empty_keyword_data()
-                self.keyword_data_by_site[sitename] = empty_data
-                return self.update_keyword_data(
-                    keyword=keyword, keyword_data=empty_data, sitename=sitename
-                )
-
-            loaded_data = KeywordData(**data[sitename])
-            self.keyword_data_by_site[sitename] = loaded_data
-            return loaded_data
+        self.keyword_data_by_site[sitename] = loaded_data
+        return loaded_data
 
     def data_cleaner(self, keywords: list):
-        # data 폴더 경로 지정
-        data_folder = os.path.join(os.getcwd(), "data")
-
-        # data 폴더가 존재하지 않으면 경고 로그를 출력하고 종료
-        if not os.path.exists(data_folder):
-            logger.warning(f"폴더가 존재하지 않습니다: {data_folder}")
-            return
-
-        # data 폴더 내의 *_data.json 파일 목록 조회
-        data_files = [
-            file for file in os.listdir(data_folder) if file.endswith("_data.json")
-        ]
-
-        # 키워드 리스트와 비교하여 불필요한 파일 삭제
-        for data_file in data_files:
-            keyword = data_file.replace("_data.json", "")
-            if keyword not in keywords:
-                full_path = os.path.join(data_folder, data_file)
-                logger.info(f"[{keyword}] 데이터 파일 삭제: {full_path}")
-                os.remove(full_path)
+        # 키워드 리스트에 없는 상태는 메모리에서 제거하고, 디스크 반영은 flush에서 처리
+        self._ensure_state()
+        keep = set(keywords)
+        for key in list(self.keyword_state):
+            if key[0] not in keep:
+                del self.keyword_state[key]
+                self._dirty_keys.discard(key)
+        self._cleanup_keywords = list(keywords)
+
+    def flush(self):
+        """변경된 상태만 모아 한 번에 저장합니다 (사이클 종료 시 1회 호출)."""
+        self._ensure_state()
+        with Metrics().timer("hotdeal_state_io_seconds", op="flush"):
+            if self._cleanup_keywords is not None:
+                self.state_store.remove_except(self._cleanup_keywords)
+            self.state_store.save_many(
+                {key: self.keyword_state[key] for key in self._dirty_keys}
+            )
+            self.state_store.commit()
+        logger.info(f"키워드 상태 {len(self._dirty_keys)}건 저장")
+        self._dirty_keys = set()
+        self._cleanup_keywords = None
 
     def _create_empty_keyword_data(self) -> KeywordData:
         """빈 KeywordData 객체를 생성합니다."""
@@ -0,0 +1,203 @@
+import hashlib
+import os
+import re
+import struct
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Dict, List, Optional
+from urllib.parse import parse_qsl, urlencode, urlparse
+
+from models.keyword_data import KeywordData
+from modules import logger
+from modules.file_utils import atomic_write_bytes, file_lock
+
+# 지문(8바이트)과 만료 시각(4바이트 epoch 초)
+RECORD = struct.Struct("<QI")
+
+
+def normalize_title(
+    title: Optional[str],
+) -> str:
+    """유니코드 정규화 후 소문자로 바꾸고 공백/문장부호를 제거합니다."""
+    title = unicodedata.normalize("NFKC", title or "").lower()
+    return re.sub(r"[\W_]+", "", title)
+
+
+def normalize_price(
+    price: Optional[str],
+) -> str:
+    """가격에서 숫자만 남깁니다 ("12,900원" -> "12900")."""
+    return re.sub(r"\D", "", price or "")
+
+
+def normalize_link(
+    link: Optional[str],
+) -> str:
+    """스킴, www., 추적용 쿼리(utm_*)를 제외한 링크."""
+    if not link:
+        return ""
+    parsed = urlparse(link.strip())
+    host = parsed.netloc.lower().removeprefix("www.")
+    query = urlencode(
+        sorted(
+            (key, value)
+            for key, value in parse_qsl(parsed.query)
+            if not key.startswith("utm_")
+        )
+    )
+    return f"{host}{parsed.path.rstrip('/')}?{query}" if query else host + parsed.path
+
+
+def _hash(
+    text: str,
+) -> int:
+    return int.from_bytes(
+        hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest(), "little"
+    )
+
+
+def fingerprints(
+    product: KeywordData,
+) -> List[int]:
+    """상품 지문 목록 (제목+가격, 링크).
+
+    사이트가 달라 링크가 다른 같은 딜은 제목+가격으로, 제목이 조금 다른 같은 딜은 링크로 찾습니다.
+    """
+    result = []
+    title = normalize_title(product.current_title)
+    if title:
+        result.append(_hash(f"t:{title}|p:{normalize_price(product.current_price)}"))
+    link = normalize_link(product.current_link)
+    if link:
+        result.append(_hash(f"l:{link}"))
+    return result
+
+
+class DealDeduplicator:
+    """키워드/사이트를 가리지 않고 이미 알린 딜을 걸러내는 지문 색인 (싱글톤).
+
+    지문은 만료 시각과 함께 삽입 순서대로 보관하며, TTL이 지나거나 최대 개수를 넘으면
+    오래된 것부터 지웁니다. 디스크에는 지문 하나당 12바이트로 저장합니다.
+    여러 작업자가 같은 파일을 쓰므로 저장할 때는 잠금을 걸고 다른 작업자의 지문과 합칩니다.
+    """
+
+    _instance = None
+    _initialized = False
+
+    def __new__(cls, *args, **kwargs):
+        if not cls._instance:
+            cls._instance = super(DealDeduplicator, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(
+        self,
+        path: str = os.path.join(os.getcwd(), "data/deal_fingerprints.bin"),
+    ):
+        if self._initialized:  # 이미 초기화된 경우 무시
+            return
+        self.path = path
+        self.enabled = os.getenv("DEAL_DEDUP", "true").lower() != "false"
+        self.ttl = float(os.getenv("DEAL_DEDUP_TTL", "259200"))
+        self.max_entries = int(os.getenv("DEAL_DEDUP_MAX_ENTRIES", "50000"))
+        # 지문 -> 만료 시각 (삽입 순서 = 만료 순서)
+        self.entries: "OrderedDict[int, int]" = OrderedDict()
+        self.suppressed = 0
+        self._changed = False
+        self._lock = threading.Lock()
+        if self.enabled:
+            self._load()
+        self._initialized = True
+
+    def _read(self) -> Dict[int, int]:
+        """디스크에 저장된 지문 -> 만료 시각."""
+        if not os.path.exists(self.path):
+            return {}
+        with open(self.path, "rb") as f:
+            data = f.read()
+        if len(data) % RECORD.size:
+            logger.error(f"딜 지문 파일이 손상되어 새로 만듭니다: {self.path}")
+            return {}
+        return dict(RECORD.iter_unpack(data))
+
+    def _merge(
+        self,
+        stored: Dict[int, int],
+    ):
+        """저장된 지문을 합치고 만료 순서로 다시 정렬합니다 (같은 지문은 늦은 만료 시각)."""
+        for fingerprint, expires in self.entries.items():
+            if stored.get(fingerprint, 0) < expires:
+                stored[fingerprint] = expires
+        self.entries = OrderedDict(sorted(stored.items(), key=lambda item: item[1]))
+
+    def _load(self):
+        self._merge(self._read())
+        self._expire(time.time())
+
+    def _expire(
+        self,
+        now: float,
+    ):
+        while self.entries:
+            fingerprint, expires = next(iter(self.entries.items()))
+            if expires > now and len(self.entries) <= self.max_entries:
+                break
+            self.entries.popitem(last=False)
+            self._changed = True
+
+    def filter(
+        self,
+        keyword: str,
+        products: List[KeywordData],
+    ) -> List[KeywordData]:
+        """이미 알린 딜을 제외한 상품 목록을 반환하고, 남은 상품의 지문을 기록합니다."""
+        if not self.enabled or not products:
+            return products
+        now = time.time()
+        expires = int(now + self.ttl)
+        fresh = []
+        with self._lock:
+            self._expire(now)
+            for product in products:
+                prints = fingerprints(product)
+                if any(fingerprint in self.entries for fingerprint in prints):
+                    self.suppressed += 1
+                    logger.info(
+                        f"[{keyword}] 이미 알린 딜이라 제외: {product.current_title}"
+                    )
+                    continue
+                fresh.append(product)
+                for fingerprint in prints:
+                    # 다시 넣어 삽입 순서(만료 순서)를 유지
+                    self.entries.pop(fingerprint, None)
+                    self.entries[fingerprint] = expires
+                self._changed = True
+            self._expire(now)
+        return fresh
+
+    def flush(self):
+        """지문 색인을 디스크에 저장합니다 (사이클 종료 시 1회 호출).
+
+        다른 작업자가 그 사이 저장한 지문을 다시 읽어 합친 뒤 저장하고,
+        합친 지문은 다음 사이클부터 이 작업자의 중복 판단에도 사용합니다.
+        """
+        if not self.enabled:
+            return
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        with file_lock(self.path), self._lock:
+            self._merge(self._read())
+            self._expire(time.time())
+            if self._changed:
+                atomic_write_bytes(
+                    self.path,
+                    b"".join(
+                        RECORD.pack(fingerprint, expires)
+                        for fingerprint, expires in self.entries.items()
+                    ),
+                )
+                self._changed = False
+        logger.info(
+            f"딜 중복 제거 - 이번 사이클 제외: {self.suppressed}건, 보관 중인 지문: {len(self.entries)}개"
+        )
+        self.suppressed = 0
@@ -0,0 +1,57 @@
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+from typing import Iterator
+
+try:
+    import fcntl
+except ImportError:  # Windows 등 fcntl이 없는 환경에서는 잠금 없이 동작
+    fcntl = None
+
+
+def atomic_write_bytes(
+    path: str,
+    data: bytes,
+):
+    """같은 폴더의 임시 파일에 쓴 뒤 rename하여, 중간에 중단되어도 파일이 잘리지 않게 저장합니다."""
+    folder = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=folder, prefix=".tmp_", suffix=".part")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp은 0600으로 만들므로 일반 파일 권한으로 맞춘다.
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def atomic_write_json(
+    path: str,
+    data,
+    **dump_kwargs,
+):
+    """JSON 데이터를 원자적으로 저장합니다."""
+    dump_kwargs.setdefault("indent", 4)
+    dump_kwargs.setdefault("ensure_ascii", False)
+    atomic_write_bytes(path, json.dumps(data, **dump_kwargs).encode("utf-8"))
+
+
+@contextmanager
+def file_lock(
+    path: str,
+) -> Iterator[None]:
+    """path.lock 파일에 배타 잠금을 걸어, 여러 프로세스가 같은 파일을 동시에 수정하지 않게 합니다."""
+    with open(f"{path}.lock", "a") as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
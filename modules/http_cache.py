@@ -0,0 +1,217 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict
+from typing import Dict, List, Optional
+
+from models.keyword_data import KeywordData
+from modules import logger
+from modules.file_utils import atomic_write_json, file_lock
+
+
+class HttpCache:
+    """크롤링 대상 URL의 응답 검증값과 파싱 결과를 보관하는 디스크 캐시 (싱글톤).
+
+    서버가 ETag/Last-Modified를 주면 조건부 요청(304)으로 본문 다운로드를 생략하고,
+    그렇지 않으면 본문 중 필요한 부분의 해시가 같을 때 파싱을 생략합니다.
+    여러 작업자가 같은 파일을 쓰므로 저장할 때는 잠금을 걸고 다른 작업자의 항목과 합칩니다.
+    """
+
+    _instance = None
+    _initialized = False
+
+    def __new__(cls, *args, **kwargs):
+        if not cls._instance:
+            cls._instance = super(HttpCache, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(
+        self,
+        path: str = os.path.join(os.getcwd(), "data/http_cache.json"),
+        max_entries: Optional[int] = None,
+    ):
+        if self._initialized:  # 이미 초기화된 경우 무시
+            return
+        self.path = path
+        self.enabled = os.getenv("HTTP_CACHE", "true").lower() != "false"
+        self.max_entries = max_entries or int(
+            os.getenv("HTTP_CACHE_MAX_ENTRIES", "1000")
+        )
+        self._lock = threading.Lock()
+        # url -> {etag, last_modified, digest, size, results, used}
+        self.entries: "OrderedDict[str, dict]" = OrderedDict()
+        # 이번 사이클의 url별 통계 {not_modified, unchanged, miss, bytes_saved}
+        self.stats: Dict[str, Dict[str, int]] = {}
+        if self.enabled:
+            self._load()
+        self._initialized = True
+
+    def _read(self) -> Dict[str, dict]:
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, "r") as f:
+                return json.load(f)
+        except (json.JSONDecodeError, OSError):
+            logger.error(f"HTTP 캐시 파일이 손상되어 새로 만듭니다: {self.path}")
+            return {}
+
+    def _merge(
+        self,
+        stored: Dict[str, dict],
+    ):
+        """저장된 항목과 합칩니다. 같은 URL은 최근에 사용한 쪽을 남깁니다."""
+        for url, entry in self.entries.items():
+            if stored.get(url, {}).get("used", 0) <= entry.get("used", 0):
+                stored[url] = entry
+        # 최근 사용 순으로 정렬해 LRU 순서를 복원하고 크기 제한 유지
+        self.entries = OrderedDict(
+            sorted(stored.items(), key=lambda kv: kv[1].get("used", 0))
+        )
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def _load(self):
+        self._merge(self._read())
+
+    @staticmethod
+    def digest(
+        content: str,
+    ) -> str:
+        return hashlib.blake2b(content.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _stat(
+        self,
+        url: str,
+    ) -> Dict[str, int]:
+        return self.stats.setdefault(
+            url, {"not_modified": 0, "unchanged": 0, "miss": 0, "bytes_saved": 0}
+        )
+
+    def _touch(
+        self,
+        url: str,
+    ) -> dict:
+        entry = self.entries[url]
+        entry["used"] = time.time()
+        self.entries.move_to_end(url)
+        return entry
+
+    @staticmethod
+    def _results(
+        entry: dict,
+    ) -> List[KeywordData]:
+        return [KeywordData(**item) for item in entry["results"]]
+
+    def conditional_headers(
+        self,
+        url: str,
+    ) -> Dict[str, str]:
+        """저장된 검증값으로 조건부 요청 헤더를 만듭니다."""
+        if not self.enabled:
+            return {}
+        with self._lock:
+            entry = self.entries.get(url)
+            if not entry:
+                return {}
+            headers = {}
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+            return headers
+
+    def not_modified(
+        self,
+        url: str,
+    ) -> Optional[List[KeywordData]]:
+        """304 응답을 받은 경우 저장된 파싱 결과를 반환합니다."""
+        with self._lock:
+            entry = self.entries.get(url)
+            if not entry:
+                return None
+            entry = self._touch(url)
+            stat = self._stat(url)
+            stat["not_modified"] += 1
+            stat["bytes_saved"] += entry.get("size", 0)
+            return self._results(entry)
+
+    def unchanged(
+        self,
+        url: str,
+        digest: str,
+        validators: Optional[Dict[str, str]] = None,
+    ) -> Optional[List[KeywordData]]:
+        """본문 해시가 이전과 같으면 저장된 파싱 결과를 반환합니다."""
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self.entries.get(url)
+            if not entry or entry.get("digest") != digest:
+                self._stat(url)["miss"] += 1
+                return None
+            entry = self._touch(url)
+            # 본문이 같아도 서버가 새 검증값을 줄 수 있으므로 갱신
+            if validators:
+                entry["etag"] = validators.get("etag")
+                entry["last_modified"] = validators.get("last_modified")
+            self._stat(url)["unchanged"] += 1
+            return self._results(entry)
+
+    def store(
+        self,
+        url: str,
+        digest: str,
+        results: List[KeywordData],
+        validators: Optional[Dict[str, str]] = None,
+        size: int = 0,
+    ):
+        if not self.enabled:
+            return
+        validators = validators or {}
+        with self._lock:
+            self.entries[url] = {
+                "etag": validators.get("etag"),
+                "last_modified": validators.get("last_modified"),
+                "digest": digest,
+                "size": size,
+                "results": [asdict(item) for item in results],
+                "used": time.time(),
+            }
+            self.entries.move_to_end(url)
+            # 오래 사용하지 않은 항목부터 제거하여 크기 제한 유지
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def flush(self):
+        """캐시를 디스크에 저장합니다 (사이클 종료 시 1회 호출).
+
+        다른 작업자가 그 사이 저장한 항목을 다시 읽어 합친 뒤 저장합니다.
+        """
+        if not self.enabled:
+            return
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        with file_lock(self.path), self._lock:
+            self._merge(self._read())
+            atomic_write_json(self.path, dict(self.entries), indent=None)
+
+    def log_stats(self):
+        """이번 사이클의 URL별 캐시 적중 통계를 기록하고 초기화합니다."""
+        if not self.enabled:
+            return
+        with self._lock:
+            stats, self.stats = self.stats, {}
+        for url, stat in stats.items():
+            logger.info(
+                f"HTTP 캐시 [{url}] 304: {stat['not_modified']}, 해시 일치: {stat['unchanged']}, "
+                f"미스: {stat['miss']}, 절약: {stat['bytes_saved']}B"
+            )
+        hits = sum(stat["not_modified"] + stat["unchanged"] for stat in stats.values())
+        misses = sum(stat["miss"] for stat in stats.values())
+        saved = sum(stat["bytes_saved"] for stat in stats.values())
+        logger.info(
+            f"HTTP 캐시 통계 - 적중: {hits}, 미스: {misses}, 다운로드 절약: {saved}B"
+        )
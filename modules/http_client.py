@@ -0,0 +1,171 @@
+import os
+import threading
+from typing import Dict, Iterable, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from modules import logger
+
+
+class ConnectionStats:
+    """커넥션 생성/재사용 횟수 집계 (스레드 안전)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.opened = 0
+        self.checkouts = 0
+
+    def record_open(self):
+        with self._lock:
+            self.opened += 1
+
+    def record_checkout(self):
+        with self._lock:
+            self.checkouts += 1
+
+    @property
+    def reused(self) -> int:
+        return max(self.checkouts - self.opened, 0)
+
+    def reset(self):
+        with self._lock:
+            self.opened = 0
+            self.checkouts = 0
+
+
+def _counting_pool(base_class, stats: ConnectionStats):
+    """커넥션 생성/획득 시 stats에 기록하는 커넥션 풀 클래스를 만든다."""
+
+    class CountingPool(base_class):
+        def _new_conn(self):
+            stats.record_open()
+            return super()._new_conn()
+
+        def _get_conn(self, timeout=None):
+            stats.record_checkout()
+            return super()._get_conn(timeout=timeout)
+
+    return CountingPool
+
+
+class CountingHTTPAdapter(HTTPAdapter):
+    """커넥션 풀 사용량을 집계하는 HTTPAdapter."""
+
+    def __init__(self, stats: ConnectionStats, **kwargs):
+        self.stats = stats
+        super().__init__(**kwargs)
+
+    def _install_counting_pools(self, manager):
+        manager.pool_classes_by_scheme = {
+            "http": _counting_pool(HTTPConnectionPool, self.stats),
+            "https": _counting_pool(HTTPSConnectionPool, self.stats),
+        }
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self._install_counting_pools(self.poolmanager)
+
+    def proxy_manager_for(self, proxy, **proxy_kwargs):
+        is_new = proxy not in self.proxy_manager
+        manager = super().proxy_manager_for(proxy, **proxy_kwargs)
+        if is_new:
+            self._install_counting_pools(manager)
+        return manager
+
+
+class HttpClient:
+    """프로세스 전역에서 공유하는 HTTP 세션 관리자 (싱글톤).
+
+    직접 요청용 세션 하나와 프록시별 세션을 따로 두어 각자 커넥션 풀을 유지합니다.
+    """
+
+    _instance = None
+    _initialized = False
+
+    def __new__(cls, *args, **kwargs):
+        if not cls._instance:
+            cls._instance = super(HttpClient, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(
+        self,
+        pool_connections: Optional[int] = None,
+        pool_maxsize: Optional[int] = None,
+    ):
+        if self._initialized:  # 이미 초기화된 경우 무시
+            return
+        # pool_connections: 유지할 호스트별 풀 개수, pool_maxsize: 풀 하나당 최대 커넥션 수
+        self.pool_connections = pool_connections or int(
+            os.getenv("HTTP_POOL_CONNECTIONS", "10")
+        )
+        self.pool_maxsize = pool_maxsize or int(os.getenv("HTTP_POOL_MAXSIZE", "16"))
+        self.stats = ConnectionStats()
+        self._lock = threading.Lock()
+        self._session = self._create_session()
+        self._proxy_sessions: Dict[str, requests.Session] = {}
+        self._initialized = True
+
+    def _create_session(
+        self,
+        proxy: Optional[str] = None,
+    ) -> requests.Session:
+        session = requests.Session()
+        adapter = CountingHTTPAdapter(
+            self.stats,
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        if proxy:
+            session.proxies = {"http": proxy, "https": proxy}
+        return session
+
+    def session_for(
+        self,
+        proxy: Optional[str] = None,
+    ) -> requests.Session:
+        """프록시별 세션을 반환합니다. 프록시가 없으면 공용 세션을 반환합니다."""
+        if not proxy:
+            return self._session
+        with self._lock:
+            if proxy not in self._proxy_sessions:
+                self._proxy_sessions[proxy] = self._create_session(proxy)
+            return self._proxy_sessions[proxy]
+
+    def get(
+        self,
+        url: str,
+        proxy: Optional[str] = None,
+        **kwargs,
+    ) -> requests.Response:
+        return self.session_for(proxy).get(url, **kwargs)
+
+    def post(
+        self,
+        url: str,
+        proxy: Optional[str] = None,
+        **kwargs,
+    ) -> requests.Response:
+        return self.session_for(proxy).post(url, **kwargs)
+
+    def close_proxy_sessions(
+        self,
+        keep: Optional[Iterable[str]] = None,
+    ):
+        """keep에 없는 프록시의 세션을 닫고 버립니다 (keep이 없으면 모두 닫음).
+
+        프록시 목록을 새로 가져올 때마다 목록에서 빠진 프록시의 세션과 소켓을 정리합니다.
+        """
+        keep = set(keep or ())
+        with self._lock:
+            for proxy in list(self._proxy_sessions):
+                if proxy not in keep:
+                    self._proxy_sessions.pop(proxy).close()
+
+    def log_stats(self):
+        logger.info(
+            f"HTTP 커넥션 통계 - 생성: {self.stats.opened}, 재사용: {self.stats.reused}"
+        )
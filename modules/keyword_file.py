@@ -0,0 +1,92 @@
+import json
+from typing import Callable, List, Tuple, TypeVar
+
+from modules.file_utils import atomic_write_json, file_lock
+
+T = TypeVar("T")
+
+
+def read_data_file(
+    path: str,
+) -> dict:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def update_data_file(
+    path: str,
+    modify: Callable[[dict], T],
+) -> T:
+    """data.json을 잠근 상태로 읽어 modify로 수정한 뒤 원자적으로 저장합니다.
+
+    실행 중인 프로그램은 항상 완전한 파일만 읽게 되고, 변경은 파일 감시로 바로 반영됩니다.
+    """
+    with file_lock(path):
+        data = read_data_file(path)
+        if not isinstance(data.get("keyword", []), list):
+            raise ValueError("'keyword' 항목이 리스트가 아닙니다.")
+        result = modify(data)
+        atomic_write_json(path, data)
+    return result
+
+
+def normalize_keywords(
+    keywords: List[str],
+) -> List[str]:
+    """앞뒤 공백을 제거하고 빈 값과 중복을 뺍니다 (순서 유지)."""
+    return list(
+        dict.fromkeys(keyword.strip() for keyword in keywords if keyword.strip())
+    )
+
+
+def add_keywords(
+    path: str,
+    keywords: List[str],
+) -> List[str]:
+    """키워드를 추가하고, 실제로 새로 추가된 키워드를 반환합니다."""
+
+    def modify(data: dict) -> List[str]:
+        current = data.setdefault("keyword", [])
+        added = [
+            keyword
+            for keyword in normalize_keywords(keywords)
+            if keyword not in current
+        ]
+        current.extend(added)
+        return added
+
+    return update_data_file(path, modify)
+
+
+def remove_keywords(
+    path: str,
+    keywords: List[str],
+) -> List[str]:
+    """키워드를 삭제하고, 실제로 삭제된 키워드를 반환합니다."""
+
+    def modify(data: dict) -> List[str]:
+        targets = set(normalize_keywords(keywords))
+        current = data.setdefault("keyword", [])
+        removed = [keyword for keyword in current if keyword in targets]
+        data["keyword"] = [keyword for keyword in current if keyword not in targets]
+        return removed
+
+    return update_data_file(path, modify)
+
+
+def replace_keywords(
+    path: str,
+    keywords: List[str],
+) -> Tuple[List[str], List[str]]:
+    """키워드 목록 전체를 바꾸고, (추가된 키워드, 삭제된 키워드)를 반환합니다."""
+
+    def modify(data: dict) -> Tuple[List[str], List[str]]:
+        current = data.get("keyword", [])
+        new = normalize_keywords(keywords)
+        data["keyword"] = new
+        return (
+            [keyword for keyword in new if keyword not in current],
+            [keyword for keyword in current if keyword not in new],
+        )
+
+    return update_data_file(path, modify)
@@ -0,0 +1,98 @@
+import re
+from collections import deque
+from typing import Dict, List, Set
+
+from models.keyword_data import KeywordData
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def strip_whitespace(
+    text: str,
+) -> str:
+    """공백 문자를 모두 제거합니다 (키워드/제목 비교용)."""
+    return _WHITESPACE.sub("", text or "")
+
+
+class KeywordMatcher:
+    """Aho-Corasick 오토마톤으로 여러 키워드를 한 번에 찾는 매처.
+
+    키워드와 제목 모두 공백을 제거한 뒤 비교하므로,
+    제목 길이에 비례하는 시간에 등록된 모든 키워드의 포함 여부를 판단합니다.
+    """
+
+    def __init__(
+        self,
+        keywords: List[str],
+    ):
+        self.keywords = list(keywords)
+        # 상태별 전이, 실패 링크, 출력(매칭된 원본 키워드)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Set[str]] = [set()]
+        # 공백만으로 이루어진 키워드는 모든 제목에 포함된 것으로 본다 (기존 in 비교와 동일)
+        self._always: Set[str] = set()
+        for keyword in self.keywords:
+            self._add(keyword)
+        self._build()
+
+    def _add(
+        self,
+        keyword: str,
+    ):
+        pattern = strip_whitespace(keyword)
+        if not pattern:
+            self._always.add(keyword)
+            return
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(set())
+                self._goto[state][char] = next_state
+            state = next_state
+        self._output[state].add(keyword)
+
+    def _build(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                candidate = self._goto[fail].get(char, 0)
+                self._fail[next_state] = candidate if candidate != next_state else 0
+                self._output[next_state] |= self._output[self._fail[next_state]]
+
+    def match(
+        self,
+        text: str,
+    ) -> Set[str]:
+        """text에 포함된 키워드(원본 표기)를 모두 반환합니다."""
+        found = set(self._always)
+        state = 0
+        for char in strip_whitespace(text):
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            if self._output[state]:
+                found |= self._output[state]
+        return found
+
+    def match_items(
+        self,
+        items: List[KeywordData],
+    ) -> Dict[str, List[KeywordData]]:
+        """상품 목록을 한 번 훑으며 키워드별 매칭 상품 목록을 만듭니다 (순서 유지)."""
+        matched: Dict[str, List[KeywordData]] = {
+            keyword: [] for keyword in self.keywords
+        }
+        for item in items:
+            for keyword in self.match(item.current_title):
+                matched[keyword].append(item)
+        return matched
@@ -0,0 +1,368 @@
+import bisect
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from modules import logger
+from modules.file_utils import atomic_write_json
+
+# 시간(초) 히스토그램 구간
+TIME_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+# 페이지당 상품 수 히스토그램 구간
+COUNT_BUCKETS = (0, 1, 5, 10, 20, 30, 50, 100)
+
+# 이름: (종류, 설명, 히스토그램 구간)
+METRICS = {
+    "hotdeal_fetch_seconds": (
+        "histogram",
+        "직접 요청 응답 시간 (호스트별)",
+        TIME_BUCKETS,
+    ),
+    "hotdeal_http_responses_total": (
+        "counter",
+        "직접 요청 응답 수 (호스트/상태 코드별)",
+        None,
+    ),
+    "hotdeal_fetch_errors_total": ("counter", "연결 오류 등 요청 실패 수", None),
+    "hotdeal_proxy_fallback_total": ("counter", "프록시로 재요청한 수", None),
+    "hotdeal_proxy_fetch_seconds": (
+        "histogram",
+        "프록시 재요청에 걸린 시간",
+        TIME_BUCKETS,
+    ),
+    "hotdeal_parse_seconds": ("histogram", "페이지 파싱 시간", TIME_BUCKETS),
+    "hotdeal_parse_skipped_total": (
+        "counter",
+        "변경이 없어 파싱을 생략한 페이지 수",
+        None,
+    ),
+    "hotdeal_items_per_page": ("histogram", "페이지당 상품 수", COUNT_BUCKETS),
+    "hotdeal_response_bytes_total": (
+        "counter",
+        "받은 본문 크기 (바이트, 호스트별)",
+        None,
+    ),
+    "hotdeal_first_item_seconds": (
+        "histogram",
+        "요청 시작부터 첫 상품을 파싱하기까지 걸린 시간",
+        TIME_BUCKETS,
+    ),
+    "hotdeal_stream_early_stop_total": (
+        "counter",
+        "이미 본 상품에 도달하여 본문 수신을 중단한 수",
+        None,
+    ),
+    "hotdeal_state_io_seconds": (
+        "histogram",
+        "키워드 상태 읽기/쓰기 시간",
+        TIME_BUCKETS,
+    ),
+    "hotdeal_rule_filtered_total": (
+        "counter",
+        "알림 규칙에 맞지 않아 알리지 않은 상품 수",
+        None,
+    ),
+    "hotdeal_notifications_total": (
+        "counter",
+        "채널별 알림 전송 결과 수",
+        None,
+    ),
+    "hotdeal_notification_latency_seconds": (
+        "histogram",
+        "알림 생성부터 전송 완료까지 걸린 시간",
+        TIME_BUCKETS,
+    ),
+    "hotdeal_cycle_seconds": ("histogram", "크롤링 사이클 전체 시간", TIME_BUCKETS),
+    "hotdeal_cycle_last_end_timestamp": (
+        "gauge",
+        "마지막 사이클 종료 시각 (unix time)",
+        None,
+    ),
+}
+
+Labels = Tuple[Tuple[str, str], ...]
+MetricKey = Tuple[str, Labels]
+
+
+def _labels(labels: Dict[str, object]) -> Labels:
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+def _series(
+    name: str,
+    labels: Labels,
+    extra: Labels = (),
+) -> str:
+    """Prometheus 형식의 시계열 이름 (예: name{host="a",status="200"})."""
+    pairs = labels + extra
+    if not pairs:
+        return name
+    text = ",".join(
+        '{}="{}"'.format(
+            key, value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        )
+        for key, value in pairs
+    )
+    return f"{name}{{{text}}}"
+
+
+class Histogram:
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(
+        self,
+        buckets: Tuple[float, ...],
+    ):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # 마지막은 +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(
+        self,
+        value: float,
+    ):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class Metrics:
+    """크롤링 지표 수집기 (싱글톤).
+
+    요청/파싱/상태 저장/알림 전송 시간과 응답 코드 수를 모아 METRICS_PORT의
+    /metrics(Prometheus 텍스트 형식)로 제공하고, 사이클마다 변화량을
+    data/cycle_metrics.json에 요약합니다.
+    """
+
+    _instance = None
+    _initialized = False
+
+    def __new__(cls, *args, **kwargs):
+        if not cls._instance:
+            cls._instance = super(Metrics, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(
+        self,
+        summary_path=os.path.join(os.getcwd(), "data/cycle_metrics.json"),
+    ):
+        if self._initialized:  # 이미 초기화된 경우 무시
+            return
+        self.enabled = os.getenv("METRICS", "true").lower() != "false"
+        if os.getenv("SHARD_INDEX"):
+            # 작업자마다 따로 저장 (예: cycle_metrics.1.json)
+            root, ext = os.path.splitext(summary_path)
+            summary_path = f"{root}.{os.getenv('SHARD_INDEX')}{ext}"
+        self.summary_path = summary_path
+        self.write_summary = os.getenv("METRICS_SUMMARY", "true").lower() != "false"
+        self.values: Dict[MetricKey, float] = {}
+        self.histograms: Dict[MetricKey, Histogram] = {}
+        self.last_summary: Optional[dict] = None
+        self._snapshot: Optional[Tuple[dict, dict]] = None
+        self._cycle_started: Optional[float] = None
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._lock = threading.Lock()
+        self._initialized = True
+
+    def inc(
+        self,
+        name: str,
+        value: float = 1,
+        **labels,
+    ):
+        """카운터를 증가시킵니다."""
+        if not self.enabled:
+            return
+        key = (name, _labels(labels))
+        with self._lock:
+            self.values[key] = self.values.get(key, 0) + value
+
+    def set(
+        self,
+        name: str,
+        value: float,
+        **labels,
+    ):
+        """게이지 값을 설정합니다."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self.values[(name, _labels(labels))] = value
+
+    def observe(
+        self,
+        name: str,
+        value: float,
+        **labels,
+    ):
+        """히스토그램에 값을 기록합니다."""
+        if not self.enabled:
+            return
+        key = (name, _labels(labels))
+        with self._lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = Histogram(
+                    METRICS.get(name, ("histogram", "", TIME_BUCKETS))[2]
+                )
+            histogram.observe(value)
+
+    @contextmanager
+    def timer(
+        self,
+        name: str,
+        **labels,
+    ) -> Iterator[None]:
+        """블록 실행 시간을 히스토그램에 기록합니다 (예외가 나도 기록)."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def render(self) -> str:
+        """Prometheus 텍스트 형식 (version 0.0.4)."""
+        with self._lock:
+            values = dict(self.values)
+            histograms = {
+                key: (histogram.buckets, list(histogram.counts), histogram.sum)
+                for key, histogram in self.histograms.items()
+            }
+        lines: List[str] = []
+        names = sorted({key[0] for key in values} | {key[0] for key in histograms})
+        for name in names:
+            kind, description, _ = METRICS.get(name, ("untyped", "", None))
+            lines.append(f"# HELP {name} {description}")
+            lines.append(f"# TYPE {name} {kind}")
+            for (metric, labels), value in sorted(values.items()):
+                if metric == name:
+                    lines.append(f"{_series(name, labels)} {value}")
+            for (metric, labels), (buckets, counts, total) in sorted(
+                histograms.items()
+            ):
+                if metric != name:
+                    continue
+                cumulative = 0
+                for bound, count in zip(list(buckets) + ["+Inf"], counts):
+                    cumulative += count
+                    le = bound if bound == "+Inf" else f"{bound:g}"
+                    lines.append(
+                        f"{_series(name + '_bucket', labels, (('le', le),))} {cumulative}"
+                    )
+                lines.append(f"{_series(name + '_sum', labels)} {total}")
+                lines.append(f"{_series(name + '_count', labels)} {cumulative}")
+        return "\n".join(lines) + "\n"
+
+    def _totals(self) -> Tuple[dict, dict]:
+        with self._lock:
+            return dict(self.values), {
+                key: (histogram.count, histogram.sum)
+                for key, histogram in self.histograms.items()
+            }
+
+    def begin_cycle(self):
+        """사이클 시작 시점의 값을 기억합니다 (요약은 이 시점부터의 변화량)."""
+        if not self.enabled:
+            return
+        self._snapshot = self._totals()
+        self._cycle_started = time.perf_counter()
+
+    def end_cycle(
+        self,
+        **info,
+    ) -> Optional[dict]:
+        """사이클 시간을 기록하고, 이번 사이클 동안의 변화량을 요약하여 저장합니다."""
+        if not self.enabled or self._cycle_started is None:
+            return None
+        duration = time.perf_counter() - self._cycle_started
+        self.observe("hotdeal_cycle_seconds", duration)
+        self.set("hotdeal_cycle_last_end_timestamp", time.time())
+
+        before_values, before_histograms = self._snapshot
+        values, histograms = self._totals()
+        counters = {}
+        for (name, labels), value in sorted(values.items()):
+            if METRICS.get(name, ("counter",))[0] != "counter":
+                continue
+            delta = value - before_values.get((name, labels), 0)
+            if delta:
+                counters[_series(name, labels)] = delta
+        timings = {}
+        for (name, labels), (count, total) in sorted(histograms.items()):
+            before_count, before_total = before_histograms.get((name, labels), (0, 0.0))
+            if count - before_count:
+                timings[_series(name, labels)] = {
+                    "count": count - before_count,
+                    "sum": round(total - before_total, 6),
+                    "avg": round((total - before_total) / (count - before_count), 6),
+                }
+        summary = {
+            "time": datetime.now().isoformat(),
+            "duration": round(duration, 3),
+            **info,
+            "counters": counters,
+            "timings": timings,
+        }
+        self.last_summary = summary
+        self._cycle_started = None
+        logger.info(f"사이클 소요 시간: {duration:.2f}초")
+        if self.write_summary:
+            try:
+                atomic_write_json(self.summary_path, summary)
+            except OSError as e:
+                logger.error(f"사이클 지표 저장 실패: {e}")
+        return summary
+
+    def start_server(self):
+        """METRICS_PORT가 설정되어 있으면 /metrics와 /summary를 제공하는 HTTP 서버를 띄웁니다.
+
+        여러 작업자로 실행 중이면 포트에 SHARD_INDEX를 더해 작업자마다 다른 포트를 사용합니다.
+        """
+        port = os.getenv("METRICS_PORT")
+        if not self.enabled or not port or self._server is not None:
+            return
+        port = int(port) + int(os.getenv("SHARD_INDEX") or 0)
+        host = os.getenv("METRICS_HOST", "127.0.0.1")
+        metrics = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                path = self.path.split("?")[0]
+                if path == "/metrics":
+                    body = metrics.render().encode("utf-8")
+                    content_type = "text/plain; version=0.0.4; charset=utf-8"
+                elif path == "/summary":
+                    body = json.dumps(
+                        metrics.last_summary or {}, ensure_ascii=False
+                    ).encode("utf-8")
+                    content_type = "application/json; charset=utf-8"
+                else:
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        try:
+            self._server = ThreadingHTTPServer((host, port), Handler)
+        except OSError as e:
+            logger.error(f"지표 서버를 시작하지 못했습니다 ({host}:{port}): {e}")
+            return
+        self._server.daemon_threads = True
+        threading.Thread(
+            target=self._server.serve_forever,
+            name="metrics-server",
+            daemon=True,
+        ).start()
+        logger.info(f"지표 서버 시작: http://{host}:{port}/metrics")
@@ -1,43 +1,125 @@
-import smtplib
-from email.mime.text import MIMEText
-from typing import List
+import os
+from typing import Dict, List, Optional
 
 from models.keyword_data import KeywordData
+from models.notification import Notification
 from modules import logger
 from modules.data_manager import DataManager
+from modules.notification_queue import NotificationQueue
+from modules.notifiers import (
+    NOTIFIER_TYPES,
+    BaseNotifier,
+    EmailNotifier,
+    SlackNotifier,
+    TelegramNotifier,
+    WebhookNotifier,
+)
 
 
 class NotificationManager:
+    """알림 관리자.
+
+    사이클 동안 notify로 받은 알림을 모아 두었다가 flush에서 채널별로 나누어
+    전송 대기열에 넣습니다. 채널은 메일(기본)과 data.json의 notifiers 항목,
+    환경변수로 설정한 웹훅/텔레그램/슬랙이며, routes로 키워드별 채널을 지정합니다.
+    """
+
     def __init__(self):
         self.data_manager = DataManager()  # 싱글톤 인스턴스를 가져옴
-        self.smtp_settings = self.data_manager.data.smtp_settings  # 속성으로 접근
+        self.pending: List[Notification] = []
 
     def notify(
         self,
         keyword: str,
         updates: List[KeywordData],
         mode="initial",
+        lowest: Optional[Dict[str, int]] = None,
     ):
-        subject = None
-        text = f"<h2><a href='https://www.algumon.com/search/{keyword}'>전체 검색 결과</a></h2>"
+        """알림을 대기열에 추가합니다. 실제 전송은 flush에서 이루어집니다.
+
+        lowest는 역대 최저가인 상품의 {상품 ID: 이전 최저가}입니다.
+        """
         logger.info(f"알림 모드: {mode}")
         if mode == "initial":
-            if updates:
-                text += f"<p><a href='{updates[0].current_link}'>{updates[0].current_title} ({updates[0].current_price})</a></p>"
             subject = f"[{keyword}] 핫딜 알림 등록 완료"
-            self.send_email(subject=subject, body=text, is_html=True)
         elif mode == "updates":
-            # 업데이트 모드에서 HTML 리스트 생성
-            product_list_html = "".join(
-                [
-                    f"<p><a href='{product.current_link}'>{product.current_title}</a> - {product.current_price}</p>"
-                    for product in updates
-                ]
-            )
-            text += product_list_html  # 기존 텍스트에 리스트를 추가
             subject = f"[{keyword}] 새로운 핫딜 등장!"
-            self.send_email(subject, text, is_html=True)
-        logger.info("알림 완료!")
+        else:
+            logger.warning(f"[{keyword}] 알 수 없는 알림 모드: {mode}")
+            return
+        self.pending.append(
+            Notification(
+                keyword=keyword,
+                mode=mode,
+                subject=subject,
+                updates=list(updates),
+                lowest=dict(lowest or {}),
+            )
+        )
+
+    def load_notifiers(self) -> Dict[str, BaseNotifier]:
+        """설정된 알림 채널을 이름별로 생성합니다."""
+        data = self.data_manager.data
+        notifiers: Dict[str, BaseNotifier] = {}
+        if os.getenv("NOTIFY_EMAIL", "true").lower() != "false":
+            notifiers["email"] = EmailNotifier(data.smtp_settings)
+        # 환경변수로 간단히 설정하는 채널
+        if os.getenv("NOTIFY_WEBHOOK_URL"):
+            notifiers["webhook"] = WebhookNotifier(os.getenv("NOTIFY_WEBHOOK_URL"))
+        if os.getenv("SLACK_WEBHOOK_URL"):
+            notifiers["slack"] = SlackNotifier(os.getenv("SLACK_WEBHOOK_URL"))
+        if os.getenv("TELEGRAM_BOT_TOKEN") and os.getenv("TELEGRAM_CHAT_ID"):
+            notifiers["telegram"] = TelegramNotifier(
+                token=os.getenv("TELEGRAM_BOT_TOKEN"),
+                chat_id=os.getenv("TELEGRAM_CHAT_ID"),
+            )
+        # data.json의 notifiers 항목
+        for config in data.notifiers:
+            config = dict(config)
+            notifier_type = config.pop("type", None)
+            notifier_class = NOTIFIER_TYPES.get(notifier_type)
+            if notifier_class is None:
+                logger.warning(f"알 수 없는 알림 채널 종류: {notifier_type}")
+                continue
+            if notifier_class is EmailNotifier:
+                config.setdefault("smtp_settings", data.smtp_settings)
+            try:
+                notifier = notifier_class(**config)
+            except TypeError as e:
+                logger.error(f"알림 채널 설정 오류 ({notifier_type}): {e}")
+                continue
+            notifiers[notifier.name] = notifier
+        return notifiers
+
+    def route(
+        self,
+        notifications: List[Notification],
+        notifiers: Dict[str, BaseNotifier],
+    ) -> Dict[str, List[Notification]]:
+        """알림을 채널별로 나눕니다. routes에 없는 키워드는 모든 채널로 보냅니다."""
+        routes = self.data_manager.data.routes
+        routed: Dict[str, List[Notification]] = {name: [] for name in notifiers}
+        for notification in notifications:
+            channels = routes.get(notification.keyword, list(notifiers))
+            for name in channels:
+                if name not in notifiers:
+                    logger.warning(
+                        f"[{notification.keyword}] 설정되지 않은 알림 채널: {name}"
+                    )
+                    continue
+                routed[name].append(notification)
+        return {name: batch for name, batch in routed.items() if batch}
+
+    def flush(self):
+        """모아 둔 알림을 채널별로 전송 대기열에 넣습니다 (사이클 종료 시 1회 호출)."""
+        notifications, self.pending = self.pending, []
+        if not notifications:
+            return
+        notifiers = self.load_notifiers()
+        routed = self.route(notifications, notifiers)
+        NotificationQueue().submit(
+            [(notifiers[name], batch) for name, batch in routed.items()]
+        )
 
     def send_email(
         self,
@@ -45,22 +127,5 @@ class NotificationManager:
         body=None,
         is_html=False,
     ):
-        try:
-            msg = MIMEText(body, "html" if is_html else "plain")  # HTML 형식 지원
-            msg["Subject"] = subject
-            msg["From"] = self.smtp_settings.email
-            msg["To"] = self.smtp_settings.email
-
-            with smtplib.SMTP_SSL(
-                self.smtp_settings.server, int(self.smtp_settings.port)
-            ) as server:
-                server.login(self.smtp_settings.email, self.smtp_settings.password)
-                server.sendmail(
-                    self.smtp_settings.email,
-                    self.smtp_settings.email,
-                    msg.as_string(),
-                )
-
-            logger.info("메일 전송 완료!")
-        except Exception as e:
-            logger.error(f"메일 전송 실패: {e}")
+        notifier = EmailNotifier(self.data_manager.data.smtp_settings)
+        notifier.send_email(subject, body, is_html)
@@ -0,0 +1,182 @@
+import json
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from models.notification import Notification
+from modules import logger
+from modules.metrics import Metrics
+from modules.notifiers.base import BaseNotifier
+
+# 채널과 그 채널로 보낼 알림 묶음
+Delivery = Tuple[BaseNotifier, List[Notification]]
+
+
+class NotificationQueue:
+    """크롤링 루프와 분리된 알림 전송 대기열 (싱글톤).
+
+    제한된 크기의 대기열에 넣은 알림을 백그라운드 작업 스레드가 채널별로 동시에
+    전송하고, 끝내 전송하지 못한 알림은 dead letter 파일에 남깁니다.
+    """
+
+    _instance = None
+    _initialized = False
+
+    def __new__(cls, *args, **kwargs):
+        if not cls._instance:
+            cls._instance = super(NotificationQueue, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(
+        self,
+        dead_letter_path=os.path.join(os.getcwd(), "data/dead_letter.jsonl"),
+    ):
+        if self._initialized:  # 이미 초기화된 경우 무시
+            return
+        self.dead_letter_path = dead_letter_path
+        self.worker_count = int(os.getenv("NOTIFY_WORKERS", "1"))
+        self.put_timeout = float(os.getenv("NOTIFY_QUEUE_PUT_TIMEOUT", "5"))
+        self._queue: "queue.Queue[Optional[List[Delivery]]]" = queue.Queue(
+            maxsize=int(os.getenv("NOTIFY_QUEUE_SIZE", "100"))
+        )
+        self._workers: List[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._initialized = True
+
+    def _ensure_workers(self):
+        with self._lock:
+            self._workers = [worker for worker in self._workers if worker.is_alive()]
+            for index in range(len(self._workers), self.worker_count):
+                worker = threading.Thread(
+                    target=self._work,
+                    name=f"notifier-{index}",
+                    daemon=True,
+                )
+                worker.start()
+                self._workers.append(worker)
+
+    def submit(
+        self,
+        deliveries: List[Delivery],
+    ):
+        """채널별 알림 묶음을 대기열에 넣습니다. 대기열이 가득 차 있으면 dead letter로 보냅니다."""
+        deliveries = [(notifier, batch) for notifier, batch in deliveries if batch]
+        if not deliveries:
+            return
+        self._ensure_workers()
+        try:
+            self._queue.put(deliveries, timeout=self.put_timeout)
+            logger.info(
+                "알림 전송 대기열에 추가: "
+                + ", ".join(
+                    f"{notifier.name} {len(batch)}건" for notifier, batch in deliveries
+                )
+            )
+        except queue.Full:
+            for notifier, batch in deliveries:
+                self.dead_letter(notifier.name, batch, "알림 대기열이 가득 참")
+
+    def _work(self):
+        while True:
+            deliveries = self._queue.get()
+            try:
+                if deliveries is None:  # 종료 신호
+                    return
+                if len(deliveries) == 1:
+                    self._deliver(*deliveries[0])
+                    continue
+                # 채널끼리는 서로 기다리지 않도록 동시에 전송
+                with ThreadPoolExecutor(
+                    max_workers=len(deliveries),
+                    thread_name_prefix="notifier-channel",
+                ) as executor:
+                    for notifier, batch in deliveries:
+                        executor.submit(self._deliver, notifier, batch)
+            finally:
+                self._queue.task_done()
+
+    def _deliver(
+        self,
+        notifier: BaseNotifier,
+        notifications: List[Notification],
+    ):
+        try:
+            failed = notifier.send(notifications)
+        except Exception as e:
+            logger.error(f"[{notifier.name}] 알림 전송 중 오류: {e}")
+            failed = notifications
+        metrics = Metrics()
+        now = time.time()
+        failed_ids = {id(notification) for notification in failed}
+        for notification in notifications:
+            if id(notification) in failed_ids:
+                metrics.inc(
+                    "hotdeal_notifications_total",
+                    channel=notifier.name,
+                    result="failed",
+                )
+                continue
+            metrics.inc(
+                "hotdeal_notifications_total", channel=notifier.name, result="sent"
+            )
+            metrics.observe(
+                "hotdeal_notification_latency_seconds",
+                now - notification.created_at,
+                channel=notifier.name,
+            )
+        if failed:
+            self.dead_letter(notifier.name, failed, "재시도 후에도 전송 실패")
+
+    def dead_letter(
+        self,
+        channel: str,
+        notifications: List[Notification],
+        reason: str,
+    ):
+        """전송하지 못한 알림을 JSON Lines 파일에 기록합니다."""
+        with self._lock:
+            with open(self.dead_letter_path, "a", encoding="utf-8") as f:
+                for notification in notifications:
+                    f.write(
+                        json.dumps(
+                            {
+                                "time": datetime.now().isoformat(),
+                                "channel": channel,
+                                "reason": reason,
+                                "notification": asdict(notification),
+                            },
+                            ensure_ascii=False,
+                        )
+                        + "\n"
+                    )
+        logger.error(
+            f"[{channel}] 알림 {len(notifications)}건을 dead letter에 기록: {self.dead_letter_path} ({reason})"
+        )
+
+    def shutdown(
+        self,
+        timeout: float = None,
+    ):
+        """대기 중인 알림을 모두 보낸 뒤 작업 스레드를 종료합니다."""
+        timeout = timeout or float(os.getenv("NOTIFY_DRAIN_TIMEOUT", "120"))
+        with self._lock:
+            workers = [worker for worker in self._workers if worker.is_alive()]
+        if not workers:
+            return
+        logger.info(f"알림 대기열 정리 중 (남은 작업: {self._queue.qsize()})")
+        for _ in workers:
+            self._queue.put(None)
+        deadline = time.monotonic() + timeout
+        for worker in workers:
+            worker.join(max(deadline - time.monotonic(), 0))
+        with self._lock:
+            self._workers = [worker for worker in self._workers if worker.is_alive()]
+        if self._workers:
+            logger.warning("제한 시간 안에 알림 대기열을 모두 처리하지 못했습니다.")
+        else:
+            logger.info("알림 대기열 정리 완료")
@@ -0,0 +1,21 @@
+from .base import BaseNotifier, HttpNotifier
+from .slack import SlackNotifier
+from .smtp import EmailNotifier
+from .telegram import TelegramNotifier
+from .webhook import WebhookNotifier
+
+# data.json의 notifiers 항목에서 사용할 수 있는 채널 종류
+NOTIFIER_TYPES = {
+    notifier.type: notifier
+    for notifier in (EmailNotifier, WebhookNotifier, TelegramNotifier, SlackNotifier)
+}
+
+__all__ = [
+    "BaseNotifier",
+    "HttpNotifier",
+    "EmailNotifier",
+    "WebhookNotifier",
+    "TelegramNotifier",
+    "SlackNotifier",
+    "NOTIFIER_TYPES",
+]
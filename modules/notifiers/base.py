@@ -0,0 +1,126 @@
+import os
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional
+
+from models.notification import Notification
+from modules import logger
+from modules.http_client import HttpClient
+
+
+class BaseNotifier(ABC):
+    """알림 채널의 기본 추상 클래스."""
+
+    type = "base"
+
+    def __init__(
+        self,
+        name: Optional[str] = None,
+    ):
+        self.name = name or self.type
+        self.max_retries = int(os.getenv("NOTIFY_RETRIES", "3"))
+        self.retry_backoff = float(os.getenv("NOTIFY_RETRY_BACKOFF", "2"))
+
+    @abstractmethod
+    def send(
+        self,
+        notifications: List[Notification],
+    ) -> List[Notification]:
+        """알림 묶음을 전송하고, 전송하지 못한 알림 목록을 반환합니다."""
+        pass
+
+
+class HttpNotifier(BaseNotifier):
+    """공용 HTTP 세션으로 JSON을 POST하는 채널의 기본 클래스.
+
+    알림을 batch_size개씩 묶어 묶음마다 요청을 한 번 보냅니다.
+    """
+
+    # 채널이 한 요청에 받을 수 있는 최대 알림 수
+    max_batch_size = 50
+
+    def __init__(
+        self,
+        url: str,
+        name: Optional[str] = None,
+        batch_size: Optional[int] = None,
+        timeout: Optional[float] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ):
+        super().__init__(name)
+        self.url = url
+        self.batch_size = min(
+            batch_size or int(os.getenv("NOTIFY_BATCH_SIZE", "20")),
+            self.max_batch_size,
+        )
+        self.timeout = timeout or float(os.getenv("NOTIFY_HTTP_TIMEOUT", "10"))
+        self.headers = headers or {}
+
+    @abstractmethod
+    def payload(
+        self,
+        notifications: List[Notification],
+    ) -> dict:
+        """알림 묶음 하나를 요청 본문(JSON)으로 만듭니다."""
+        pass
+
+    def batches(
+        self,
+        notifications: List[Notification],
+    ) -> List[List[Notification]]:
+        return [
+            notifications[i : i + self.batch_size]
+            for i in range(0, len(notifications), self.batch_size)
+        ]
+
+    def post_json(
+        self,
+        payload: dict,
+    ) -> bool:
+        """요청을 보내고 성공 여부를 반환합니다.
+
+        연결 오류, 429, 5xx 응답은 지수 백오프 후 재시도하고 (429는 Retry-After 우선),
+        그 밖의 4xx 응답은 재시도하지 않습니다.
+        """
+        attempt = 0
+        while True:
+            retry_after = None
+            try:
+                response = HttpClient().post(
+                    self.url,
+                    json=payload,
+                    headers=self.headers,
+                    timeout=self.timeout,
+                )
+                if response.status_code < 400:
+                    return True
+                error = f"HTTP {response.status_code}"
+                if response.status_code != 429 and response.status_code < 500:
+                    logger.error(f"[{self.name}] 알림 전송 실패: {error}")
+                    return False
+                retry_after = response.headers.get("Retry-After")
+            except Exception as e:
+                error = e
+            attempt += 1
+            if attempt > self.max_retries:
+                logger.error(f"[{self.name}] 알림 전송 실패: {error}")
+                return False
+            delay = self.retry_backoff**attempt
+            if retry_after and retry_after.isdigit():
+                delay = float(retry_after)
+            logger.warning(
+                f"[{self.name}] 알림 전송 실패, {delay:.0f}초 후 재시도 ({attempt}/{self.max_retries}): {error}"
+            )
+            time.sleep(delay)
+
+    def send(
+        self,
+        notifications: List[Notification],
+    ) -> List[Notification]:
+        failed = []
+        for batch in self.batches(notifications):
+            if self.post_json(self.payload(batch)):
+                logger.info(f"[{self.name}] 알림 {len(batch)}건 전송 완료")
+            else:
+                failed += batch
+        return failed
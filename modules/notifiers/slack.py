@@ -0,0 +1,68 @@
+from typing import List
+
+from models.notification import Notification
+from modules.notifiers.base import HttpNotifier
+
+# 섹션 블록 텍스트 최대 길이
+MAX_SECTION_LENGTH = 3000
+
+
+def escape(
+    text: str,
+) -> str:
+    """슬랙 mrkdwn 제어 문자를 이스케이프합니다."""
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+class SlackNotifier(HttpNotifier):
+    """슬랙 Incoming Webhook으로 알림을 보내는 채널.
+
+    알림 하나당 블록 두 개(제목, 상품 목록)를 쓰므로 메시지 하나에 최대 25건씩 묶습니다.
+    """
+
+    type = "slack"
+    # 메시지 하나에 블록은 최대 50개
+    max_batch_size = 25
+
+    def section(
+        self,
+        notification: Notification,
+    ) -> str:
+        text = ""
+        products = notification.products
+        for index, product in enumerate(products):
+            line = (
+                f"• <{escape(product.current_link or '')}|{escape(product.current_title or '')}>"
+                f" - {escape(notification.price_text(product))}\n"
+            )
+            rest = f"… 외 {len(products) - index}건"
+            if len(text) + len(line) + len(rest) > MAX_SECTION_LENGTH:
+                return text + rest
+            text += line
+        return text or "-"
+
+    def payload(
+        self,
+        notifications: List[Notification],
+    ) -> dict:
+        blocks = []
+        for notification in notifications:
+            blocks.append(
+                {
+                    "type": "section",
+                    "text": {
+                        "type": "mrkdwn",
+                        "text": f"*{escape(notification.subject)}*",
+                    },
+                }
+            )
+            blocks.append(
+                {
+                    "type": "section",
+                    "text": {"type": "mrkdwn", "text": self.section(notification)},
+                }
+            )
+        return {
+            "text": ", ".join(notification.subject for notification in notifications),
+            "blocks": blocks,
+        }
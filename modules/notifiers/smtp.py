@@ -0,0 +1,181 @@
+import html
+import os
+import smtplib
+import time
+from email.mime.text import MIMEText
+from functools import lru_cache
+from string import Template
+from typing import List, Optional
+from urllib.parse import quote
+
+from models.data import SmtpSettings
+from models.notification import Notification
+from modules import logger
+from modules.notifiers.base import BaseNotifier
+
+TEMPLATE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "templates"
+)
+
+
+@lru_cache(maxsize=None)
+def load_template(
+    name: str,
+) -> Template:
+    with open(os.path.join(TEMPLATE_DIR, name), "r", encoding="utf-8") as f:
+        return Template(f.read())
+
+
+class EmailNotifier(BaseNotifier):
+    """메일 알림 채널.
+
+    여러 알림을 하나의 SMTP 연결로 보냅니다 (digest=True이면 한 통의 요약 메일).
+    """
+
+    type = "email"
+
+    def __init__(
+        self,
+        smtp_settings: SmtpSettings,
+        name: Optional[str] = None,
+        digest: Optional[bool] = None,
+    ):
+        super().__init__(name)
+        self.smtp_settings = smtp_settings
+        self.digest = (
+            os.getenv("NOTIFY_DIGEST", "false").lower() == "true"
+            if digest is None
+            else digest
+        )
+        self.smtp_timeout = float(os.getenv("SMTP_TIMEOUT", "30"))
+
+    def render(
+        self,
+        notification: Notification,
+    ) -> str:
+        """알림 하나의 HTML 본문을 템플릿으로 만듭니다."""
+        if notification.mode == "initial":
+            item_template = load_template("item_initial.html")
+        else:
+            item_template = load_template("item_update.html")
+        items = "".join(
+            item_template.substitute(
+                link=html.escape(product.current_link or "", quote=True),
+                title=html.escape(product.current_title or ""),
+                price=html.escape(notification.price_text(product)),
+            )
+            for product in notification.products
+        )
+        return load_template("keyword_section.html").substitute(
+            keyword_url=quote(notification.keyword),
+            items=items,
+        )
+
+    def build_messages(
+        self,
+        notifications: List[Notification],
+    ) -> List[MIMEText]:
+        if not notifications:
+            return []
+        if not self.digest:
+            return [
+                self.build_message(notification.subject, self.render(notification))
+                for notification in notifications
+            ]
+        sections = "".join(
+            load_template("digest_section.html").substitute(
+                subject=html.escape(notification.subject),
+                body=self.render(notification),
+            )
+            for notification in notifications
+        )
+        body = load_template("digest.html").substitute(
+            count=len(notifications),
+            sections=sections,
+        )
+        keywords = ", ".join(notification.keyword for notification in notifications)
+        return [self.build_message(f"[핫딜 알림] {keywords}", body)]
+
+    def build_message(
+        self,
+        subject: str,
+        body: str,
+        is_html: bool = True,
+    ) -> MIMEText:
+        """설정된 주소로 보낼 메일 한 통을 만듭니다."""
+        msg = MIMEText(body, "html" if is_html else "plain")  # HTML 형식 지원
+        msg["Subject"] = subject
+        msg["From"] = self.smtp_settings.email
+        msg["To"] = self.smtp_settings.email
+        return msg
+
+    def _connect(self) -> smtplib.SMTP:
+        security = (self.smtp_settings.security or "ssl").lower()
+        port = int(self.smtp_settings.port)
+        if security == "ssl":
+            server = smtplib.SMTP_SSL(
+                self.smtp_settings.server, port, timeout=self.smtp_timeout
+            )
+        else:
+            server = smtplib.SMTP(
+                self.smtp_settings.server, port, timeout=self.smtp_timeout
+            )
+            if security == "starttls":
+                server.starttls()
+        if self.smtp_settings.password:
+            server.login(self.smtp_settings.email, self.smtp_settings.password)
+        return server
+
+    def send(
+        self,
+        notifications: List[Notification],
+    ) -> List[Notification]:
+        messages = self.build_messages(notifications)
+        sent = self.send_messages(messages)
+        if self.digest:
+            return [] if sent else list(notifications)
+        return list(notifications[sent:])
+
+    def send_email(
+        self,
+        subject: str,
+        body: str,
+        is_html: bool = True,
+    ) -> bool:
+        """알림 형식이 아닌 메일 한 통을 보냅니다. 전송 여부를 반환합니다."""
+        return self.send_messages([self.build_message(subject, body, is_html)]) == 1
+
+    def send_messages(
+        self,
+        messages: List[MIMEText],
+    ) -> int:
+        """하나의 인증된 SMTP 연결로 여러 메일을 보냅니다.
+
+        연결이 끊기면 지수 백오프 후 다시 연결하여 남은 메일부터 이어서 보냅니다.
+        보낸 메일 수를 반환합니다.
+        """
+        remaining = list(messages)
+        attempt = 0
+        while remaining:
+            try:
+                with self._connect() as server:
+                    while remaining:
+                        server.sendmail(
+                            self.smtp_settings.email,
+                            self.smtp_settings.email,
+                            remaining[0].as_string(),
+                        )
+                        remaining.pop(0)
+                        logger.info("메일 전송 완료!")
+                logger.info(f"알림 완료! ({len(messages)}통 전송)")
+            except Exception as e:
+                attempt += 1
+                if attempt > self.max_retries:
+                    logger.error(f"메일 전송 실패 ({len(remaining)}통 미전송): {e}")
+                    break
+                delay = self.retry_backoff**attempt
+                logger.warning(
+                    f"메일 전송 실패, {delay:.0f}초 후 재시도 ({attempt}/{self.max_retries}): {e}"
+                )
+                time.sleep(delay)
+        return len(messages) - len(remaining)
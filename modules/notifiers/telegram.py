@@ -0,0 +1,82 @@
+import html
+from typing import List, Optional
+
+from models.notification import Notification
+from modules.notifiers.base import HttpNotifier
+
+# 텔레그램 메시지 최대 길이
+MAX_MESSAGE_LENGTH = 4096
+
+
+class TelegramNotifier(HttpNotifier):
+    """텔레그램 봇 API(sendMessage)로 알림을 보내는 채널.
+
+    여러 알림을 메시지 길이 제한 안에서 한 메시지로 묶어 보냅니다.
+    """
+
+    type = "telegram"
+
+    def __init__(
+        self,
+        token: str,
+        chat_id: str,
+        name: Optional[str] = None,
+        api_url: str = "https://api.telegram.org",
+        **kwargs,
+    ):
+        super().__init__(
+            url=f"{api_url.rstrip('/')}/bot{token}/sendMessage",
+            name=name,
+            **kwargs,
+        )
+        self.chat_id = chat_id
+
+    def render(
+        self,
+        notification: Notification,
+    ) -> str:
+        """알림 하나를 HTML 서식의 텍스트로 만듭니다 (길이 제한을 넘는 상품은 생략)."""
+        text = f"<b>{html.escape(notification.subject)}</b>"
+        products = notification.products
+        for index, product in enumerate(products):
+            line = (
+                f"\n• <a href=\"{html.escape(product.current_link or '', quote=True)}\">"
+                f"{html.escape(product.current_title or '')}</a>"
+                f" - {html.escape(notification.price_text(product))}"
+            )
+            rest = f"\n… 외 {len(products) - index}건"
+            if len(text) + len(line) + len(rest) > MAX_MESSAGE_LENGTH:
+                return text + rest
+            text += line
+        return text
+
+    def batches(
+        self,
+        notifications: List[Notification],
+    ) -> List[List[Notification]]:
+        batches, length = [], 0
+        for notification in notifications:
+            size = len(self.render(notification)) + 2
+            if (
+                not batches
+                or len(batches[-1]) >= self.batch_size
+                or length + size > MAX_MESSAGE_LENGTH
+            ):
+                batches.append([])
+                length = 0
+            batches[-1].append(notification)
+            length += size
+        return batches
+
+    def payload(
+        self,
+        notifications: List[Notification],
+    ) -> dict:
+        return {
+            "chat_id": self.chat_id,
+            "text": "\n\n".join(
+                self.render(notification) for notification in notifications
+            ),
+            "parse_mode": "HTML",
+            "disable_web_page_preview": True,
+        }
@@ -0,0 +1,37 @@
+from typing import List
+
+from models.notification import Notification
+from modules.notifiers.base import HttpNotifier
+
+
+class WebhookNotifier(HttpNotifier):
+    """알림 묶음을 그대로 JSON으로 POST하는 범용 웹훅 채널."""
+
+    type = "webhook"
+
+    def payload(
+        self,
+        notifications: List[Notification],
+    ) -> dict:
+        return {
+            "count": len(notifications),
+            "notifications": [
+                {
+                    "keyword": notification.keyword,
+                    "mode": notification.mode,
+                    "subject": notification.subject,
+                    "items": [
+                        {
+                            "id": product.current_id,
+                            "title": product.current_title,
+                            "link": product.current_link,
+                            "price": product.current_price,
+                            "all_time_low": product.current_id in notification.lowest,
+                            "previous_low": notification.lowest.get(product.current_id),
+                        }
+                        for product in notification.products
+                    ],
+                }
+                for notification in notifications
+            ],
+        }
@@ -0,0 +1,54 @@
+import os
+
+from modules import logger
+
+try:
+    from lxml import etree
+    from lxml import html as lxml_html
+
+    HAS_LXML = True
+except ImportError:  # lxml이 없으면 BeautifulSoup만 사용
+    etree = None
+    lxml_html = None
+    HAS_LXML = False
+
+
+def resolve_backend() -> str:
+    """PARSER_BACKEND 환경변수(auto/lxml/bs4)에 따라 사용할 파서를 결정합니다."""
+    backend = os.getenv("PARSER_BACKEND", "auto").lower()
+    if backend == "bs4":
+        return "bs4"
+    if backend not in ("auto", "lxml"):
+        logger.warning(f"알 수 없는 PARSER_BACKEND: {backend}. auto로 동작합니다.")
+    if HAS_LXML:
+        return "lxml"
+    if backend == "lxml":
+        logger.warning("lxml이 설치되어 있지 않아 BeautifulSoup 파서를 사용합니다.")
+    return "bs4"
+
+
+def has_class(
+    class_name: str,
+) -> str:
+    """CSS의 .class_name과 같은 의미의 XPath 조건식."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')"
+
+
+def compile_xpath(
+    expression: str,
+):
+    """미리 컴파일한 XPath 선택자를 반환합니다 (lxml이 없으면 None)."""
+    return etree.XPath(expression) if HAS_LXML else None
+
+
+def parse_document(
+    html: str,
+):
+    """HTML 문자열을 lxml 트리로 파싱합니다."""
+    return lxml_html.fromstring(html)
+
+
+def element_classes(
+    element,
+) -> list:
+    return (element.get("class") or "").split()
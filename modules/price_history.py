@@ -0,0 +1,433 @@
+import bisect
+import hashlib
+import json
+import mmap
+import os
+import shutil
+import threading
+import time
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from models.keyword_data import KeywordData
+from modules import logger
+from modules.file_utils import atomic_write_json, file_lock
+from modules.rule_engine import parse_price
+
+# 열 이름: array 타입 코드 (행마다 26바이트)
+COLUMNS = {
+    "ts": "d",  # 기록 시각 (unix time, 파일 안에서 오름차순)
+    "keyword": "I",  # 키워드 ID (meta.json의 keywords 인덱스)
+    "site": "H",  # 사이트 ID (meta.json의 sites 인덱스)
+    "price": "I",  # 가격 (원)
+    "item": "Q",  # 사이트 + 상품 ID의 해시
+}
+MAX_PRICE = 2**32 - 1
+
+# (기록 시각, 사이트 ID, 가격, 상품 해시)
+Row = Tuple[float, int, int, int]
+
+
+def item_hash(
+    sitename: str,
+    current_id: Optional[str],
+) -> int:
+    digest = hashlib.blake2b(
+        f"{sitename}:{current_id}".encode("utf-8"), digest_size=8
+    ).digest()
+    return int.from_bytes(digest, "little")
+
+
+class PriceHistory:
+    """상품 가격 기록 (싱글톤).
+
+    크롤링한 상품의 가격을 열별 배열 파일(data/price_history/g{세대}/*.bin)에
+    덧붙이기만 하고, 읽을 때는 mmap으로 매핑하여 파이썬 객체로 불러오지 않고 훑습니다.
+    같은 상품은 최근 기간(recent_window)의 마지막 기록과 가격이 달라졌을 때만 다시 기록합니다.
+    기록 시각이 오름차순이므로 기간 조회는 이진 탐색으로 시작 위치를 찾고,
+    키워드별 최저가는 새로 추가된 행만 이어서 훑어 캐시합니다.
+    파일 다시 매핑과 최저가 갱신은 사이클마다 begin_cycle에서 한 번만 합니다.
+    보존 기간이 지난 행은 compact에서 새 세대 폴더로 옮겨 쓰며 정리합니다.
+    여러 작업자 프로세스가 같은 폴더를 쓰므로 쓰기는 파일 잠금 안에서 합니다.
+    """
+
+    _instance = None
+    _initialized = False
+
+    def __new__(cls, *args, **kwargs):
+        if not cls._instance:
+            cls._instance = super(PriceHistory, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(
+        self,
+        path=os.path.join(os.getcwd(), "data/price_history"),
+    ):
+        if self._initialized:  # 이미 초기화된 경우 무시
+            return
+        self.enabled = os.getenv("PRICE_HISTORY", "true").lower() != "false"
+        self.path = path
+        self.meta_path = os.path.join(path, "meta.json")
+        # 보존 기간(일, 0이면 계속 보관)과, 지난 행이 이 비율 이상일 때만 압축
+        self.retention = float(os.getenv("PRICE_HISTORY_RETENTION_DAYS", "365")) * 86400
+        self.compact_ratio = float(os.getenv("PRICE_HISTORY_COMPACT_RATIO", "0.2"))
+        # 이전 기록이 이 수 이상인 키워드만 역대 최저가를 표시
+        self.min_records = int(os.getenv("PRICE_LOW_MIN_RECORDS", "3"))
+        # 가격이 그대로인 상품을 다시 기록하지 않도록 마지막 가격을 찾아보는 최근 기간(일)
+        self.recent_window = float(os.getenv("PRICE_HISTORY_RECENT_DAYS", "7")) * 86400
+        self.generation = 0
+        self.names: Dict[str, List[str]] = {"keywords": [], "sites": []}
+        self.ids: Dict[str, Dict[str, int]] = {"keywords": {}, "sites": {}}
+        self.rows = 0
+        self._maps: Dict[str, mmap.mmap] = {}
+        self._views: Dict[str, memoryview] = {}
+        # 키워드 ID: (최저가, 기록 수) - 앞의 _scanned 행까지 반영
+        self._lows: Dict[int, Tuple[int, int]] = {}
+        self._scanned = 0
+        self._lock = threading.RLock()
+        self._initialized = True
+
+    def _folder(
+        self,
+        generation: int,
+    ) -> str:
+        return os.path.join(self.path, f"g{generation}")
+
+    def _column_path(
+        self,
+        name: str,
+        generation: Optional[int] = None,
+    ) -> str:
+        folder = self._folder(self.generation if generation is None else generation)
+        return os.path.join(folder, f"{name}.bin")
+
+    def _load_meta(self):
+        """meta.json을 다시 읽고, 다른 프로세스가 압축하여 세대가 바뀌었으면 매핑을 초기화합니다."""
+        try:
+            with open(self.meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+        except FileNotFoundError:
+            meta = {"generation": 0, "keywords": [], "sites": []}
+        if meta["generation"] != self.generation:
+            self._unmap()
+            self._reset_scan()
+        self.generation = meta["generation"]
+        for kind in ("keywords", "sites"):
+            self.names[kind] = list(meta.get(kind, []))
+            self.ids[kind] = {name: i for i, name in enumerate(self.names[kind])}
+
+    def _reset_scan(self):
+        self._lows, self._scanned = {}, 0
+
+    def _save_meta(self):
+        atomic_write_json(
+            self.meta_path,
+            {"generation": self.generation, **self.names},
+            indent=None,
+        )
+
+    def _intern(
+        self,
+        kind: str,
+        name: str,
+    ) -> Tuple[int, bool]:
+        """이름의 ID를 반환합니다 (새로 등록했으면 두 번째 값이 True)."""
+        if name in self.ids[kind]:
+            return self.ids[kind][name], False
+        self.names[kind].append(name)
+        self.ids[kind][name] = len(self.names[kind]) - 1
+        return self.ids[kind][name], True
+
+    def _file_rows(self) -> int:
+        """모든 열 파일에 온전히 쓰인 행 수."""
+        rows = []
+        for name, typecode in COLUMNS.items():
+            try:
+                size = os.path.getsize(self._column_path(name))
+            except OSError:
+                return 0
+            rows.append(size // array(typecode).itemsize)
+        return min(rows)
+
+    def _unmap(self):
+        for view in self._views.values():
+            view.release()
+        for mapped in self._maps.values():
+            try:
+                mapped.close()
+            except BufferError:
+                # 아직 훑는 중인 scan이 있으면 참조가 사라질 때 닫힘
+                pass
+        self._views, self._maps, self.rows = {}, {}, 0
+
+    def _refresh(self):
+        """파일에 새로 추가된 행까지 다시 매핑합니다."""
+        self._load_meta()
+        rows = self._file_rows()
+        if rows == self.rows:
+            return
+        self._unmap()
+        if rows:
+            for name, typecode in COLUMNS.items():
+                with open(self._column_path(name), "rb") as f:
+                    mapped = mmap.mmap(
+                        f.fileno(),
+                        rows * array(typecode).itemsize,
+                        access=mmap.ACCESS_READ,
+                    )
+                self._maps[name] = mapped
+                self._views[name] = memoryview(mapped).cast(typecode)
+        self.rows = rows
+
+    def append(
+        self,
+        keyword: str,
+        sitename: str,
+        items: List[KeywordData],
+        now: Optional[float] = None,
+    ) -> int:
+        """가격을 알 수 있는 상품을 기록하고 기록한 행 수를 반환합니다."""
+        columns = {name: array(typecode) for name, typecode in COLUMNS.items()}
+        os.makedirs(self.path, exist_ok=True)
+        with self._lock, file_lock(self.meta_path):
+            self._load_meta()
+            keyword_id, new_keyword = self._intern("keywords", keyword)
+            site_id, new_site = self._intern("sites", sitename)
+            os.makedirs(self._folder(self.generation), exist_ok=True)
+            # 중단된 쓰기로 열 길이가 다르면 가장 짧은 열에 맞춘다
+            rows = self._file_rows()
+            last_ts = 0.0
+            for name, typecode in COLUMNS.items():
+                path = self._column_path(name)
+                with open(path, "ab+") as f:
+                    f.truncate(rows * array(typecode).itemsize)
+                    if name == "ts" and rows:
+                        f.seek((rows - 1) * array(typecode).itemsize)
+                        last_ts = array(typecode, f.read(array(typecode).itemsize))[0]
+            # 여러 프로세스가 쓰더라도 시각이 오름차순이 되도록
+            ts = max(time.time() if now is None else now, last_ts)
+            for item in items:
+                price = parse_price(item.current_price)
+                if price is None or price > MAX_PRICE:
+                    continue
+                columns["ts"].append(ts)
+                columns["keyword"].append(keyword_id)
+                columns["site"].append(site_id)
+                columns["price"].append(price)
+                columns["item"].append(item_hash(sitename, item.current_id))
+            if not columns["ts"]:
+                return 0
+            if new_keyword or new_site:
+                self._save_meta()
+            for name, values in columns.items():
+                with open(self._column_path(name), "ab") as f:
+                    values.tofile(f)
+            # 앞의 행을 모두 훑은 상태면 방금 쓴 행도 최저가에 바로 반영 (다음 begin_cycle에서 다시 훑지 않음)
+            if self._scanned == rows:
+                self._fold_lows(keyword_id, columns["price"])
+                self._scanned = rows + len(columns["ts"])
+        return len(columns["ts"])
+
+    def scan(
+        self,
+        keyword: Optional[str] = None,
+        sitename: Optional[str] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+    ) -> Iterator[Row]:
+        """조건에 맞는 행을 오래된 순으로 돌려줍니다 (기간은 이진 탐색으로 찾음)."""
+        with self._lock:
+            self._refresh()
+            if not self.rows:
+                return
+            keyword_id = self.ids["keywords"].get(keyword) if keyword else None
+            site_id = self.ids["sites"].get(sitename) if sitename else None
+            if (keyword and keyword_id is None) or (sitename and site_id is None):
+                return
+            ts = self._views["ts"]
+            start = bisect.bisect_left(ts, since) if since is not None else 0
+            end = bisect.bisect_right(ts, until) if until is not None else self.rows
+            # 복사 없이 매핑된 범위만 잘라 둔다
+            columns = [self._views[name][start:end] for name in COLUMNS]
+        for row_ts, row_keyword, row_site, price, item in zip(*columns):
+            if keyword_id is not None and row_keyword != keyword_id:
+                continue
+            if site_id is not None and row_site != site_id:
+                continue
+            yield row_ts, row_site, price, item
+
+    def lowest(
+        self,
+        keyword: str,
+        sitename: Optional[str] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+    ) -> Optional[int]:
+        """기간 내 최저가 (기록이 없으면 None)."""
+        return min(
+            (row[2] for row in self.scan(keyword, sitename, since, until)), default=None
+        )
+
+    def _fold_lows(
+        self,
+        keyword_id: int,
+        prices: Iterable[int],
+    ):
+        for price in prices:
+            low = self._lows.get(keyword_id)
+            if low is None:
+                self._lows[keyword_id] = (price, 1)
+            else:
+                self._lows[keyword_id] = (min(low[0], price), low[1] + 1)
+
+    def begin_cycle(self):
+        """파일에 새로 추가된 행까지 다시 매핑하고, 마지막으로 훑은 뒤 추가된 행을 키워드별 최저가에 반영합니다.
+
+        사이클 시작 시 한 번만 호출하며, 사이클 동안의 조회는 이때 매핑한 행을 씁니다.
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            try:
+                self._refresh()
+            except (OSError, ValueError) as e:
+                logger.error(f"가격 기록 읽기 실패: {e}")
+                return
+            if self._scanned >= self.rows:
+                return
+            for row_keyword, price in zip(
+                self._views["keyword"][self._scanned : self.rows],
+                self._views["price"][self._scanned : self.rows],
+            ):
+                self._fold_lows(row_keyword, (price,))
+            self._scanned = self.rows
+
+    def all_time_low(
+        self,
+        keyword: str,
+    ) -> Tuple[Optional[int], int]:
+        """키워드의 (보존 기간 내 최저가, 기록 수). begin_cycle과 이 프로세스의 기록까지 반영합니다."""
+        with self._lock:
+            keyword_id = self.ids["keywords"].get(keyword)
+            return self._lows.get(keyword_id, (None, 0))
+
+    def last_prices(
+        self,
+        keyword: str,
+        hashes: Set[int],
+        since: float,
+    ) -> Dict[int, int]:
+        """since 이후의 행을 최신 순으로 훑어 상품 해시별 마지막 가격을 찾습니다 (모두 찾으면 멈춤)."""
+        found: Dict[int, int] = {}
+        with self._lock:
+            keyword_id = self.ids["keywords"].get(keyword)
+            if keyword_id is None or not self.rows or not hashes:
+                return found
+            start = bisect.bisect_left(self._views["ts"], since)
+            keywords = self._views["keyword"]
+            prices = self._views["price"]
+            items = self._views["item"]
+            for row in range(self.rows - 1, start - 1, -1):
+                item = items[row]
+                if item in hashes and item not in found and keywords[row] == keyword_id:
+                    found[item] = prices[row]
+                    if len(found) == len(hashes):
+                        break
+        return found
+
+    def changed(
+        self,
+        keyword: str,
+        sitename: str,
+        items: List[KeywordData],
+    ) -> List[KeywordData]:
+        """최근 기간에 기록이 없거나 마지막 기록과 가격이 달라진 상품만 반환합니다."""
+        priced = []
+        for item in items:
+            price = parse_price(item.current_price)
+            if price is None or price > MAX_PRICE:
+                continue
+            priced.append((item, price, item_hash(sitename, item.current_id)))
+        last = self.last_prices(
+            keyword,
+            {hashed for _, _, hashed in priced},
+            time.time() - self.recent_window,
+        )
+        result = []
+        recorded = set()
+        for item, price, hashed in priced:
+            if (hashed, price) in recorded or last.get(hashed) == price:
+                continue
+            recorded.add((hashed, price))
+            result.append(item)
+        return result
+
+    def record(
+        self,
+        keyword: str,
+        sitename: str,
+        items: List[KeywordData],
+    ) -> Dict[str, int]:
+        """크롤링한 상품 중 처음 보거나 가격이 바뀐 상품을 기록하고,
+        그중 기록 전 최저가 이하인 상품을 {상품 ID: 이전 최저가}로 반환합니다.
+        """
+        if not self.enabled or not items:
+            return {}
+        try:
+            items = self.changed(keyword, sitename, items)
+            if not items:
+                return {}
+            low, count = self.all_time_low(keyword)
+            lowest = {}
+            if low is not None and count >= self.min_records:
+                for item in items:
+                    price = parse_price(item.current_price)
+                    if price is not None and price <= low:
+                        lowest[item.current_id] = low
+            self.append(keyword, sitename, items)
+        except (OSError, ValueError) as e:
+            logger.error(f"[{keyword}] 가격 기록 실패: {e}")
+            return {}
+        if lowest:
+            logger.info(
+                f"[{keyword}] 역대 최저가 상품 {len(lowest)}개 (이전 최저 {low:,}원)"
+            )
+        return lowest
+
+    def compact(
+        self,
+        now: Optional[float] = None,
+    ) -> int:
+        """보존 기간이 지난 행이 compact_ratio 이상이면 새 세대로 옮겨 쓰고, 지운 행 수를 반환합니다."""
+        if not self.enabled or self.retention <= 0 or not os.path.exists(self.path):
+            return 0
+        cutoff = (time.time() if now is None else now) - self.retention
+        with self._lock, file_lock(self.meta_path):
+            self._refresh()
+            if not self.rows:
+                return 0
+            start = bisect.bisect_left(self._views["ts"], cutoff)
+            if start == 0 or start < self.rows * self.compact_ratio:
+                return 0
+            old_generation = self.generation
+            new_generation = old_generation + 1
+            folder = self._folder(new_generation)
+            shutil.rmtree(folder, ignore_errors=True)
+            os.makedirs(folder)
+            for name in COLUMNS:
+                with open(self._column_path(name, new_generation), "wb") as f:
+                    f.write(self._views[name][start : self.rows])
+                    f.flush()
+                    os.fsync(f.fileno())
+            self.generation = new_generation
+            self._save_meta()
+            removed = start
+            self._unmap()
+            self._reset_scan()
+            shutil.rmtree(self._folder(old_generation), ignore_errors=True)
+        logger.info(f"가격 기록 압축: 보존 기간이 지난 {removed}건 삭제")
+        return removed
+
+    def close(self):
+        with self._lock:
+            self._unmap()
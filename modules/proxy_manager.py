@@ -1,11 +1,25 @@
-import requests
-from bs4 import BeautifulSoup
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+from typing import Dict, List
 
+from models.proxy_data import ProxyStats
 from modules import logger
+from modules.file_utils import atomic_write_json
+from modules.http_client import HttpClient
+from modules.proxy_sources import BaseProxySource, create_proxy_source
 
 
 class ProxyManager:
-    """싱글톤 프록시 관리자."""
+    """싱글톤 프록시 관리자.
+
+    프록시별 성공률/응답 시간을 기록하여 점수가 높은 순으로 사용하고,
+    점수는 data/proxy_scores.json에 저장해 사이클이 바뀌어도 유지합니다.
+    프록시 목록은 처음 필요할 때(차단 응답) 가져와 TTL 동안 재사용합니다.
+    """
 
     _instance = None
     _initialized = False
@@ -15,44 +29,191 @@ class ProxyManager:
             cls._instance = super(ProxyManager, cls).__new__(cls)
         return cls._instance
 
-    def __init__(self, proxy_url="https://www.sslproxies.org/"):
+    def __init__(
+        self,
+        source: BaseProxySource = None,
+        scores_path=os.path.join(os.getcwd(), "data/proxy_scores.json"),
+    ):
         if self._initialized:  # 이미 초기화된 경우 무시
             return
-        self.proxy_url = proxy_url
+        self.source: BaseProxySource = source or create_proxy_source()
+        self.scores_path = scores_path
         self.proxies = []
+        self.fetched_at = 0.0
+        # 목록 유지 시간, 재수집 기준 성공률, 재수집 최소 간격(초)
+        self.ttl = float(os.getenv("PROXY_TTL", "3600"))
+        self.min_health = float(os.getenv("PROXY_MIN_HEALTH", "0.3"))
+        self.min_refresh_interval = float(os.getenv("PROXY_MIN_REFRESH_INTERVAL", "60"))
+        # 검증할 후보 수, 사용할 프록시 수, 검증 요청 설정
+        self.candidate_count = int(os.getenv("PROXY_CANDIDATES", "50"))
+        self.pool_size = int(os.getenv("PROXY_POOL_SIZE", "15"))
+        self.probe_url = os.getenv(
+            "PROXY_PROBE_URL", "https://www.algumon.com/robots.txt"
+        )
+        self.probe_timeout = float(os.getenv("PROXY_PROBE_TIMEOUT", "5"))
+        self.probe_workers = int(os.getenv("PROXY_PROBE_WORKERS", "20"))
+        # EWMA 가중치 (클수록 최근 결과를 많이 반영)
+        self.decay = float(os.getenv("PROXY_SCORE_DECAY", "0.3"))
+        self.max_tracked = int(os.getenv("PROXY_MAX_TRACKED", "500"))
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self.stats: Dict[str, ProxyStats] = self._load_stats()
         self._initialized = True
 
-    def fetch_proxies(self):
-        """무료 프록시를 수집하여 저장."""
+    def _load_stats(self) -> Dict[str, ProxyStats]:
+        if not os.path.exists(self.scores_path):
+            return {}
+        try:
+            with open(self.scores_path, "r") as f:
+                return {
+                    proxy: ProxyStats(**stats) for proxy, stats in json.load(f).items()
+                }
+        except (json.JSONDecodeError, OSError, TypeError):
+            logger.error(
+                f"프록시 점수 파일이 손상되어 새로 만듭니다: {self.scores_path}"
+            )
+            return {}
+
+    def save_stats(self):
+        """프록시 점수를 디스크에 저장합니다 (오래 확인하지 않은 프록시부터 정리)."""
+        with self._lock:
+            tracked = sorted(
+                self.stats.values(), key=lambda stats: stats.last_checked, reverse=True
+            )[: self.max_tracked]
+            self.stats = {stats.proxy: stats for stats in tracked}
+            data = {stats.proxy: asdict(stats) for stats in tracked}
+        if data:
+            atomic_write_json(self.scores_path, data)
+
+    def record(
+        self,
+        proxy: str,
+        success: bool,
+        latency: float = None,
+    ):
+        """프록시 사용 결과를 점수에 반영합니다."""
+        with self._lock:
+            stats = self.stats.setdefault(proxy, ProxyStats(proxy=proxy))
+            stats.success_rate = (1 - self.decay) * stats.success_rate + self.decay * (
+                1.0 if success else 0.0
+            )
+            if success and latency is not None:
+                stats.latency = (
+                    latency
+                    if stats.latency is None
+                    else (1 - self.decay) * stats.latency + self.decay * latency
+                )
+            stats.attempts += 1
+            stats.last_checked = time.time()
+
+    def ranked(
+        self,
+        proxies: List[str] = None,
+    ) -> List[str]:
+        """점수가 높은 순으로 정렬한 프록시 목록."""
+        proxies = self.proxies if proxies is None else proxies
+        with self._lock:
+            return sorted(
+                proxies,
+                key=lambda proxy: self.stats.get(proxy, ProxyStats(proxy)).score,
+                reverse=True,
+            )
+
+    def _probe(
+        self,
+        proxy: str,
+    ) -> bool:
+        """짧은 타임아웃으로 프록시가 동작하는지 확인합니다."""
+        start = time.monotonic()
         try:
-            response = requests.get(self.proxy_url, timeout=30)
-            response.raise_for_status()
+            response = HttpClient().get(
+                self.probe_url, proxy=proxy, timeout=self.probe_timeout
+            )
+            success = response.status_code < 400
+        except Exception:
+            success = False
+        self.record(proxy, success, time.monotonic() - start)
+        return success
+
+    def validate(
+        self,
+        candidates: List[str],
+    ) -> List[str]:
+        """후보 프록시를 동시에 검증하여 통과한 것만 점수 순으로 반환합니다."""
+        if not candidates:
+            return []
+        with ThreadPoolExecutor(
+            max_workers=min(self.probe_workers, len(candidates)),
+            thread_name_prefix="proxy-probe",
+        ) as executor:
+            results = list(executor.map(self._probe, candidates))
+        alive = [proxy for proxy, ok in zip(candidates, results) if ok]
+        logger.info(f"프록시 검증 완료: {len(alive)}/{len(candidates)}개 사용 가능")
+        return self.ranked(alive)
+
+    def health(self) -> float:
+        """현재 프록시 목록에서 가장 좋은 성공률 (목록이 비어 있으면 0)."""
+        with self._lock:
+            return max(
+                (
+                    self.stats[proxy].success_rate
+                    for proxy in self.proxies
+                    if proxy in self.stats
+                ),
+                default=0.0,
+            )
 
-            soup = BeautifulSoup(response.content, "html.parser")
-            table = soup.find("table", {"class": "table table-striped table-bordered"})
+    def needs_refresh(self) -> bool:
+        if time.time() - self.fetched_at < self.min_refresh_interval:
+            return False
+        if not self.proxies:
+            return True
+        if time.time() - self.fetched_at > self.ttl:
+            logger.info("프록시 목록 유지 시간이 지나 다시 가져옵니다.")
+            return True
+        if self.health() < self.min_health:
+            logger.info("프록시 목록의 성공률이 낮아 다시 가져옵니다.")
+            return True
+        return False
 
-            if not table:
-                logger.warning("프록시 테이블을 찾을 수 없습니다.")
-                return []
+    def get_proxies(self) -> List[str]:
+        """필요할 때만 프록시를 가져와 점수 순으로 반환합니다 (동시 호출 시 한 번만 수집)."""
+        with self._refresh_lock:
+            if self.needs_refresh():
+                self.fetch_proxies()
+        return self.ranked()
+
+    def fetch_proxies(self):
+        """프록시 소스에서 후보를 수집하고 검증하여 점수 순으로 저장."""
+        self.fetched_at = time.time()
+        try:
+            candidates = self.source.fetch()[: self.candidate_count]
+            # 이전 사이클에서 점수가 좋았던 프록시도 다시 후보로 검증
+            candidates += [
+                proxy
+                for proxy in self.ranked(list(self.stats))[: self.pool_size]
+                if proxy not in candidates
+            ]
 
-            rows = table.find("tbody").find_all("tr")
-            self.proxies = [
-                f"http://{row.find_all('td')[0].text.strip()}:{row.find_all('td')[1].text.strip()}"
-                for row in rows
-                if row.find_all("td")[6].text.strip().lower() == "yes"
-                and row.find_all("td")[4].text.strip().lower() == "anonymous"
-            ][:15]
+            self.proxies = self.validate(candidates)[: self.pool_size]
+            self.save_stats()
 
             if self.proxies:
-                logger.info(f"프록시 설정 완료: {self.proxies}")
+                logger.info(f"프록시 설정 완료 ({self.source.name}): {self.proxies}")
             else:
-                logger.warning("HTTPS 지원 및 익명 프록시를 찾지 못했습니다.")
+                logger.warning("사용 가능한 프록시를 찾지 못했습니다.")
 
         except Exception as e:
             logger.error(f"프록시 가져오기 실패: {e}")
+        finally:
+            # 검증만 하고 목록에 들지 못했거나 목록에서 빠진 프록시의 세션은 닫음
+            HttpClient().close_proxy_sessions(keep=self.proxies)
         return self.proxies
 
     def reset_proxies(self):
-        """프록시 리스트 초기화."""
+        """프록시 리스트 초기화 (점수는 저장하여 유지, 다음 차단 시 다시 수집)."""
+        self.save_stats()
         self.proxies = []
+        self.fetched_at = 0.0
+        HttpClient().close_proxy_sessions()
         logger.info("프록시 리스트 초기화 완료")
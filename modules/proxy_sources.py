@@ -0,0 +1,114 @@
+import os
+from abc import ABC, abstractmethod
+from typing import List
+
+from bs4 import BeautifulSoup
+
+from modules import logger
+from modules.http_client import HttpClient
+
+
+class BaseProxySource(ABC):
+    """프록시 후보 목록을 제공하는 소스의 기본 추상 클래스."""
+
+    name = "base"
+
+    @abstractmethod
+    def fetch(
+        self,
+    ) -> List[str]:
+        """프록시 후보 목록 ("http://host:port" 형식)."""
+        pass
+
+
+def normalize_proxy(
+    proxy: str,
+) -> str:
+    proxy = proxy.strip()
+    return proxy if "://" in proxy else f"http://{proxy}"
+
+
+class SslProxiesSource(BaseProxySource):
+    """sslproxies.org에서 HTTPS 지원 익명 프록시를 수집합니다."""
+
+    name = "sslproxies"
+
+    def __init__(
+        self,
+        url: str = "https://www.sslproxies.org/",
+    ):
+        self.url = url
+
+    def fetch(
+        self,
+    ) -> List[str]:
+        response = HttpClient().get(self.url, timeout=30)
+        response.raise_for_status()
+
+        soup = BeautifulSoup(response.content, "html.parser")
+        table = soup.find("table", {"class": "table table-striped table-bordered"})
+
+        if not table:
+            logger.warning("프록시 테이블을 찾을 수 없습니다.")
+            return []
+
+        rows = table.find("tbody").find_all("tr")
+        return [
+            f"http://{row.find_all('td')[0].text.strip()}:{row.find_all('td')[1].text.strip()}"
+            for row in rows
+            if row.find_all("td")[6].text.strip().lower() == "yes"
+            and row.find_all("td")[4].text.strip().lower() == "anonymous"
+        ]
+
+
+class FileProxySource(BaseProxySource):
+    """한 줄에 하나씩 프록시가 적힌 파일 (빈 줄과 #으로 시작하는 줄은 무시)."""
+
+    name = "file"
+
+    def __init__(
+        self,
+        path: str,
+    ):
+        self.path = path
+
+    def fetch(
+        self,
+    ) -> List[str]:
+        with open(self.path, "r", encoding="utf-8") as f:
+            return [
+                normalize_proxy(line)
+                for line in f
+                if line.strip() and not line.strip().startswith("#")
+            ]
+
+
+class StaticProxySource(BaseProxySource):
+    """고정된 프록시 목록."""
+
+    name = "static"
+
+    def __init__(
+        self,
+        proxies: List[str],
+    ):
+        self.proxies = [normalize_proxy(proxy) for proxy in proxies if proxy.strip()]
+
+    def fetch(
+        self,
+    ) -> List[str]:
+        return list(self.proxies)
+
+
+def create_proxy_source() -> BaseProxySource:
+    """PROXY_SOURCE 환경변수(sslproxies/file/static)에 따라 프록시 소스를 생성합니다."""
+    source = os.getenv("PROXY_SOURCE", "sslproxies").lower()
+    if source == "file":
+        return FileProxySource(
+            os.getenv("PROXY_FILE", os.path.join(os.getcwd(), "data/proxies.txt"))
+        )
+    if source == "static":
+        return StaticProxySource(os.getenv("PROXY_LIST", "").split(","))
+    if source != "sslproxies":
+        logger.warning(f"알 수 없는 PROXY_SOURCE: {source}. sslproxies를 사용합니다.")
+    return SslProxiesSource()
@@ -0,0 +1,262 @@
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+
+from modules import logger
+
+# 차단 응답 코드 (403: IP 차단, 429/430: 요청 과다)
+BLOCKED_STATUS = (403, 429, 430)
+# 요청 속도를 낮추고, 잠시 기다렸다가 직접 다시 요청할 수 있는 응답 코드
+THROTTLED_STATUS = (429, 430)
+
+
+def parse_retry_after(
+    value: Optional[str],
+) -> Optional[float]:
+    """Retry-After 헤더(초 또는 HTTP 날짜)를 대기 시간(초)으로 변환합니다."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+class HostRateLimit:
+    """호스트 하나의 토큰 버킷.
+
+    요청마다 토큰을 하나씩 예약하고, 토큰이 모자라면 채워질 때까지 기다립니다.
+    성공하면 속도를 조금씩 올리고(additive increase), 요청 과다 응답(429/430)을 받으면
+    절반으로 줄입니다(multiplicative decrease). IP 차단(403)은 요청 속도와 무관하고
+    프록시로 다시 요청하므로 속도는 그대로 두고, 연속으로 오면 직접 요청만 잠시 건너뜁니다.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        rate: float,
+        burst: float,
+        min_rate: float,
+        max_rate: float,
+        increase: float,
+        decrease: float,
+    ):
+        self.host = host
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.max_rate = max(max_rate, rate)
+        self.increase = increase
+        self.decrease = decrease
+        self.tokens = burst
+        self.updated = time.monotonic()
+        # Retry-After 등으로 요청을 멈춰야 하는 시각
+        self.blocked_until = 0.0
+        self.last_decrease = 0.0
+        # 연속 차단 횟수, 직접 요청을 건너뛰는 시각
+        self.consecutive_blocks = 0
+        self.direct_disabled_until = 0.0
+        self.requests = 0
+        self.blocks = 0
+        self.waited = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(
+        self,
+        now: float,
+    ):
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self) -> float:
+        """토큰 하나를 예약하고, 필요한 만큼 기다립니다. 기다린 시간을 반환합니다."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.tokens -= 1
+            wait = max(-self.tokens / self.rate, self.blocked_until - now, 0.0)
+            self.requests += 1
+        waited = 0.0
+        while wait > 0:
+            time.sleep(wait)
+            waited += wait
+            # 기다리는 동안 Retry-After를 받았으면 그만큼 더 기다린다.
+            with self._lock:
+                wait = max(self.blocked_until - time.monotonic(), 0.0)
+        with self._lock:
+            self.waited += waited
+        return waited
+
+    def pending_wait(self) -> float:
+        """Retry-After로 요청을 멈춰야 하는 남은 시간(초)."""
+        with self._lock:
+            return max(self.blocked_until - time.monotonic(), 0.0)
+
+    def record(
+        self,
+        status_code: int,
+        retry_after: Optional[float] = None,
+        block_threshold: int = 3,
+        block_cooldown: float = 600.0,
+    ):
+        with self._lock:
+            now = time.monotonic()
+            if status_code not in BLOCKED_STATUS:
+                self.consecutive_blocks = 0
+                if status_code < 400:
+                    self.rate = min(self.max_rate, self.rate + self.increase)
+                return
+
+            self.blocks += 1
+            self.consecutive_blocks += 1
+            if retry_after:
+                self.blocked_until = max(self.blocked_until, now + retry_after)
+            # 동시에 받은 차단 응답 여러 개로 속도가 한꺼번에 떨어지지 않도록
+            # 한 토큰 간격 안에서는 한 번만 줄인다.
+            if status_code in THROTTLED_STATUS and now - self.last_decrease >= max(
+                1.0 / self.rate, 1.0
+            ):
+                self.rate = max(self.min_rate, self.rate * self.decrease)
+                self.last_decrease = now
+                self.tokens = min(self.tokens, 0.0)
+                logger.warning(
+                    f"{self.host} 요청 과다 응답({status_code}), 요청 속도를 {self.rate:.2f}회/초로 낮춤"
+                )
+            # IP 차단(403)이 이어지면 한동안 직접 요청을 건너뛴다.
+            if status_code == 403 and self.consecutive_blocks >= block_threshold:
+                self.direct_disabled_until = now + block_cooldown
+
+    def direct_allowed(self) -> bool:
+        return time.monotonic() >= self.direct_disabled_until
+
+
+class RateLimiter:
+    """프로세스 전역에서 공유하는 호스트별 요청 속도 제한기 (싱글톤).
+
+    학습한 속도는 사이클이 바뀌어도 프로세스가 살아 있는 동안 유지됩니다.
+    """
+
+    _instance = None
+    _initialized = False
+
+    def __new__(cls, *args, **kwargs):
+        if not cls._instance:
+            cls._instance = super(RateLimiter, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:  # 이미 초기화된 경우 무시
+            return
+        self.enabled = os.getenv("RATE_LIMIT", "true").lower() != "false"
+        # 초당 요청 수 (기본값과 호스트별 시작값), 한 번에 몰아서 보낼 수 있는 요청 수
+        self.default_rate = float(os.getenv("RATE_LIMIT_RPS", "2"))
+        self.host_rates = self._parse_host_rates(
+            os.getenv("RATE_LIMIT_HOSTS", "www.fmkorea.com=0.5")
+        )
+        self.burst = float(os.getenv("RATE_LIMIT_BURST", "2"))
+        self.min_rate = float(os.getenv("RATE_LIMIT_MIN_RPS", "0.1"))
+        self.max_rate = float(os.getenv("RATE_LIMIT_MAX_RPS", "4"))
+        self.increase = float(os.getenv("RATE_LIMIT_INCREASE", "0.05"))
+        self.decrease = float(os.getenv("RATE_LIMIT_DECREASE", "0.5"))
+        # 요청 과다 응답 후 이 시간 이내로 기다리면 되는 경우 프록시 대신 직접 다시 요청
+        self.max_wait = float(os.getenv("RATE_LIMIT_MAX_WAIT", "30"))
+        # 403이 연속으로 이 횟수만큼 오면 일정 시간 직접 요청 없이 프록시를 사용
+        self.block_threshold = int(os.getenv("RATE_LIMIT_BLOCK_THRESHOLD", "3"))
+        self.block_cooldown = float(os.getenv("RATE_LIMIT_BLOCK_COOLDOWN", "600"))
+        self.hosts: Dict[str, HostRateLimit] = {}
+        self._lock = threading.Lock()
+        self._initialized = True
+
+    @staticmethod
+    def _parse_host_rates(
+        value: str,
+    ) -> Dict[str, float]:
+        rates = {}
+        for item in value.split(","):
+            if "=" not in item:
+                continue
+            host, rate = item.split("=", 1)
+            try:
+                rates[host.strip()] = float(rate)
+            except ValueError:
+                logger.warning(f"잘못된 RATE_LIMIT_HOSTS 항목: {item}")
+        return rates
+
+    def limit_for(
+        self,
+        host: str,
+    ) -> HostRateLimit:
+        with self._lock:
+            if host not in self.hosts:
+                self.hosts[host] = HostRateLimit(
+                    host=host,
+                    rate=self.host_rates.get(host, self.default_rate),
+                    burst=self.burst,
+                    min_rate=self.min_rate,
+                    max_rate=self.max_rate,
+                    increase=self.increase,
+                    decrease=self.decrease,
+                )
+            return self.hosts[host]
+
+    def acquire(
+        self,
+        host: str,
+    ):
+        """호스트에 요청을 보내도 될 때까지 기다립니다."""
+        if not self.enabled:
+            return
+        wait = self.limit_for(host).acquire()
+        if wait >= 1:
+            logger.info(f"{host} 요청 속도 제한으로 {wait:.1f}초 대기")
+
+    def record(
+        self,
+        host: str,
+        status_code: int,
+        retry_after: Optional[str] = None,
+    ):
+        """응답 코드를 반영하여 호스트의 요청 속도를 조절합니다."""
+        if not self.enabled:
+            return
+        self.limit_for(host).record(
+            status_code,
+            retry_after=parse_retry_after(retry_after),
+            block_threshold=self.block_threshold,
+            block_cooldown=self.block_cooldown,
+        )
+
+    def should_retry(
+        self,
+        host: str,
+        status_code: int,
+    ) -> bool:
+        """요청 과다 응답을 받았지만 잠시 기다렸다가 직접 다시 요청하면 되는지 여부."""
+        return (
+            self.enabled
+            and status_code in THROTTLED_STATUS
+            and self.limit_for(host).pending_wait() <= self.max_wait
+        )
+
+    def direct_allowed(
+        self,
+        host: str,
+    ) -> bool:
+        """연속으로 차단된 호스트는 잠시 직접 요청을 건너뛰고 바로 프록시를 사용합니다."""
+        return not self.enabled or self.limit_for(host).direct_allowed()
+
+    def log_stats(self):
+        for limit in self.hosts.values():
+            logger.info(
+                f"요청 속도 {limit.host} - {limit.rate:.2f}회/초, 요청: {limit.requests}, "
+                f"차단: {limit.blocks}, 대기: {limit.waited:.1f}초"
+            )
@@ -0,0 +1,231 @@
+import ast
+import re
+from dataclasses import fields
+from typing import Dict, FrozenSet, List, NamedTuple, Optional, Pattern, Set, Tuple
+
+from models.keyword_data import KeywordData
+from models.keyword_rule import KeywordRule
+from modules import logger
+from modules.keyword_matcher import KeywordMatcher, strip_whitespace
+from modules.metrics import Metrics
+
+_PRICE = re.compile(r"\d[\d,]*")
+# FMKorea 메타 데이터(str(dict))의 shop/category 값
+_META_FIELD = re.compile(r"""'(shop|category)': (?:'([^'\\]*)'|"([^"\\]*)")""")
+_RULE_FIELDS = {rule_field.name for rule_field in fields(KeywordRule)}
+
+
+def normalize(
+    text: Optional[str],
+) -> str:
+    """비교용 표기 (공백 제거, 소문자)."""
+    return strip_whitespace(text).lower()
+
+
+def parse_price(
+    price: Optional[str],
+) -> Optional[int]:
+    """'813,000원' 같은 가격 문자열의 첫 숫자 (없으면 None)."""
+    match = _PRICE.search(price or "")
+    return int(match.group().replace(",", "")) if match else None
+
+
+def parse_meta(
+    meta: Optional[str],
+) -> Tuple[Optional[str], Optional[str]]:
+    """메타 데이터에서 (쇼핑몰, 카테고리)를 꺼냅니다.
+
+    FMKorea는 dict 문자열, 알구몬은 '배송비3,000원|11번가'처럼 | 뒤가 쇼핑몰입니다.
+    """
+    meta = (meta or "").strip()
+    if meta.startswith("{") and "\\" not in meta:
+        # 상품마다 literal_eval로 해석하는 것보다 훨씬 빠름
+        values = {
+            match.group(1): match.group(2) or match.group(3)
+            for match in _META_FIELD.finditer(meta)
+        }
+        return values.get("shop") or None, values.get("category") or None
+    if meta.startswith("{"):
+        try:
+            data = ast.literal_eval(meta)
+        except (ValueError, SyntaxError):
+            return None, None
+        if isinstance(data, dict):
+            return data.get("shop") or None, data.get("category") or None
+        return None, None
+    if "|" in meta:
+        return meta.rsplit("|", 1)[1] or None, None
+    return None, None
+
+
+class ItemFeatures(NamedTuple):
+    """규칙 평가에 쓰는 상품 정보 (상품마다 한 번만 계산)."""
+
+    title: str
+    terms: FrozenSet[str]
+    price: Optional[int]
+    shop: Optional[str]
+    category: Optional[str]
+
+
+class CompiledRule:
+    """비교용으로 정규화하고 정규식을 미리 컴파일한 KeywordRule."""
+
+    __slots__ = (
+        "include",
+        "exclude",
+        "regex",
+        "min_price",
+        "max_price",
+        "shops",
+        "exclude_shops",
+        "categories",
+        "exclude_categories",
+    )
+
+    def __init__(
+        self,
+        rule: KeywordRule,
+    ):
+        self.include: FrozenSet[str] = _terms(rule.include)
+        self.exclude: FrozenSet[str] = _terms(rule.exclude)
+        self.regex: Optional[Pattern] = (
+            re.compile(rule.regex, re.IGNORECASE) if rule.regex else None
+        )
+        self.min_price = int(rule.min_price) if rule.min_price is not None else None
+        self.max_price = int(rule.max_price) if rule.max_price is not None else None
+        self.shops = _terms(rule.shops)
+        self.exclude_shops = _terms(rule.exclude_shops)
+        self.categories = _terms(rule.categories)
+        self.exclude_categories = _terms(rule.exclude_categories)
+
+    @property
+    def terms(self) -> FrozenSet[str]:
+        return self.include | self.exclude
+
+    def accepts(
+        self,
+        item: ItemFeatures,
+    ) -> bool:
+        # 계산이 싼 조건부터 확인
+        if item.price is not None:
+            if self.min_price is not None and item.price < self.min_price:
+                return False
+            if self.max_price is not None and item.price > self.max_price:
+                return False
+        if item.shop is not None:
+            if self.shops and item.shop not in self.shops:
+                return False
+            if item.shop in self.exclude_shops:
+                return False
+        if item.category is not None:
+            if self.categories and item.category not in self.categories:
+                return False
+            if item.category in self.exclude_categories:
+                return False
+        if not self.include <= item.terms or not self.exclude.isdisjoint(item.terms):
+            return False
+        if self.regex is not None and not self.regex.search(item.title):
+            return False
+        return True
+
+
+def _terms(
+    values: List[str],
+) -> FrozenSet[str]:
+    if isinstance(values, str):
+        values = [values]
+    return frozenset(filter(None, (normalize(value) for value in values or [])))
+
+
+class RuleEngine:
+    """키워드별 알림 규칙을 한 번 컴파일해 두고 상품 목록에 일괄 적용합니다.
+
+    모든 규칙의 포함/제외 단어는 하나의 Aho-Corasick 매처로 묶어 제목을 한 번만 훑고,
+    가격/쇼핑몰/카테고리 파싱 결과와 함께 사이클 동안 상품별로 캐시합니다.
+    규칙이 없는 키워드의 상품은 그대로 통과합니다.
+    """
+
+    def __init__(
+        self,
+        rules: Optional[Dict[str, dict]] = None,
+    ):
+        self.config = dict(rules or {})
+        self.rules: Dict[str, CompiledRule] = {}
+        for keyword, config in self.config.items():
+            rule = self.compile(keyword, config)
+            if rule is not None:
+                self.rules[keyword] = rule
+        terms: Set[str] = set()
+        for rule in self.rules.values():
+            terms |= rule.terms
+        self.term_matcher = KeywordMatcher(sorted(terms)) if terms else None
+        self._features: Dict[tuple, ItemFeatures] = {}
+        if self.rules:
+            logger.info(f"알림 규칙 {len(self.rules)}개 (단어 {len(terms)}개) 컴파일")
+
+    @staticmethod
+    def compile(
+        keyword: str,
+        config: dict,
+    ) -> Optional[CompiledRule]:
+        """잘못된 규칙은 로그를 남기고 무시합니다 (해당 키워드는 걸러내지 않음)."""
+        try:
+            if not isinstance(config, dict):
+                raise TypeError("규칙은 JSON 객체여야 합니다.")
+            unknown = set(config) - _RULE_FIELDS
+            if unknown:
+                raise TypeError(f"알 수 없는 항목: {sorted(unknown)}")
+            return CompiledRule(KeywordRule(**config))
+        except (TypeError, ValueError, re.error) as e:
+            logger.error(f"[{keyword}] 알림 규칙 오류로 규칙을 적용하지 않습니다: {e}")
+            return None
+
+    def features(
+        self,
+        item: KeywordData,
+    ) -> ItemFeatures:
+        key = (item.current_title, item.current_price, item.current_meta_data)
+        features = self._features.get(key)
+        if features is None:
+            title = item.current_title or ""
+            shop, category = parse_meta(item.current_meta_data)
+            features = self._features[key] = ItemFeatures(
+                title=title,
+                terms=(
+                    frozenset(self.term_matcher.match(title.lower()))
+                    if self.term_matcher
+                    else frozenset()
+                ),
+                price=parse_price(item.current_price),
+                shop=normalize(shop) if shop else None,
+                category=normalize(category) if category else None,
+            )
+        return features
+
+    def filter(
+        self,
+        keyword: str,
+        items: List[KeywordData],
+    ) -> List[KeywordData]:
+        """keyword의 규칙을 만족하는 상품만 반환합니다 (순서 유지)."""
+        rule = self.rules.get(keyword)
+        if rule is None or not items:
+            return items
+        accepted = [item for item in items if rule.accepts(self.features(item))]
+        if len(accepted) < len(items):
+            Metrics().inc("hotdeal_rule_filtered_total", len(items) - len(accepted))
+        return accepted
+
+    def filter_matched(
+        self,
+        matched: Dict[str, List[KeywordData]],
+    ) -> Dict[str, List[KeywordData]]:
+        """키워드별 상품 목록 전체에 규칙을 적용합니다."""
+        return {
+            keyword: self.filter(keyword, items) for keyword, items in matched.items()
+        }
+
+    def clear_cache(self):
+        """사이클이 끝나면 상품별 캐시를 비웁니다."""
+        self._features.clear()
@@ -0,0 +1,296 @@
+import os
+import queue
+import random
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Callable, List, Optional, Set, Tuple, Union
+
+from modules import logger
+
+
+def _parse_cron_field(
+    expression: str,
+    low: int,
+    high: int,
+) -> Set[int]:
+    """cron 필드 하나(*, */n, a-b, a-b/n, 목록)를 값 집합으로 변환합니다."""
+    values = set()
+    for part in expression.split(","):
+        step = 1
+        if "/" in part:
+            part, step_text = part.split("/", 1)
+            step = int(step_text)
+        if part == "*":
+            start, end = low, high
+        elif "-" in part:
+            start, end = (int(value) for value in part.split("-", 1))
+        else:
+            start = end = int(part)
+            if step > 1:
+                end = high
+        if start < low or end > high or start > end or step < 1:
+            raise ValueError(f"잘못된 cron 필드: {expression}")
+        values.update(range(start, end + 1, step))
+    return values
+
+
+class CronTrigger:
+    """5필드 cron 표현식(분 시 일 월 요일, 로컬 시간 기준) 트리거."""
+
+    def __init__(
+        self,
+        expression: str,
+    ):
+        fields = expression.split()
+        if len(fields) != 5:
+            raise ValueError(f"cron 표현식은 5개 필드여야 합니다: {expression}")
+        self.expression = expression
+        self.minutes = _parse_cron_field(fields[0], 0, 59)
+        self.hours = _parse_cron_field(fields[1], 0, 23)
+        self.days = _parse_cron_field(fields[2], 1, 31)
+        self.months = _parse_cron_field(fields[3], 1, 12)
+        # 요일은 0과 7 모두 일요일
+        self.weekdays = {weekday % 7 for weekday in _parse_cron_field(fields[4], 0, 7)}
+        self.any_day = fields[2] == "*"
+        self.any_weekday = fields[4] == "*"
+
+    def _day_matches(
+        self,
+        moment: datetime,
+    ) -> bool:
+        day_ok = moment.day in self.days
+        weekday_ok = (moment.weekday() + 1) % 7 in self.weekdays
+        # cron 규칙: 일과 요일이 모두 지정되면 둘 중 하나만 맞아도 실행
+        if not self.any_day and not self.any_weekday:
+            return day_ok or weekday_ok
+        return day_ok and weekday_ok
+
+    def next_run(
+        self,
+        after: datetime,
+    ) -> datetime:
+        """after 이후 처음으로 표현식에 맞는 시각."""
+        moment = after.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = moment + timedelta(days=366 * 5)
+        while moment < limit:
+            if moment.month not in self.months:
+                moment = (moment.replace(day=1) + timedelta(days=32)).replace(
+                    day=1, hour=0, minute=0
+                )
+            elif not self._day_matches(moment):
+                moment = moment.replace(hour=0, minute=0) + timedelta(days=1)
+            elif moment.hour not in self.hours:
+                moment = moment.replace(minute=0) + timedelta(hours=1)
+            elif moment.minute not in self.minutes:
+                moment += timedelta(minutes=1)
+            else:
+                return moment
+        raise ValueError(f"실행 시각을 찾을 수 없는 cron 표현식: {self.expression}")
+
+    def __str__(self):
+        return f"cron({self.expression})"
+
+
+class IntervalTrigger:
+    """일정 간격 트리거.
+
+    실행 시각을 자정 기준 간격의 배수에 맞춥니다 (120초면 매 짝수 분 정각).
+    """
+
+    def __init__(
+        self,
+        seconds: float,
+    ):
+        if seconds <= 0:
+            raise ValueError(f"실행 간격은 0보다 커야 합니다: {seconds}")
+        self.seconds = seconds
+
+    def next_run(
+        self,
+        after: datetime,
+    ) -> datetime:
+        midnight = after.replace(hour=0, minute=0, second=0, microsecond=0)
+        slots = int((after - midnight).total_seconds() // self.seconds) + 1
+        return midnight + timedelta(seconds=slots * self.seconds)
+
+    def __str__(self):
+        return f"every({self.seconds:g}s)"
+
+
+Trigger = Union[CronTrigger, IntervalTrigger]
+
+
+def create_trigger(
+    spec: Union[str, int, float],
+) -> Trigger:
+    """숫자(초)는 간격 트리거, 문자열은 cron 트리거로 만듭니다."""
+    if isinstance(spec, (int, float)):
+        return IntervalTrigger(float(spec))
+    if spec.strip().replace(".", "", 1).isdigit():
+        return IntervalTrigger(float(spec))
+    return CronTrigger(spec)
+
+
+def trigger_period(
+    trigger: Trigger,
+    after: Optional[datetime] = None,
+    samples: int = 48,
+) -> float:
+    """트리거의 실행 간격(초). cron처럼 간격이 일정하지 않으면 가장 긴 간격을 반환합니다."""
+    current = trigger.next_run(after or datetime.now())
+    period = 0.0
+    for _ in range(samples):
+        following = trigger.next_run(current)
+        period = max(period, (following - current).total_seconds())
+        current = following
+    return period
+
+
+@dataclass
+class ScheduledJob:
+    name: str
+    trigger: Trigger
+    func: Callable[[], None]
+    # 실행 시각에 더하는 무작위 지연의 최대값(초)
+    jitter: float = 0.0
+    next_run: Optional[datetime] = None
+    runs: int = 0
+    # 이전 실행이 길어져 건너뛴 실행 횟수
+    skipped: int = 0
+    last_duration: Optional[float] = field(default=None)
+
+
+class Scheduler:
+    """벽시계 기준으로 작업을 실행하는 스케줄러.
+
+    작업은 한 스레드에서 차례로 실행하므로 겹쳐서 실행되지 않고, 이전 실행이
+    길어져 지나간 실행 시각은 건너뜁니다. 다음 실행 시각까지는 잠들어 있다가
+    stop/wake 호출이나 실행 시각에 깨어납니다.
+    """
+
+    def __init__(
+        self,
+        jitter: Optional[float] = None,
+    ):
+        self.jitter = (
+            float(os.getenv("SCHEDULE_JITTER", "30")) if jitter is None else jitter
+        )
+        self.jobs: List[ScheduledJob] = []
+        # 다른 스레드에서 요청한 1회성 작업 (스케줄러 스레드에서 차례로 실행)
+        self._soon: "queue.SimpleQueue[Tuple[str, Callable[[], None]]]" = (
+            queue.SimpleQueue()
+        )
+        self._wake = threading.Event()
+        self._stopped = False
+
+    def add_job(
+        self,
+        name: str,
+        trigger: Trigger,
+        func: Callable[[], None],
+        jitter: Optional[float] = None,
+        run_now: bool = False,
+    ) -> ScheduledJob:
+        job = ScheduledJob(
+            name=name,
+            trigger=trigger,
+            func=func,
+            jitter=self.jitter if jitter is None else jitter,
+        )
+        if run_now:
+            job.next_run = datetime.now()
+        else:
+            self._schedule(job, datetime.now())
+        self.jobs.append(job)
+        logger.info(f"[{name}] 작업 등록 ({trigger}), 다음 실행: {job.next_run}")
+        self.wake()
+        return job
+
+    def _schedule(
+        self,
+        job: ScheduledJob,
+        after: datetime,
+    ):
+        job.next_run = job.trigger.next_run(after) + timedelta(
+            seconds=random.uniform(0, job.jitter)
+        )
+
+    def _run(
+        self,
+        job: ScheduledJob,
+    ):
+        started = datetime.now()
+        logger.info(f"[{job.name}] 작업 실행: {started}")
+        try:
+            job.func()
+        except Exception as e:
+            logger.error(f"[{job.name}] 작업 실행 중 오류: {e}")
+        finished = datetime.now()
+        job.runs += 1
+        job.last_duration = (finished - started).total_seconds()
+
+        # 실행 중에 지나간 실행 시각은 몰아서 실행하지 않고 건너뛴다.
+        missed = 0
+        slot = job.trigger.next_run(started)
+        while slot <= finished:
+            missed += 1
+            slot = job.trigger.next_run(slot)
+        if missed:
+            job.skipped += missed
+            logger.warning(
+                f"[{job.name}] 실행 시간({job.last_duration:.0f}초)이 길어 {missed}회 건너뜀"
+            )
+        self._schedule(job, finished)
+        logger.info(
+            f"[{job.name}] 작업 완료 ({job.last_duration:.1f}초), 다음 실행: {job.next_run}"
+        )
+
+    def run_soon(
+        self,
+        name: str,
+        func: Callable[[], None],
+    ):
+        """작업을 한 번만 가능한 빨리 실행합니다 (다른 스레드에서 호출해도 안전)."""
+        self._soon.put((name, func))
+        self.wake()
+
+    def run_pending(self):
+        """1회성 작업과 실행 시각이 된 작업을 예정 시각 순으로 실행합니다."""
+        while not self._soon.empty() and not self._stopped:
+            name, func = self._soon.get()
+            logger.info(f"[{name}] 1회 작업 실행")
+            try:
+                func()
+            except Exception as e:
+                logger.error(f"[{name}] 작업 실행 중 오류: {e}")
+        due = sorted(
+            (job for job in self.jobs if job.next_run <= datetime.now()),
+            key=lambda job: job.next_run,
+        )
+        for job in due:
+            if self._stopped:
+                return
+            self._run(job)
+
+    def seconds_until_next(self) -> Optional[float]:
+        if not self.jobs:
+            return None
+        next_run = min(job.next_run for job in self.jobs)
+        return max((next_run - datetime.now()).total_seconds(), 0.0)
+
+    def run_forever(self):
+        """stop이 호출될 때까지 작업을 실행합니다."""
+        self._stopped = False
+        while not self._stopped:
+            self.run_pending()
+            self._wake.wait(self.seconds_until_next())
+            self._wake.clear()
+
+    def wake(self):
+        """잠들어 있는 스케줄러를 깨워 실행할 작업을 다시 확인하게 합니다."""
+        self._wake.set()
+
+    def stop(self):
+        self._stopped = True
+        self._wake.set()
@@ -0,0 +1,71 @@
+import json
+import os
+from collections import deque
+from typing import Iterable, Iterator, List, Optional
+
+
+class SeenIndex:
+    """최근에 본 상품 ID를 최대 limit개까지 기억하는 링 버퍼.
+
+    가장 오래된 ID부터 밀려나며, 상태 저장소에는 JSON 배열 문자열로 저장합니다.
+    """
+
+    def __init__(
+        self,
+        ids: Iterable[str] = (),
+        limit: Optional[int] = None,
+    ):
+        self.limit = limit or int(os.getenv("SEEN_ID_LIMIT", "300"))
+        # 오래된 ID가 왼쪽, 최근 ID가 오른쪽
+        self._order = deque()
+        self._ids = set()
+        self.extend(ids)
+
+    @classmethod
+    def from_state(
+        cls,
+        value: Optional[str],
+    ) -> "SeenIndex":
+        if not value:
+            return cls()
+        try:
+            return cls(json.loads(value))
+        except (json.JSONDecodeError, TypeError):
+            return cls()
+
+    def to_state(self) -> str:
+        return json.dumps(list(self._order), ensure_ascii=False)
+
+    def extend(
+        self,
+        ids: Iterable[str],
+    ):
+        """오래된 것부터 순서대로 추가합니다."""
+        for post_id in ids:
+            if post_id is None or post_id in self._ids:
+                continue
+            self._order.append(post_id)
+            self._ids.add(post_id)
+            if len(self._order) > self.limit:
+                self._ids.discard(self._order.popleft())
+
+    def add_newest_first(
+        self,
+        ids: List[str],
+    ) -> "SeenIndex":
+        """크롤링 결과처럼 최신 순으로 정렬된 ID 목록을 추가합니다."""
+        self.extend(reversed(ids))
+        return self
+
+    def __contains__(
+        self,
+        post_id: str,
+    ) -> bool:
+        return post_id in self._ids
+
+    def __iter__(self) -> Iterator[str]:
+        """오래된 ID부터 순서대로 돌려줍니다."""
+        return iter(self._order)
+
+    def __len__(self) -> int:
+        return len(self._order)
@@ -0,0 +1,194 @@
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+import zlib
+from typing import Optional, Set
+
+from modules import logger
+
+
+def shard_of(
+    key: str,
+    shard_count: int,
+) -> int:
+    """키워드(또는 피드 사이트)가 속한 파티션 번호 (프로세스와 관계없이 항상 같은 값)."""
+    return zlib.crc32(key.encode("utf-8")) % shard_count
+
+
+class ShardCoordinator:
+    """여러 작업 프로세스/컨테이너가 키워드를 나누어 처리하도록 조율합니다 (싱글톤).
+
+    키워드 목록을 SHARD_COUNT개의 해시 파티션으로 나누고, 각 작업자는 공유 SQLite
+    파일의 리스(lease)로 파티션을 소유합니다. 리스는 하트비트 스레드가 갱신하며,
+    작업자가 죽으면 SHARD_LEASE_TTL 후 만료되어 다른 작업자가 다음 사이클에 넘겨받습니다.
+    """
+
+    _instance = None
+    _initialized = False
+
+    def __new__(cls, *args, **kwargs):
+        if not cls._instance:
+            cls._instance = super(ShardCoordinator, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(
+        self,
+        db_path=os.path.join(os.getcwd(), "data/shards.db"),
+    ):
+        if self._initialized:  # 이미 초기화된 경우 무시
+            return
+        self.db_path = db_path
+        self.shard_count = int(os.getenv("SHARD_COUNT", "1"))
+        self.enabled = self.shard_count > 1
+        home = os.getenv("SHARD_INDEX", "")
+        # 고정 파티션 (없으면 비어 있는 파티션을 맡음)
+        self.fixed_shard: Optional[int] = int(home) if home.strip() else None
+        self.home_shard: Optional[int] = None
+        self.lease_ttl = float(os.getenv("SHARD_LEASE_TTL", "120"))
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        # 이번 사이클에 처리하는 파티션 (자기 파티션 + 넘겨받은 파티션)
+        self.owned: Set[int] = set()
+        # 동시에 시작한 작업자의 파티션을 가로채지 않도록 리스 시간만큼은 넘겨받지 않음
+        self.started_at = time.time()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._heartbeat: Optional[threading.Thread] = None
+        self._initialized = True
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            # 여러 프로세스가 같은 파일을 쓰므로 잠금을 기다리도록 timeout 지정
+            self._conn = sqlite3.connect(
+                self.db_path,
+                timeout=30,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS shard_lease (
+                    shard INTEGER PRIMARY KEY,
+                    owner TEXT NOT NULL,
+                    expires REAL NOT NULL
+                )
+                """)
+        return self._conn
+
+    def _claim(
+        self,
+        shard: int,
+    ) -> bool:
+        """파티션 리스를 얻거나 갱신합니다. 다른 작업자의 유효한 리스가 있으면 실패합니다."""
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute(
+                    """
+                    INSERT INTO shard_lease (shard, owner, expires) VALUES (?, ?, ?)
+                    ON CONFLICT(shard) DO UPDATE
+                    SET owner = excluded.owner, expires = excluded.expires
+                    WHERE shard_lease.owner = excluded.owner OR shard_lease.expires < ?
+                    """,
+                    (shard, self.owner, now + self.lease_ttl, now),
+                )
+                row = conn.execute(
+                    "SELECT owner FROM shard_lease WHERE shard = ?", (shard,)
+                ).fetchone()
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        return row is not None and row[0] == self.owner
+
+    def _release(
+        self,
+        shards: Set[int],
+    ):
+        if not shards:
+            return
+        with self._lock:
+            self._connection().executemany(
+                "DELETE FROM shard_lease WHERE shard = ? AND owner = ?",
+                [(shard, self.owner) for shard in shards],
+            )
+
+    def _claim_home(self):
+        if self.home_shard is not None and self._claim(self.home_shard):
+            return
+        self.home_shard = None
+        candidates = (
+            [self.fixed_shard]
+            if self.fixed_shard is not None
+            else range(self.shard_count)
+        )
+        for shard in candidates:
+            if self._claim(shard):
+                self.home_shard = shard
+                logger.info(f"파티션 {shard}/{self.shard_count} 담당 ({self.owner})")
+                return
+        logger.warning("담당할 파티션이 없어 만료된 파티션만 넘겨받습니다.")
+
+    def _heartbeat_loop(self):
+        while not self._stop.wait(self.lease_ttl / 3):
+            try:
+                for shard in list(self.owned | {self.home_shard} - {None}):
+                    if not self._claim(shard):
+                        logger.error(f"파티션 {shard} 리스를 잃었습니다.")
+            except Exception as e:
+                logger.error(f"파티션 리스 갱신 실패: {e}")
+
+    def begin_cycle(self) -> Set[int]:
+        """사이클 시작 시 자기 파티션을 확인하고, 리스가 만료된 파티션을 넘겨받습니다."""
+        if not self.enabled:
+            return set()
+        self._claim_home()
+        owned = {self.home_shard} - {None}
+        takeover = time.time() - self.started_at >= self.lease_ttl
+        for shard in range(self.shard_count) if takeover else []:
+            if shard not in owned and self._claim(shard):
+                logger.warning(
+                    f"리스가 만료된 파티션 {shard}을 이번 사이클에 넘겨받습니다."
+                )
+                owned.add(shard)
+        self.owned = owned
+        if self._heartbeat is None or not self._heartbeat.is_alive():
+            self._stop.clear()
+            self._heartbeat = threading.Thread(
+                target=self._heartbeat_loop, name="shard-heartbeat", daemon=True
+            )
+            self._heartbeat.start()
+        logger.info(f"이번 사이클 담당 파티션: {sorted(owned)}")
+        return owned
+
+    def end_cycle(self):
+        """넘겨받은 파티션은 사이클이 끝나면 반납합니다 (원래 작업자가 돌아오면 되찾을 수 있도록)."""
+        if not self.enabled:
+            return
+        extra = self.owned - {self.home_shard}
+        self._release(extra)
+        self.owned = {self.home_shard} - {None}
+
+    def owns(
+        self,
+        key: str,
+    ) -> bool:
+        """이번 사이클에 이 작업자가 처리할 키워드(또는 피드)인지 여부."""
+        return not self.enabled or shard_of(key, self.shard_count) in self.owned
+
+    def shutdown(self):
+        """하트비트를 멈추고 모든 리스를 반납합니다."""
+        if not self.enabled:
+            return
+        self._stop.set()
+        try:
+            self._release(self.owned | {self.home_shard} - {None})
+        except Exception as e:
+            logger.error(f"파티션 리스 반납 실패: {e}")
+        self.owned = set()
+        self.home_shard = None
@@ -0,0 +1,304 @@
+import json
+import os
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import asdict, fields
+from typing import Dict, List, Optional, Tuple, get_args
+
+from models.keyword_data import KeywordData
+from modules import logger
+from modules.file_utils import atomic_write_json
+
+# (keyword, sitename)
+StateKey = Tuple[str, str]
+
+
+def column_type(
+    field_type,
+) -> str:
+    """KeywordData 필드 타입에 맞는 SQLite 컬럼 타입."""
+    types = set(get_args(field_type)) or {field_type}
+    if float in types:
+        return "REAL"
+    if int in types:
+        return "INTEGER"
+    return "TEXT"
+
+
+class BaseStateStore(ABC):
+    """키워드-사이트별 크롤링 상태 저장소의 기본 추상 클래스."""
+
+    @abstractmethod
+    def load_all(
+        self,
+    ) -> Dict[StateKey, KeywordData]:
+        """저장된 모든 상태를 한 번에 읽어옵니다."""
+        pass
+
+    @abstractmethod
+    def save_many(
+        self,
+        items: Dict[StateKey, KeywordData],
+    ):
+        """여러 상태를 저장합니다. 실제 반영은 commit 시점에 이루어집니다."""
+        pass
+
+    @abstractmethod
+    def remove_except(
+        self,
+        keywords: List[str],
+    ):
+        """keywords에 없는 키워드의 상태를 삭제합니다."""
+        pass
+
+    def commit(self):
+        """사이클 동안의 변경 사항을 확정합니다."""
+        pass
+
+    def close(self):
+        pass
+
+
+def read_legacy_json(
+    data_folder: str,
+) -> Dict[StateKey, KeywordData]:
+    """기존 키워드별 {keyword}_data.json 파일들을 읽어옵니다."""
+    items = {}
+    if not os.path.exists(data_folder):
+        return items
+    for file in os.listdir(data_folder):
+        if not file.endswith("_data.json"):
+            continue
+        keyword = file.replace("_data.json", "")
+        with open(os.path.join(data_folder, file), "r") as f:
+            try:
+                data = json.load(f)
+            except json.JSONDecodeError:
+                logger.error(f"[{keyword}] 데이터 파일이 손상되어 건너뜁니다.")
+                continue
+        for sitename, keyword_data in data.items():
+            items[(keyword, sitename)] = KeywordData(**keyword_data)
+    return items
+
+
+class JsonStateStore(BaseStateStore):
+    """모든 키워드 상태를 하나의 JSON 파일에 두는 저장소.
+
+    commit 시점에 임시 파일에 쓴 뒤 rename하여 원자적으로 교체합니다.
+    """
+
+    def __init__(
+        self,
+        data_folder: str,
+    ):
+        self.data_folder = data_folder
+        self.path = os.path.join(data_folder, "keyword_state.json")
+        self._data: Optional[Dict[str, Dict[str, dict]]] = None
+        self._changed = False
+
+    def _ensure_loaded(self):
+        if self._data is not None:
+            return
+        if os.path.exists(self.path):
+            with open(self.path, "r") as f:
+                self._data = json.load(f)
+            return
+        # 최초 1회: 기존 키워드별 파일을 가져온다.
+        self._data = {}
+        legacy = read_legacy_json(self.data_folder)
+        for (keyword, sitename), keyword_data in legacy.items():
+            self._data.setdefault(keyword, {})[sitename] = asdict(keyword_data)
+        if legacy:
+            self._changed = True
+            logger.info(f"JSON 상태 파일 {len(legacy)}건을 {self.path}로 합쳤습니다.")
+
+    def load_all(
+        self,
+    ) -> Dict[StateKey, KeywordData]:
+        self._ensure_loaded()
+        return {
+            (keyword, sitename): KeywordData(**keyword_data)
+            for keyword, sites in self._data.items()
+            for sitename, keyword_data in sites.items()
+        }
+
+    def save_many(
+        self,
+        items: Dict[StateKey, KeywordData],
+    ):
+        self._ensure_loaded()
+        for (keyword, sitename), keyword_data in items.items():
+            self._data.setdefault(keyword, {})[sitename] = asdict(keyword_data)
+            self._changed = True
+
+    def remove_except(
+        self,
+        keywords: List[str],
+    ):
+        self._ensure_loaded()
+        keep = set(keywords)
+        for keyword in list(self._data):
+            if keyword not in keep:
+                logger.info(f"[{keyword}] 상태 데이터 삭제")
+                del self._data[keyword]
+                self._changed = True
+
+    def commit(self):
+        if not self._changed:
+            return
+        atomic_write_json(self.path, self._data)
+        self._changed = False
+
+
+class SqliteStateStore(BaseStateStore):
+    """(keyword, site)를 기본 키로 하는 SQLite 상태 저장소.
+
+    WAL 모드로 동작하며, 한 사이클의 변경 사항은 commit 시점에 하나의 트랜잭션으로 반영됩니다.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        legacy_folder: Optional[str] = None,
+    ):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        # 여러 작업자 프로세스가 같은 파일을 쓸 수 있으므로 잠금을 기다리도록 timeout 지정
+        self.conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.columns = [field.name for field in fields(KeywordData)]
+        self.column_types = {
+            field.name: column_type(field.type) for field in fields(KeywordData)
+        }
+        self._create_schema()
+        if legacy_folder:
+            self._migrate_json(legacy_folder)
+
+    def _create_schema(self):
+        column_defs = ", ".join(
+            f"{column} {self.column_types[column]}" for column in self.columns
+        )
+        with self._lock, self.conn:
+            self.conn.execute(f"""
+                CREATE TABLE IF NOT EXISTS keyword_state (
+                    keyword TEXT NOT NULL,
+                    site TEXT NOT NULL,
+                    {column_defs},
+                    PRIMARY KEY (keyword, site)
+                ) WITHOUT ROWID
+                """)
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)"
+            )
+            # KeywordData에 필드가 추가된 경우 컬럼도 추가
+            existing = {
+                row[1] for row in self.conn.execute("PRAGMA table_info(keyword_state)")
+            }
+            for column in self.columns:
+                if column not in existing:
+                    self.conn.execute(
+                        f"ALTER TABLE keyword_state ADD COLUMN {column} {self.column_types[column]}"
+                    )
+
+    def _migrate_json(
+        self,
+        legacy_folder: str,
+    ):
+        """기존 {keyword}_data.json 파일을 최초 1회 가져옵니다."""
+        with self._lock:
+            migrated = self.conn.execute(
+                "SELECT value FROM meta WHERE key = 'json_migrated'"
+            ).fetchone()
+        if migrated or not os.path.exists(legacy_folder):
+            return
+
+        legacy = read_legacy_json(legacy_folder)
+        self.save_many(legacy)
+        with self._lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('json_migrated', '1')"
+            )
+        logger.info(
+            f"JSON 상태 파일 {len(legacy)}건을 SQLite로 이전했습니다: {self.db_path}"
+        )
+
+    def load_all(
+        self,
+    ) -> Dict[StateKey, KeywordData]:
+        with self._lock:
+            rows = self.conn.execute(
+                f"SELECT keyword, site, {', '.join(self.columns)} FROM keyword_state"
+            ).fetchall()
+        return {
+            (row[0], row[1]): KeywordData(**dict(zip(self.columns, row[2:])))
+            for row in rows
+        }
+
+    def save_many(
+        self,
+        items: Dict[StateKey, KeywordData],
+    ):
+        if not items:
+            return
+        placeholders = ", ".join("?" for _ in range(len(self.columns) + 2))
+        rows = []
+        for (keyword, sitename), keyword_data in items.items():
+            values = asdict(keyword_data)
+            rows.append(
+                (keyword, sitename, *[values[column] for column in self.columns])
+            )
+        with self._lock:
+            # 트랜잭션은 commit()에서 확정된다.
+            self.conn.executemany(
+                f"INSERT OR REPLACE INTO keyword_state (keyword, site, {', '.join(self.columns)}) VALUES ({placeholders})",
+                rows,
+            )
+
+    def remove_except(
+        self,
+        keywords: List[str],
+    ):
+        keep = set(keywords)
+        with self._lock:
+            stored = [
+                row[0]
+                for row in self.conn.execute(
+                    "SELECT DISTINCT keyword FROM keyword_state"
+                )
+            ]
+            for keyword in stored:
+                if keyword not in keep:
+                    logger.info(f"[{keyword}] 상태 데이터 삭제")
+                    self.conn.execute(
+                        "DELETE FROM keyword_state WHERE keyword = ?", (keyword,)
+                    )
+
+    def commit(self):
+        with self._lock:
+            self.conn.commit()
+
+    def close(self):
+        with self._lock:
+            self.conn.commit()
+            self.conn.close()
+
+
+def create_state_store(
+    data_folder: str,
+) -> BaseStateStore:
+    """STATE_BACKEND 환경변수(sqlite/json)에 따라 상태 저장소를 생성합니다."""
+    backend = os.getenv("STATE_BACKEND", "sqlite").lower()
+    if backend == "json":
+        if int(os.getenv("SHARD_COUNT", "1")) > 1:
+            logger.warning(
+                "JSON 상태 저장소는 여러 작업자가 함께 쓸 수 없습니다. STATE_BACKEND=sqlite를 사용하세요."
+            )
+        return JsonStateStore(data_folder)
+    if backend != "sqlite":
+        logger.warning(f"알 수 없는 STATE_BACKEND: {backend}. sqlite를 사용합니다.")
+    return SqliteStateStore(
+        os.path.join(data_folder, "state.db"),
+        legacy_folder=data_folder,
+    )
@@ -0,0 +1,179 @@
+from html.parser import HTMLParser
+from typing import Callable, Dict, List, Optional, Tuple
+
+# 닫는 태그가 없는 요소
+VOID_ELEMENTS = frozenset(
+    (
+        "area",
+        "base",
+        "br",
+        "col",
+        "embed",
+        "hr",
+        "img",
+        "input",
+        "link",
+        "meta",
+        "source",
+        "track",
+        "wbr",
+    )
+)
+
+# 시작 표시를 찾는 동안 남겨 둘 끝부분 길이 (표시가 조각 경계에 걸치거나 태그 속성 중간에 있을 때)
+MARKER_TAIL = 4096
+
+# (태그, class 속성) - 현재 열려 있는 요소
+OpenElement = Tuple[str, str]
+# is_item(태그, 속성, 열려 있는 상위 요소 목록) -> 상품 요소 여부
+ItemPredicate = Callable[[str, Dict[str, Optional[str]], List[OpenElement]], bool]
+
+
+class ItemStreamParser(HTMLParser):
+    """HTML을 조각(chunk)으로 받아 상품 요소의 원본 HTML을 완성되는 대로 모으는 파서.
+
+    is_item이 참인 요소(예: 상품 <li>)가 시작되면 닫힐 때까지 원본을 그대로 모아
+    completed에 넣고, 첫 상품의 부모 요소(상품 목록)가 닫히면 done이 됩니다.
+    start_marker를 주면 그 문자열이 나올 때까지는 파싱하지 않고 건너뛰어(str.find),
+    헤더/스크립트 등 상품 목록 앞부분을 토큰으로 나누는 비용을 없앱니다.
+    """
+
+    def __init__(
+        self,
+        is_item: ItemPredicate,
+        start_marker: Optional[str] = None,
+    ):
+        # 엔티티를 원본 그대로 되살리기 위해 직접 처리
+        super().__init__(convert_charrefs=False)
+        self.is_item = is_item
+        self.start_marker = start_marker
+        self.pending = ""
+        self.stack: List[OpenElement] = []
+        # 상품 목록(첫 상품의 부모)이 열려 있는 동안의 최소 깊이, 현재 상품 요소의 깊이
+        self.container_depth: Optional[int] = None
+        self.item_depth: Optional[int] = None
+        self.buffer: List[str] = []
+        self.completed: List[str] = []
+        self.done = False
+
+    def feed(
+        self,
+        data: str,
+    ):
+        if self.start_marker:
+            self.pending += data
+            index = self.pending.find(self.start_marker)
+            if index < 0:
+                self.pending = self.pending[-MARKER_TAIL:]
+                return
+            # 표시가 들어 있는 태그의 시작부터 파싱
+            start = self.pending.rfind("<", 0, index + 1)
+            data = self.pending[max(start, 0) :]
+            self.pending = ""
+            self.start_marker = None
+        super().feed(data)
+
+    def _finish_item(self):
+        self.completed.append("".join(self.buffer))
+        self.buffer = []
+        self.item_depth = None
+
+    def _append(
+        self,
+        text: str,
+    ):
+        if self.item_depth is not None:
+            self.buffer.append(text)
+
+    def handle_starttag(
+        self,
+        tag: str,
+        attrs: List[Tuple[str, Optional[str]]],
+    ):
+        if self.done:
+            return
+        raw = self.get_starttag_text()
+        attributes = dict(attrs)
+        if self.is_item(tag, attributes, self.stack):
+            if self.item_depth is not None:
+                # </li>를 생략한 경우 다음 상품이 시작되면 이전 상품이 끝난 것으로 본다
+                del self.stack[self.item_depth :]
+                self._finish_item()
+            if self.container_depth is None:
+                self.container_depth = len(self.stack)
+            self.item_depth = len(self.stack)
+            self.buffer = [raw]
+        else:
+            self._append(raw)
+        if tag not in VOID_ELEMENTS:
+            self.stack.append((tag, attributes.get("class") or ""))
+
+    def handle_startendtag(
+        self,
+        tag: str,
+        attrs: List[Tuple[str, Optional[str]]],
+    ):
+        if not self.done:
+            self._append(self.get_starttag_text())
+
+    def handle_endtag(
+        self,
+        tag: str,
+    ):
+        if self.done:
+            return
+        self._append(f"</{tag}>")
+        # 짝이 맞지 않는 닫는 태그는 무시하고, 닫히지 않은 하위 요소는 함께 닫는다
+        for depth in range(len(self.stack) - 1, -1, -1):
+            if self.stack[depth][0] == tag:
+                del self.stack[depth:]
+                break
+        else:
+            # 목록 중간부터 파싱을 시작한 경우, 상품 밖에서 여는 태그를 못 본 요소가 닫히면 목록의 끝
+            if (
+                self.item_depth is None
+                and self.container_depth is not None
+                and len(self.stack) <= self.container_depth
+            ):
+                self.done = True
+            return
+        if self.item_depth is not None and len(self.stack) <= self.item_depth:
+            self._finish_item()
+        if self.container_depth is not None and len(self.stack) < self.container_depth:
+            self.done = True
+
+    def handle_data(
+        self,
+        data: str,
+    ):
+        self._append(data)
+
+    def handle_entityref(
+        self,
+        name: str,
+    ):
+        self._append(f"&{name};")
+
+    def handle_charref(
+        self,
+        name: str,
+    ):
+        self._append(f"&#{name};")
+
+    def handle_comment(
+        self,
+        data: str,
+    ):
+        self._append(f"<!--{data}-->")
+
+    def take(self) -> List[str]:
+        """지금까지 완성된 상품 요소의 HTML을 꺼냅니다."""
+        completed, self.completed = self.completed, []
+        return completed
+
+    def close(self):
+        super().close()
+        # 문서가 상품 도중에 끝나면 모인 만큼을 상품으로 본다 (일반 파서와 동일)
+        if self.item_depth is not None and not self.done:
+            self._finish_item()
+        self.done = True
@@ -1,36 +1,31 @@
 import json
+import os
+import sys
+
+# 프로젝트 루트를 import 경로에 추가 (python utils/append_keyword.py 로 실행)
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+
+from modules.keyword_file import add_keywords  # noqa: E402
 
 # JSON 파일 경로
-json_file_path = "/app/data/data.json"
+json_file_path = os.path.join(ROOT, "data", "data.json")
 
 
 def add_keyword(new_keyword):
     try:
-        # JSON 파일 읽기
-        with open(json_file_path, "r", encoding="utf-8") as file:
-            data = json.load(file)
-
-        # "keyword" 리스트에 새 키워드 추가
-        if "keyword" in data:
-            if not isinstance(data["keyword"], list):
-                print("Error: 'keyword' is not a list.")
-                return
-            if new_keyword not in data["keyword"]:
-                data["keyword"].append(new_keyword)
+        # 잠금 후 원자적으로 저장하므로 실행 중인 프로그램과 충돌하지 않고 바로 반영됨
+        if add_keywords(json_file_path, [new_keyword]):
+            print(f"Keyword '{new_keyword}' added successfully.")
         else:
-            # "keyword" 키가 없을 경우 새로 생성
-            data["keyword"] = [new_keyword]
-
-        # JSON 파일 저장
-        with open(json_file_path, "w", encoding="utf-8") as file:
-            json.dump(data, file, ensure_ascii=False, indent=4)
-
-        print(f"Keyword '{new_keyword}' added successfully.")
+            print(f"Keyword '{new_keyword}' already exists.")
 
     except FileNotFoundError:
         print(f"Error: File {json_file_path} not found.")
     except json.JSONDecodeError:
         print("Error: Failed to decode JSON.")
+    except ValueError as e:
+        print(f"Error: {e}")
     except Exception as e:
         print(f"Unexpected error: {e}")
 
@@ -1,34 +1,31 @@
 import json
+import os
+import sys
+
+# 프로젝트 루트를 import 경로에 추가 (python utils/delete_keyword.py 로 실행)
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+
+from modules.keyword_file import remove_keywords  # noqa: E402
 
 # JSON 파일 경로
-json_file_path = "/app/data/data.json"
+json_file_path = os.path.join(ROOT, "data", "data.json")
 
 
 def delete_keyword(target_keyword):
     try:
-        # JSON 파일 읽기
-        with open(json_file_path, "r", encoding="utf-8") as file:
-            data = json.load(file)
-
-        # "keyword" 리스트에서 대상 키워드 제거
-        if "keyword" in data and isinstance(data["keyword"], list):
-            if target_keyword in data["keyword"]:
-                data["keyword"].remove(target_keyword)
-                print(f"Keyword '{target_keyword}' removed successfully.")
-            else:
-                print(f"Keyword '{target_keyword}' not found in the list.")
+        # 잠금 후 원자적으로 저장하므로 실행 중인 프로그램과 충돌하지 않고 바로 반영됨
+        if remove_keywords(json_file_path, [target_keyword]):
+            print(f"Keyword '{target_keyword}' removed successfully.")
         else:
-            print("No keywords found or 'keyword' is not a list.")
-            return
-
-        # JSON 파일 저장
-        with open(json_file_path, "w", encoding="utf-8") as file:
-            json.dump(data, file, ensure_ascii=False, indent=4)
+            print(f"Keyword '{target_keyword}' not found in the list.")
 
     except FileNotFoundError:
         print(f"Error: File {json_file_path} not found.")
     except json.JSONDecodeError:
         print("Error: Failed to decode JSON.")
+    except ValueError as e:
+        print(f"Error: {e}")
     except Exception as e:
         print(f"Unexpected error: {e}")
 
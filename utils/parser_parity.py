@@ -0,0 +1,91 @@
+import os
+import sys
+import time
+from dataclasses import asdict
+
+# 프로젝트 루트를 import 경로에 추가 (python utils/parser_parity.py 로 실행)
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+
+from modules.crawlers.algumon import AlgumonCrawler  # noqa: E402
+from modules.crawlers.fmkorea import FMKoreaCrawler  # noqa: E402
+from modules.parser_backend import HAS_LXML  # noqa: E402
+
+# 크롤러별 저장된 HTML 파일
+FIXTURES = {
+    AlgumonCrawler: os.path.join(ROOT, "fixtures", "algumon_search.html"),
+    FMKoreaCrawler: os.path.join(ROOT, "fixtures", "fmkorea_hotdeal.html"),
+}
+
+
+def comparable(items) -> list:
+    # wdate는 파싱 시각이므로 비교에서 제외
+    return [{k: v for k, v in asdict(item).items() if k != "wdate"} for item in items]
+
+
+def check_stream_parity(
+    crawler,
+    html: str,
+    expected: list,
+    chunk_size: int = 256,
+) -> bool:
+    """본문을 조각으로 나누어 스트리밍 파싱한 결과가 전체 파싱 결과와 같은지 확인합니다."""
+    ok = True
+    name = type(crawler).__name__
+    crawler.stream_chunk_size = chunk_size
+    for backend in ("bs4", "lxml"):
+        crawler.parser_backend = backend
+        streamed = comparable(crawler._iter_html(html))
+        if streamed != expected:
+            ok = False
+            print(
+                f"[{name}] 스트리밍({backend}) 결과 불일치: "
+                f"{len(streamed)}개 / 전체 파싱 {len(expected)}개"
+            )
+    if ok:
+        print(f"[{name}] 스트리밍 파싱 일치 ({chunk_size}바이트 조각)")
+    return ok
+
+
+def check_parity(repeat: int = 20) -> bool:
+    if not HAS_LXML:
+        print("lxml이 설치되어 있지 않아 비교할 수 없습니다.")
+        return False
+
+    ok = True
+    for crawler_class, path in FIXTURES.items():
+        with open(path, "r", encoding="utf-8") as f:
+            html = f.read()
+        crawler = crawler_class(keyword="parity")
+
+        timings = {}
+        results = {}
+        for backend in ("bs4", "lxml"):
+            parse = crawler.parse_bs4 if backend == "bs4" else crawler.parse_lxml
+            start = time.perf_counter()
+            for _ in range(repeat):
+                results[backend] = comparable(parse(html))
+            timings[backend] = (time.perf_counter() - start) / repeat * 1000
+
+        name = crawler_class.__name__
+        if results["bs4"] != results["lxml"]:
+            ok = False
+            print(f"[{name}] 결과 불일치")
+            for bs4_item, lxml_item in zip(results["bs4"], results["lxml"]):
+                if bs4_item != lxml_item:
+                    print(f"  bs4 : {bs4_item}\n  lxml: {lxml_item}")
+            if len(results["bs4"]) != len(results["lxml"]):
+                print(
+                    f"  상품 수: bs4={len(results['bs4'])}, lxml={len(results['lxml'])}"
+                )
+        else:
+            print(
+                f"[{name}] 일치 ({len(results['lxml'])}개) - "
+                f"bs4 {timings['bs4']:.2f}ms, lxml {timings['lxml']:.2f}ms"
+            )
+        ok = check_stream_parity(crawler, html, results["bs4"]) and ok
+    return ok
+
+
+if __name__ == "__main__":
+    sys.exit(0 if check_parity() else 1)
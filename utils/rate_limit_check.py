@@ -0,0 +1,74 @@
+import os
+import random
+import sys
+
+# 프로젝트 루트를 import 경로에 추가 (python utils/rate_limit_check.py 로 실행)
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+
+from modules.rate_limiter import HostRateLimit  # noqa: E402
+
+
+def new_limit() -> HostRateLimit:
+    return HostRateLimit(
+        host="example.com",
+        rate=2.0,
+        burst=2.0,
+        min_rate=0.1,
+        max_rate=4.0,
+        increase=0.05,
+        decrease=0.5,
+    )
+
+
+def check_random_403(
+    block_rate: float = 0.2,
+    responses: int = 500,
+    seed: int = 1,
+) -> bool:
+    """무작위 403(IP 차단)은 요청 속도를 낮추지 않아야 합니다."""
+    rng = random.Random(seed)
+    limit = new_limit()
+    lowest = limit.rate
+    for _ in range(responses):
+        limit.record(403 if rng.random() < block_rate else 200)
+        # 시간 간격 제한 없이 매번 줄일 수 있는 상황으로 가정
+        limit.last_decrease = float("-inf")
+        lowest = min(lowest, limit.rate)
+    ok = lowest >= 2.0 and limit.blocks > 0
+    print(
+        f"[403 {block_rate:.0%}] 최저 속도 {lowest:.2f}회/초, 최종 {limit.rate:.2f}회/초 "
+        f"(차단 {limit.blocks}회) - {'통과' if ok else '실패'}"
+    )
+    return ok
+
+
+def check_consecutive_403() -> bool:
+    """연속 403은 속도 대신 직접 요청을 잠시 건너뛰게 합니다."""
+    limit = new_limit()
+    for _ in range(3):
+        limit.record(403, block_threshold=3, block_cooldown=600)
+    ok = not limit.direct_allowed() and limit.rate == 2.0
+    print(f"[연속 403] 직접 요청 건너뜀 - {'통과' if ok else '실패'}")
+    return ok
+
+
+def check_throttled() -> bool:
+    """요청 과다 응답(429/430)은 속도를 줄이고, min_rate 아래로는 내려가지 않습니다."""
+    ok = True
+    for status in (429, 430):
+        limit = new_limit()
+        limit.record(status)
+        halved = limit.rate == 1.0
+        for _ in range(20):
+            limit.last_decrease = float("-inf")
+            limit.record(status)
+        passed = halved and limit.rate == limit.min_rate
+        ok = ok and passed
+        print(f"[{status}] 속도 감소 - {'통과' if passed else '실패'}")
+    return ok
+
+
+if __name__ == "__main__":
+    results = [check_random_403(), check_consecutive_403(), check_throttled()]
+    sys.exit(0 if all(results) else 1)
@@ -1,14 +1,20 @@
 import json
+import os
+import sys
+
+# 프로젝트 루트를 import 경로에 추가 (python utils/view_keyword.py 로 실행)
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+
+from modules.keyword_file import read_data_file  # noqa: E402
 
 # JSON 파일 경로
-json_file_path = "/app/data/data.json"
+json_file_path = os.path.join(ROOT, "data", "data.json")
 
 
 def view_keywords():
     try:
-        # JSON 파일 읽기
-        with open(json_file_path, "r", encoding="utf-8") as file:
-            data = json.load(file)
+        data = read_data_file(json_file_path)
 
         # "keyword" 리스트 출력
         if "keyword" in data and isinstance(data["keyword"], list):